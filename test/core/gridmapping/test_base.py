@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 import numpy as np
@@ -6,6 +7,7 @@ import xarray as xr
 
 from test.sampledata import SourceDatasetMixin
 from xcube.core.gridmapping import GridMapping
+from xcube.core.gridmapping.bboxes import compute_ij_bboxes
 from xcube.core.gridmapping.coords import Coords2DGridMapping
 # noinspection PyProtectedMember
 from xcube.core.gridmapping.helpers import _to_affine
@@ -261,6 +263,17 @@ class GridMappingTest(SourceDatasetMixin, unittest.TestCase):
         self.assertEqual(((2,), (180,), (180,)),
                          scaled_xy_coords.chunks)
 
+    def test_scale_no_op(self):
+        gm = TestGridMapping(**self.kwargs())
+        self.assertIs(gm, gm.scale(1))
+        self.assertIs(gm, gm.scale((1, 1), tile_size=(360, 180)))
+        scaled_gm = gm.scale(1, tile_size=180)
+        self.assertIsNot(gm, scaled_gm)
+        self.assertEqual((720, 360), scaled_gm.size)
+        self.assertEqual((180, 180), scaled_gm.tile_size)
+        self.assertEqual(gm.xy_bbox, scaled_gm.xy_bbox)
+        self.assertEqual(gm.xy_res, scaled_gm.xy_res)
+
     def test_transform(self):
         gm = TestGridMapping(**self.kwargs(xy_min=(20, 56),
                                            size=(400, 200),
@@ -312,6 +325,30 @@ class GridMappingTest(SourceDatasetMixin, unittest.TestCase):
         self.assertFalse(gm1.is_close(gm2, tolerance=tolerance))
         self.assertFalse(gm2.is_close(gm1, tolerance=tolerance))
 
+    def test_is_close_after_pickling(self):
+        gm1 = TestGridMapping(**self.kwargs(xy_min=(0, 0),
+                                            size=(400, 200),
+                                            xy_res=(0.01, 0.01)))
+        gm2 = pickle.loads(pickle.dumps(gm1))
+        self.assertIsNot(gm1, gm2)
+        self.assertTrue(gm1.is_close(gm2))
+        self.assertTrue(gm2.is_close(gm1))
+        self.assertFalse(gm1.is_close(gm2.derive(tile_size=100)))
+
+    def test_eq_and_hash(self):
+        gm1 = TestGridMapping(**self.kwargs(xy_min=(0, 0),
+                                            size=(400, 200),
+                                            xy_res=(0.01, 0.01)))
+        gm2 = pickle.loads(pickle.dumps(gm1))
+        gm3 = gm1.derive(tile_size=100)
+        self.assertEqual(gm1, gm2)
+        self.assertEqual(hash(gm1), hash(gm2))
+        self.assertNotEqual(gm1, gm3)
+        self.assertNotEqual(gm1, 'gm1')
+        cache = {gm1: 'a', gm3: 'b'}
+        self.assertEqual('a', cache[gm2])
+        self.assertEqual('b', cache[gm3])
+
     def test_ij_bbox_from_xy_bbox(self):
         gm = TestGridMapping(**self.kwargs())
 
@@ -336,6 +373,88 @@ class GridMappingTest(SourceDatasetMixin, unittest.TestCase):
         ij_bbox = gm.ij_bbox_from_xy_bbox((-190, -100, -180, -90), ij_border=1)
         self.assertEqual((-1, -1, -1, -1), ij_bbox)
 
+    def test_ij_bbox_from_xy_bbox_same_as_ij_bboxes_from_xy_bboxes(self):
+        xy_bboxes = np.array([
+            [-180, -90, 180, 90],
+            [-180, -90, 0, 0],
+            [0, 0, 180, 90],
+            [-10.1, 20.3, 30.7, 40.4],
+            [-190, -100, -170, -80],
+            [-190, -100, -180, -90]
+        ], dtype=np.float64)
+        for is_j_axis_up in (False, True):
+            for xy_border, ij_border in ((0.0, 0), (0.3, 0), (0.0, 2)):
+                gm = TestGridMapping(
+                    **self.kwargs(is_j_axis_up=is_j_axis_up)
+                )
+                self.assert_ij_bboxes_same(gm, xy_bboxes,
+                                           xy_border, ij_border)
+
+    def test_ij_bbox_from_xy_bbox_same_for_pixel_center_edges(self):
+        # Box edges falling exactly on pixel centers,
+        # with a resolution that is not exactly representable
+        for is_j_axis_up in (False, True):
+            kwargs = self.kwargs(size=(100, 50),
+                                 tile_size=(50, 25),
+                                 xy_min=(10.0, 50.0),
+                                 xy_res=(0.1, 0.1),
+                                 is_j_axis_up=is_j_axis_up)
+            x_coords, y_coords = \
+                TestGridMapping(**kwargs).xy_coords.values
+            x_coords, y_coords = x_coords[0, :], y_coords[:, 0]
+            xy_bboxes = [[10.05, 54.95, 10.4, 55.3]]
+            for i_min, j_min, i_max, j_max in ((0, 0, 4, 1),
+                                               (3, 7, 3, 7),
+                                               (0, 0, 99, 49),
+                                               (17, 11, 58, 42),
+                                               (90, 1, 99, 48)):
+                y_1, y_2 = y_coords[j_min], y_coords[j_max]
+                xy_bboxes.append([x_coords[i_min], min(y_1, y_2),
+                                  x_coords[i_max], max(y_1, y_2)])
+            xy_bboxes = np.array(xy_bboxes, dtype=np.float64)
+            for xy_border, ij_border in ((0.0, 0), (0.0, 2)):
+                gm = TestGridMapping(**kwargs)
+                ij_bboxes = self.assert_ij_bboxes_same(gm, xy_bboxes,
+                                                       xy_border, ij_border)
+                if ij_border == 0:
+                    # No pixel must be dropped
+                    self.assertEqual(
+                        (1, 1),
+                        tuple(ij_bboxes[2, 2:] - ij_bboxes[2, :2])
+                    )
+                    self.assertEqual(
+                        (100, 50),
+                        tuple(ij_bboxes[3, 2:] - ij_bboxes[3, :2])
+                    )
+
+    def assert_ij_bboxes_same(self,
+                              gm: GridMapping,
+                              xy_bboxes: np.ndarray,
+                              xy_border: float,
+                              ij_border: int) -> np.ndarray:
+        ij_bboxes = gm.ij_bboxes_from_xy_bboxes(xy_bboxes,
+                                                xy_border=xy_border,
+                                                ij_border=ij_border)
+        # Regular grid mappings must not need 2D x,y coordinates
+        self.assertIsNone(gm._xy_coords)
+        expected_ij_bboxes = np.empty_like(xy_bboxes, dtype=np.int64)
+        xy_coords = gm.xy_coords.values
+        compute_ij_bboxes(xy_coords[0],
+                          xy_coords[1],
+                          xy_bboxes,
+                          xy_border,
+                          ij_border,
+                          expected_ij_bboxes)
+        np.testing.assert_equal(ij_bboxes, expected_ij_bboxes)
+        for xy_bbox, ij_bbox in zip(xy_bboxes, ij_bboxes):
+            self.assertEqual(tuple(map(int, ij_bbox)),
+                             gm.ij_bbox_from_xy_bbox(
+                                 tuple(xy_bbox),
+                                 xy_border=xy_border,
+                                 ij_border=ij_border
+                             ))
+        return ij_bboxes
+
     def test_ij_bboxes_from_xy_bboxes(self):
         gm = TestGridMapping(**self.kwargs())
 
@@ -5,6 +5,7 @@ import numpy as np
 import xarray as xr
 
 from xcube.core.gridmapping.bboxes import compute_ij_bboxes
+from xcube.core.gridmapping.bboxes import compute_ij_bboxes_blockwise
 from xcube.core.gridmapping.bboxes import compute_xy_bbox
 
 
@@ -24,6 +25,15 @@ class ComputeIJBBoxesTest(unittest.TestCase):
         np.testing.assert_almost_equal(ij_bboxes,
                                        np.array([[0, 0, 11, 11]], dtype=np.int64))
 
+    def test_no_init_required(self):
+        xy_bboxes = np.array([[10., 50., 20., 60.],
+                              [21., 61., 25., 65.]])
+        ij_bboxes = np.zeros_like(xy_bboxes, dtype=np.int64)
+        compute_ij_bboxes(self.lon_values, self.lat_values, xy_bboxes, 0.0, 0, ij_bboxes)
+        np.testing.assert_almost_equal(ij_bboxes,
+                                       np.array([[0, 0, 11, 11],
+                                                 [-1, -1, -1, -1]], dtype=np.int64))
+
     def test_tiles(self):
         a0 = 0.
         a1 = a0 + 5.
@@ -80,6 +90,51 @@ class ComputeIJBBoxesTest(unittest.TestCase):
                                        np.array([[0, 0, 7, 6]], dtype=np.int64))
 
 
+class ComputeIJBBoxesBlockwiseTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        lon = xr.DataArray(np.linspace(10., 20., 11), dims='x')
+        lat = xr.DataArray(np.linspace(50., 60., 11), dims='y')
+        lat, lon = xr.broadcast(lat, lon)
+        self.lon_values = lon.values
+        self.lat_values = lat.values
+        self.xy_coords = da.stack([self.lon_values, self.lat_values]) \
+            .rechunk((2, 4, 3))
+
+    def assert_same_as_compute_ij_bboxes(self,
+                                         xy_bboxes: np.ndarray,
+                                         xy_border: float,
+                                         ij_border: int):
+        expected_ij_bboxes = np.full_like(xy_bboxes, -1, dtype=np.int64)
+        compute_ij_bboxes(self.lon_values, self.lat_values, xy_bboxes,
+                          xy_border, ij_border, expected_ij_bboxes)
+        ij_bboxes = np.full_like(xy_bboxes, -1, dtype=np.int64)
+        compute_ij_bboxes_blockwise(self.xy_coords, xy_bboxes,
+                                    xy_border, ij_border, ij_bboxes)
+        np.testing.assert_equal(ij_bboxes, expected_ij_bboxes)
+
+    def test_tiles(self):
+        xy_bboxes = np.array([[10., 50., 15., 55.],
+                              [15., 50., 20., 55.],
+                              [10., 55., 15., 60.],
+                              [15., 55., 20., 60.],
+                              [21., 61., 25., 65.]])
+        self.assert_same_as_compute_ij_bboxes(xy_bboxes, 0.0, 0)
+        self.assert_same_as_compute_ij_bboxes(xy_bboxes, 0.5, 0)
+        self.assert_same_as_compute_ij_bboxes(xy_bboxes, 0.0, 2)
+
+    def test_with_border(self):
+        xy_bboxes = np.array([[12.4, 51.6, 12.6, 51.7]])
+        self.assert_same_as_compute_ij_bboxes(xy_bboxes, 0.0, 0)
+        self.assert_same_as_compute_ij_bboxes(xy_bboxes, 1.0, 0)
+        self.assert_same_as_compute_ij_bboxes(xy_bboxes, 2.0, 2)
+
+    def test_split_coord_dim(self):
+        self.xy_coords = self.xy_coords.rechunk((1, 4, 3))
+        xy_bboxes = np.array([[10., 50., 20., 60.]])
+        self.assert_same_as_compute_ij_bboxes(xy_bboxes, 0.0, 0)
+
+
 class ComputeXYBBoxTest(unittest.TestCase):
     data = [
         [
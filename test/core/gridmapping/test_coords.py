@@ -127,6 +127,7 @@ class Coords1DGridMappingTest(unittest.TestCase):
         self.assertIs(xy_coords, gm.xy_coords)
         self.assertEqual(('coord', 'lat', 'lon'), xy_coords.dims)
         self.assertEqual((2, 10, 8), xy_coords.shape)
+        self.assertEqual(((2,), (10,), (8,)), xy_coords.chunks)
         self.assertEqual(('lon', 'lat'), gm.xy_var_names)
         self.assertEqual(('lon', 'lat'), gm.xy_dim_names)
 
@@ -195,6 +196,41 @@ class Coords2DGridMappingTest(unittest.TestCase):
         self.assertEqual((4, 3), gm.size)
         self.assertEqual((3, 2), gm.tile_size)
 
+    def test_2d_signature_uses_dask_names(self):
+        def new_gm(dy: float = 0.0):
+            x_coords = da.array([[10.0, 10.1, 10.2, 10.3],
+                                 [10.1, 10.2, 10.3, 10.4],
+                                 [10.2, 10.3, 10.4, 10.5]]).rechunk((2, 3))
+            y_coords = da.array([[52.0, 52.2, 52.4, 52.6],
+                                 [52.2, 52.4, 52.6, 52.8],
+                                 [52.4, 52.6, 52.8, 53.0]]).rechunk((2, 3))
+            return GridMapping.from_coords(
+                x_coords=xr.DataArray(x_coords, dims=('lat', 'lon')),
+                y_coords=xr.DataArray(y_coords + dy, dims=('lat', 'lon')),
+                crs=GEO_CRS
+            )
+
+        gm1 = new_gm()
+        gm2 = new_gm()
+        gm3 = new_gm(dy=0.01)
+
+        # is_close() must not compute signatures
+        self.assertTrue(gm1.is_close(gm2))
+        self.assertIsNone(gm1._signature)
+        self.assertIsNone(gm2._signature)
+
+        self.assertEqual(gm1, gm2)
+        self.assertEqual(hash(gm1), hash(gm2))
+        self.assertNotEqual(gm1, gm3)
+        # noinspection PyUnresolvedReferences
+        self.assertEqual((gm1.x_coords.data.name, gm1.y_coords.data.name),
+                         gm1._coords_token)
+
+        # Derived grid mappings reuse the coordinates' token
+        gm4 = gm1.derive(xy_var_names=('x', 'y'))
+        self.assertIs(gm1._coords_token, gm4._coords_token)
+        self.assertNotEqual(gm1, gm4)
+
     def test_2d_regular(self):
         gm = GridMapping.from_coords(
             x_coords=xr.DataArray([
@@ -262,6 +298,14 @@ class Coords2DGridMappingTest(unittest.TestCase):
         self.assertEqual(gm_reg_expected.xy_bbox, gm_reg_actual.xy_bbox)
         self.assertEqual(gm_reg_expected.crs, gm_reg_actual.crs)
 
+        gm_irr_2 = GridMapping.from_coords(lon.copy(), lat.copy(), GEO_CRS)
+        self.assertIs(gm_reg_actual, gm_irr_2.to_regular())
+        self.assertIsNot(gm_reg_actual, gm_irr_2.to_regular(tile_size=2))
+
+        # Equal CRSs given by other instances share the result too
+        gm_irr_3 = GridMapping.from_coords(lon, lat, pyproj.crs.CRS(4326))
+        self.assertIs(gm_reg_actual, gm_irr_3.to_regular())
+
     def test_2d_xy_coords(self):
         gm = GridMapping.from_coords(
             x_coords=xr.DataArray([
@@ -280,5 +324,10 @@ class Coords2DGridMappingTest(unittest.TestCase):
         self.assertIs(xy_coords, gm.xy_coords)
         self.assertEqual(('coord', 'lat', 'lon'), xy_coords.dims)
         self.assertEqual((2, 3, 4), xy_coords.shape)
+        self.assertEqual(((2,), (3,), (4,)), xy_coords.chunks)
+        np.testing.assert_almost_equal(xy_coords.values[0],
+                                       gm.x_coords.values)
+        np.testing.assert_almost_equal(xy_coords.values[1],
+                                       gm.y_coords.values)
         self.assertEqual(('lon', 'lat'), gm.xy_var_names)
         self.assertEqual(('lon', 'lat'), gm.xy_dim_names)
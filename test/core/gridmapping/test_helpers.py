@@ -1,6 +1,8 @@
 import unittest
 from fractions import Fraction
 
+from xcube.core.gridmapping.helpers import _normalize_int_pair
+from xcube.core.gridmapping.helpers import _normalize_number_pair
 from xcube.core.gridmapping.helpers import _to_int_or_float
 from xcube.core.gridmapping.helpers import round_to_fraction
 
@@ -168,3 +170,24 @@ class ToIntOrFloatTest(unittest.TestCase):
     def test_leave_as_smaller_float_small_value(self):
         result = _to_int_or_float(0.9999)
         self.assertEqual(0.9999, result)
+
+
+class NormalizePairTest(unittest.TestCase):
+
+    def test_normalize_int_pair(self):
+        self.assertEqual((2, 3), _normalize_int_pair((2, 3)))
+        self.assertEqual((2, 3), _normalize_int_pair([2, 3]))
+        self.assertEqual((2, 3), _normalize_int_pair((2.0, 3.0)))
+        self.assertEqual((4, 4), _normalize_int_pair(4))
+        self.assertEqual((5, 6), _normalize_int_pair(None, default=(5, 6)))
+        with self.assertRaises(ValueError):
+            _normalize_int_pair(None, name='size')
+
+    def test_normalize_number_pair(self):
+        self.assertEqual((2, 3), _normalize_number_pair((2, 3)))
+        self.assertEqual((2, 3), _normalize_number_pair((2.0, 2.99999)))
+        self.assertEqual((0.5, 3), _normalize_number_pair([0.5, 3]))
+        self.assertEqual((0.5, 0.5), _normalize_number_pair(0.5))
+        self.assertEqual(None, _normalize_number_pair(None, default=None))
+        with self.assertRaises(ValueError):
+            _normalize_number_pair(None, name='xy_res')
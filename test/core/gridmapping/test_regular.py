@@ -6,6 +6,7 @@ import xarray as xr
 
 from xcube.core.gridmapping import CRS_WGS84
 from xcube.core.gridmapping import GridMapping
+from xcube.core.gridmapping.bboxes import compute_ij_bboxes
 from xcube.core.gridmapping.regular import RegularGridMapping
 
 # noinspection PyProtectedMember
@@ -51,12 +52,18 @@ class RegularGridMappingTest(unittest.TestCase):
         self.assertEqual((1000, 1000), gm.size)
         self.assertEqual((1000, 1000), gm.tile_size)
         self.assertEqual(False, gm.is_j_axis_up)
+        # force creating of xy_coords array
+        self.assertAlmostEqual(62.995, float(gm.xy_coords[1, 0, 0]))
         derived_gm = gm.derive(tile_size=500, is_j_axis_up=True)
         self.assertIsNot(gm, derived_gm)
         self.assertIsInstance(derived_gm, RegularGridMapping)
         self.assertEqual((1000, 1000), derived_gm.size)
         self.assertEqual((500, 500), derived_gm.tile_size)
         self.assertEqual(True, derived_gm.is_j_axis_up)
+        xy_coords = derived_gm.xy_coords
+        self.assertEqual(((2,), (500, 500), (500, 500)), xy_coords.chunks)
+        self.assertEqual(1, len(xy_coords.data.dask.layers))
+        self.assertAlmostEqual(53.005, float(xy_coords[1, 0, 0]))
 
     def test_xy_coords(self):
         gm = GridMapping.regular((8, 4), (10, 53), 0.1, CRS_WGS84).derive(tile_size=(4, 2))
@@ -118,6 +125,44 @@ class RegularGridMappingTest(unittest.TestCase):
                                            [1500, 500, 2000, 1000]
                                        ], dtype=np.int64))
 
+    def test_ij_bboxes_from_xy_bboxes_pixel_center_edges(self):
+        for xy_min, xy_res, crs in (((10.0, 50.0), 0.1, GEO_CRS),
+                                    ((2.0e7, -1.0e6), 10.0, NOT_A_GEO_CRS)):
+            for is_j_axis_up in (False, True):
+                def new_gm():
+                    return GridMapping.regular(size=(100, 50),
+                                               xy_min=xy_min,
+                                               xy_res=xy_res,
+                                               crs=crs,
+                                               is_j_axis_up=is_j_axis_up)
+
+                x_coords, y_coords = new_gm().xy_coords.values
+                x_coords, y_coords = x_coords[0, :], y_coords[:, 0]
+                # Box edges falling exactly on pixel centers
+                xy_bboxes = np.array([
+                    [x_coords[i_min],
+                     min(y_coords[j_min], y_coords[j_max]),
+                     x_coords[i_max],
+                     max(y_coords[j_min], y_coords[j_max])]
+                    for i_min in range(0, 100, 9)
+                    for i_max in range(i_min, 100, 13)
+                    for j_min in range(0, 50, 7)
+                    for j_max in range(j_min, 50, 11)
+                ], dtype=np.float64)
+
+                gm = new_gm()
+                ij_bboxes = gm.ij_bboxes_from_xy_bboxes(xy_bboxes)
+                self.assertIsNone(gm._xy_coords)
+
+                expected_ij_bboxes = np.empty_like(xy_bboxes,
+                                                   dtype=np.int64)
+                xy_coords = new_gm().xy_coords.values
+                compute_ij_bboxes(xy_coords[0], xy_coords[1],
+                                  xy_bboxes, 0.0, 0,
+                                  expected_ij_bboxes)
+                np.testing.assert_equal(ij_bboxes, expected_ij_bboxes)
+                self.assertTrue(np.all(ij_bboxes >= 0))
+
     def test_xy_bboxes(self):
         gm = GridMapping.regular(size=(2000, 1000),
                                  xy_min=(10.0, 20.0),
@@ -1,10 +1,16 @@
 import unittest
 
+import dask.array as da
 import numpy as np
 import xarray as xr
+from scipy import ndimage
 
 from xcube.core.gridmapping import GridMapping
 from xcube.core.resampling import affine_transform_dataset
+# noinspection PyProtectedMember
+from xcube.core.resampling.affine import _affine_transform_block
+from xcube.core.resampling.affine import _has_nan
+from xcube.core.resampling.affine import resample_ndimage
 
 nan = np.nan
 
@@ -179,3 +185,122 @@ class AffineTransformDatasetTest(unittest.TestCase):
                 [nan, nan, 4.0, 0.0, 1.0, 0.0, 2.0, 0.0],
                 [nan, nan, nan, nan, nan, nan, nan, nan]
             ]))
+
+    def test_identity(self):
+        target_gm = GridMapping.regular((8, 6), (50.0, 10.0), res, source_gm.crs)
+        target_ds = affine_transform_dataset(source_ds, source_gm, target_gm)
+        self.assertIsInstance(target_ds, xr.Dataset)
+        self.assertEqual(set(target_ds.variables), set(source_ds.variables))
+        # No resampling, so data is not wrapped into dask arrays
+        self.assertIs(source_ds.refl.data, target_ds.refl.data)
+
+
+class ResampleNdimageTest(unittest.TestCase):
+    def test_chunked_same_as_unchunked(self):
+        image = np.array(source_ds.refl.values)
+        image[1, 2] = nan
+        image[4, 5] = nan
+        for scale, offset, shape in (((0.5, 0.5), (0.0, 0.0), (12, 16)),
+                                     ((1.0, 1.0), (0.5, -1.5), (6, 8)),
+                                     ((2.0, 2.0), (0.0, 0.0), (3, 4))):
+            for spline_order in (0, 1):
+                expected = resample_ndimage(image,
+                                            scale=scale,
+                                            offset=offset,
+                                            shape=shape,
+                                            spline_order=spline_order,
+                                            recover_nan=True).compute()
+                actual = resample_ndimage(da.from_array(image, chunks=(2, 3)),
+                                          scale=scale,
+                                          offset=offset,
+                                          shape=shape,
+                                          chunks=(2, 3),
+                                          spline_order=spline_order,
+                                          recover_nan=True)
+                self.assertEqual(image.dtype, actual.dtype)
+                self.assertEqual(shape, actual.shape)
+                np.testing.assert_almost_equal(actual.compute(), expected)
+
+    def test_nan_recovered(self):
+        image = np.array([[1.0, 2.0, nan, 4.0]] * 2)
+        actual = resample_ndimage(image,
+                                  scale=(1.0, 0.5),
+                                  shape=(2, 8),
+                                  recover_nan=True).compute()
+        np.testing.assert_almost_equal(
+            actual,
+            np.array([[1.0, 1.5, 2.0, 2.0, nan, 4.0, 4.0, nan]] * 2)
+        )
+
+    def test_untransformed_axes_read_exact_blocks(self):
+        computed_blocks = []
+
+        def record_block(block, block_info=None):
+            computed_blocks.append(block_info[0]['chunk-location'][0])
+            return block
+
+        image = da.asarray(np.stack(3 * [source_ds.refl.values]),
+                           chunks=(1, 2, 3))
+        image = image.map_blocks(record_block, dtype=image.dtype)
+        actual = resample_ndimage(image,
+                                  scale=(0.5, 0.5),
+                                  shape=(12, 16),
+                                  chunks=(4, 4))
+        computed_blocks.clear()
+        actual[1].compute()
+        self.assertEqual({1}, set(computed_blocks))
+
+    def test_precision(self):
+        image = np.array(source_ds.refl.values, dtype=np.float64)
+        expected = resample_ndimage(image,
+                                    scale=(0.5, 0.5),
+                                    shape=(12, 16),
+                                    spline_order=1).compute()
+        actual = resample_ndimage(image,
+                                  scale=(0.5, 0.5),
+                                  shape=(12, 16),
+                                  spline_order=1,
+                                  precision=np.float32)
+        self.assertEqual(np.float64, actual.dtype)
+        np.testing.assert_almost_equal(actual.compute(), expected, decimal=5)
+
+
+class AffineTransformBlockTest(unittest.TestCase):
+    def test_same_as_scipy(self):
+        image = np.array(source_ds.refl.values)
+        image[1, 2] = nan
+        for dtype in (np.float64, np.float32, np.int16):
+            block = image.astype(dtype) if dtype != np.int16 \
+                else np.nan_to_num(image).astype(dtype)
+            for scale, offset, shape in (((0.5, 0.5), (0.0, 0.0), (12, 16)),
+                                         ((1.0, 1.0), (0.5, -1.5), (6, 8)),
+                                         ((-1.0, 1.0), (5.0, 0.0), (6, 8)),
+                                         ((0.3, 2.0), (0.0, 0.0), (3, 4))):
+                for spline_order in (0, 1):
+                    expected = ndimage.affine_transform(
+                        block,
+                        np.array(scale),
+                        offset=offset,
+                        output_shape=shape,
+                        order=spline_order,
+                        mode='constant',
+                        cval=nan
+                    )
+                    actual = _affine_transform_block(block,
+                                                     scale,
+                                                     offset,
+                                                     shape,
+                                                     spline_order,
+                                                     cval=nan)
+                    self.assertEqual(expected.dtype, actual.dtype)
+                    np.testing.assert_almost_equal(actual, expected,
+                                                   decimal=5)
+
+    def test_has_nan(self):
+        for dtype in (np.float16, np.float32, np.float64):
+            image = np.zeros((2, 3, 4), dtype=dtype)
+            self.assertFalse(_has_nan(image))
+            self.assertFalse(_has_nan(image[:, 1:, ::2]))
+            image[1, 2, 3] = nan
+            self.assertTrue(_has_nan(image))
+            self.assertTrue(_has_nan(image[1]))
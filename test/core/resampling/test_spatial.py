@@ -25,3 +25,38 @@ class ResampleInSpaceTest(unittest.TestCase):
 
         # TODO: assert stuff
         resample_in_space(source_ds, source_gm, target_gm)
+
+    def test_reproject_dataset(self):
+        source_ds = new_cube(width=40, height=40,
+                             x_start=10, y_start=50,
+                             x_res=0.01, y_res=0.01,
+                             variables=dict(a=1.5))
+        source_gm = GridMapping.from_dataset(source_ds)
+        x_min, y_min, _, _ = source_gm.transform('EPSG:32632').xy_bbox
+        target_gm = GridMapping.regular(size=(4, 4),
+                                        xy_min=(x_min + 200, y_min + 200),
+                                        xy_res=500,
+                                        crs='EPSG:32632')
+        target_ds = resample_in_space(source_ds, source_gm, target_gm)
+        self.assertIn('a', target_ds)
+        self.assertNotIn('transformed_x', target_ds)
+        self.assertNotIn('transformed_y', target_ds)
+        self.assertEqual((5, 4, 4), target_ds.a.shape)
+        self.assertEqual(1.5, np.nanmean(target_ds.a.values))
+
+    def test_reproject_dataset_regular(self):
+        # The source grid mapping transformed into EPSG:4087 is regular,
+        # so the dataset is resampled by an affine transformation.
+        source_ds = new_cube(width=36, height=18,
+                             x_res=10, y_res=10,
+                             variables=dict(a=1.5))
+        source_gm = GridMapping.from_dataset(source_ds)
+        target_gm = GridMapping.regular(size=(40, 20),
+                                        xy_min=(-20037508.34, -10018754.17),
+                                        xy_res=1000000,
+                                        crs='EPSG:4087')
+        target_ds = resample_in_space(source_ds, source_gm, target_gm)
+        self.assertIn('a', target_ds)
+        self.assertIn('crs', target_ds)
+        self.assertEqual((5, 20, 40), target_ds.a.shape)
+        self.assertEqual(1.5, np.nanmean(target_ds.a.values))
@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+
+import fsspec
+
+from xcube.core.store.fs.impl.fs import FileFsAccessor
+from xcube.core.store.fs.impl.fs import MemoryFsAccessor
+from xcube.core.store.fs.impl.fs import S3FsAccessor
+from xcube.util.jsonschema import JsonObjectSchema
+
+
+class FsAccessorsTest(unittest.TestCase):
+
+    def test_storage_options_schema(self):
+        for accessor_class in (FileFsAccessor,
+                               MemoryFsAccessor,
+                               S3FsAccessor):
+            schema = accessor_class.get_storage_options_schema()
+            self.assertIsInstance(schema, JsonObjectSchema)
+            self.assertIn('use_listings_cache', schema.properties)
+            self.assertEqual(True, schema.additional_properties)
+            # Schemas are static, hence always the same instance
+            self.assertIs(schema,
+                          accessor_class.get_storage_options_schema())
+
+        self.assertIn('auto_mkdirs',
+                      FileFsAccessor.get_storage_options_schema()
+                      .properties)
+        self.assertIn('client_kwargs',
+                      S3FsAccessor.get_storage_options_schema()
+                      .properties)
+
+    def test_protocol(self):
+        self.assertEqual('file', FileFsAccessor.get_protocol())
+        self.assertEqual('memory', MemoryFsAccessor.get_protocol())
+        self.assertEqual('s3', S3FsAccessor.get_protocol())
+        self.assertEqual('s3', S3FsAccessor.PROTOCOL)
+
+    def test_no_instance_dict(self):
+        for accessor_class in (FileFsAccessor,
+                               MemoryFsAccessor,
+                               S3FsAccessor):
+            self.assertFalse(hasattr(accessor_class(), '__dict__'))
+
+    def test_complete_storage_options(self):
+        self.assertEqual({'auto_mkdirs': True},
+                         FileFsAccessor.complete_storage_options(
+                             {'auto_mkdirs': True}
+                         ))
+        self.assertEqual({'anon': True,
+                          'config_kwargs': {'max_pool_connections': 50}},
+                         S3FsAccessor.complete_storage_options(
+                             {'anon': True}
+                         ))
+        self.assertEqual({'config_kwargs': {'max_pool_connections': 8}},
+                         S3FsAccessor.complete_storage_options(
+                             {'config_kwargs': {'max_pool_connections': 8}}
+                         ))
+
+    def test_load_fs_shares_instances(self):
+        fs_1, _, _ = MemoryFsAccessor.load_fs({})
+        fs_2, _, _ = MemoryFsAccessor.load_fs({})
+        self.assertIs(fs_1, fs_2)
+
+    def test_scan(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.mkdir(os.path.join(temp_dir, 'cube.zarr'))
+            with open(os.path.join(temp_dir, 'cube.nc'), 'wb') as fp:
+                fp.write(b'0123')
+
+            fs = fsspec.filesystem('file')
+            entries = sorted(FileFsAccessor.scan(fs, temp_dir))
+            self.assertEqual(['cube.nc', 'cube.zarr'],
+                             [e[0] for e in entries])
+            self.assertEqual([False, True], [e[1] for e in entries])
+            self.assertEqual(4, entries[0][2])
+            self.assertIsInstance(entries[0][3], float)
+
+            entries = sorted(FileFsAccessor.scan(fs, temp_dir, stat=False))
+            self.assertEqual([('cube.nc', False, None, None),
+                              ('cube.zarr', True, None, None)],
+                             entries)
+
+        fs = fsspec.filesystem('memory')
+        fs.mkdir('/scan_test/cube.zarr')
+        fs.pipe('/scan_test/cube.nc', b'0123')
+        try:
+            entries = sorted(MemoryFsAccessor.scan(fs, '/scan_test'))
+            self.assertEqual([('cube.nc', False, 4, None),
+                              ('cube.zarr', True, 0, None)],
+                             entries)
+        finally:
+            fs.rm('/scan_test', recursive=True)
+
+    def test_info_and_exists_batch(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.mkdir(os.path.join(temp_dir, 'cube.zarr'))
+            with open(os.path.join(temp_dir, 'cube.nc'), 'wb') as fp:
+                fp.write(b'0123')
+
+            fs = fsspec.filesystem('file')
+            paths = [f'{temp_dir}/cube.zarr',
+                     f'{temp_dir}/cube.nc',
+                     f'{temp_dir}/cube.tif',
+                     f'{temp_dir}/missing/cube.nc']
+            infos = FileFsAccessor.info_batch(fs, paths)
+            self.assertEqual(paths, list(infos.keys()))
+            self.assertEqual('directory', infos[paths[0]]['type'])
+            self.assertEqual('file', infos[paths[1]]['type'])
+            self.assertEqual(4, infos[paths[1]]['size'])
+            self.assertEqual(fs._strip_protocol(paths[1]),
+                             infos[paths[1]]['name'])
+            self.assertIsNone(infos[paths[2]])
+            self.assertIsNone(infos[paths[3]])
+
+            self.assertEqual({paths[0]: True,
+                              paths[1]: True,
+                              paths[2]: False,
+                              paths[3]: False},
+                             FileFsAccessor.exists_batch(fs, paths))
+
+        fs = fsspec.filesystem('memory')
+        fs.pipe('/batch_test/cube.nc', b'0123')
+        try:
+            infos = MemoryFsAccessor.info_batch(fs, ['/batch_test/cube.nc',
+                                                     '/batch_test/cube.tif'])
+            self.assertEqual('file', infos['/batch_test/cube.nc']['type'])
+            self.assertIsNone(infos['/batch_test/cube.tif'])
+            self.assertEqual({'/batch_test/cube.nc': True,
+                              '/batch_test/cube.tif': False},
+                             MemoryFsAccessor.exists_batch(
+                                 fs, ['/batch_test/cube.nc',
+                                      '/batch_test/cube.tif']
+                             ))
+        finally:
+            fs.rm('/batch_test', recursive=True)
@@ -22,6 +22,9 @@ from xcube.core.store import DataStoreError
 from xcube.core.store import DatasetDescriptor
 from xcube.core.store import MultiLevelDatasetDescriptor
 from xcube.core.store import MutableDataStore
+from xcube.core.store.fs.registry import get_fs_accessor_class
+from xcube.core.store.fs.registry import get_fs_data_accessor_class
+from xcube.core.store.fs.registry import get_fs_data_store_class
 from xcube.core.store.fs.registry import new_fs_data_store
 from xcube.core.store.fs.store import FsDataStore
 from xcube.core.zarrstore import GenericZarrStore
@@ -103,6 +106,35 @@ class NewCubeDataTestMixin(unittest.TestCase):
 
 
 # noinspection PyUnresolvedReferences,PyPep8Naming
+class FsRegistryTest(unittest.TestCase):
+
+    def test_classes_are_created_once(self):
+        for protocol in ('file', 'memory', 'https'):
+            self.assertIs(get_fs_accessor_class(protocol),
+                          get_fs_accessor_class(protocol))
+            self.assertIs(get_fs_data_store_class(protocol),
+                          get_fs_data_store_class(protocol))
+            self.assertIs(
+                get_fs_data_accessor_class(protocol, 'dataset', 'zarr'),
+                get_fs_data_accessor_class(protocol, 'dataset', 'zarr')
+            )
+        self.assertIsNot(get_fs_data_store_class('file'),
+                         get_fs_data_store_class('memory'))
+        self.assertIsNot(get_fs_data_accessor_class('file',
+                                                    'dataset', 'zarr'),
+                         get_fs_data_accessor_class('file',
+                                                    'dataset', 'netcdf'))
+        self.assertEqual('https',
+                         get_fs_data_store_class('https').get_protocol())
+
+    def test_data_types(self):
+        data_store_class = get_fs_data_store_class('memory')
+        self.assertEqual(('dataset', 'mldataset', 'geodataframe'),
+                         data_store_class.get_data_types())
+        self.assertIs(data_store_class.get_data_types(),
+                      data_store_class.get_data_types())
+
+
 class FsDataStoresTestMixin(ABC):
     @abstractmethod
     def create_data_store(self) -> FsDataStore:
@@ -0,0 +1,114 @@
+import os
+import time
+import unittest
+
+import xarray as xr
+
+from xcube.core.new import new_cube
+from xcube.core.store.fs.registry import get_fs_data_accessor_class
+from xcube.core.store.fs.registry import get_fs_data_store_class
+from xcube.util.temp import new_temp_dir
+
+
+class FsDataStoreDescriptorCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.root = new_temp_dir(prefix='xcube')
+        self.path = os.path.join(self.root, 'cube.nc')
+        self.touch()
+
+        test_case = self
+        test_case.open_count = 0
+
+        class CountingDataStore(get_fs_data_store_class('file')):
+            def open_data(self, data_id: str, opener_id: str = None,
+                          **open_params) -> xr.Dataset:
+                test_case.open_count += 1
+                return new_cube(variables=dict(a=test_case.open_count))
+
+        self.data_store = CountingDataStore(root=self.root)
+
+    def touch(self, mtime: float = None):
+        with open(self.path, 'wb'):
+            pass
+        if mtime is not None:
+            os.utime(self.path, (mtime, mtime))
+
+    def test_describe_data_is_cached(self):
+        descriptor_1 = self.data_store.describe_data('cube.nc')
+        descriptor_2 = self.data_store.describe_data('cube.nc')
+        self.assertEqual(1, self.open_count)
+        self.assertEqual(descriptor_1.to_dict(), descriptor_2.to_dict())
+
+        # Clients may modify the returned descriptors
+        self.assertIsNot(descriptor_1, descriptor_2)
+        descriptor_2.attrs['title'] = 'Modified'
+        descriptor_3 = self.data_store.describe_data('cube.nc')
+        self.assertEqual(1, self.open_count)
+        self.assertEqual(descriptor_1.to_dict(), descriptor_3.to_dict())
+        self.assertNotEqual('Modified', descriptor_3.attrs.get('title'))
+
+    def test_describe_data_first_result_is_not_cached(self):
+        descriptor_1 = self.data_store.describe_data('cube.nc')
+        expected = descriptor_1.to_dict()
+        self.assertIn('a', descriptor_1.data_vars)
+
+        # Clients may modify the descriptor that has been cached
+        descriptor_1.data_vars.clear()
+        descriptor_2 = self.data_store.describe_data('cube.nc')
+        self.assertEqual(1, self.open_count)
+        self.assertEqual(expected, descriptor_2.to_dict())
+
+    def test_describe_data_cache_is_invalidated(self):
+        self.data_store.describe_data('cube.nc')
+        self.assertEqual(1, self.open_count)
+
+        # Modified data
+        self.touch(mtime=time.time() + 10)
+        self.data_store.describe_data('cube.nc')
+        self.assertEqual(2, self.open_count)
+
+        # Forgotten, as after write_data() or delete_data()
+        self.data_store._forget_cached_data('cube.nc')
+        self.data_store.describe_data('cube.nc')
+        self.assertEqual(3, self.open_count)
+
+    def test_directories_without_zmetadata_are_not_cached(self):
+        os.mkdir(os.path.join(self.root, 'cube.zarr'))
+        self.data_store.describe_data('cube.zarr')
+        self.data_store.describe_data('cube.zarr')
+        self.assertEqual(2, self.open_count)
+
+        with open(os.path.join(self.root, 'cube.zarr', '.zmetadata'), 'w'):
+            pass
+        self.data_store.describe_data('cube.zarr')
+        self.data_store.describe_data('cube.zarr')
+        self.assertEqual(3, self.open_count)
+
+
+class FsDataStoreOpenParamsSchemaCacheTest(unittest.TestCase):
+
+    def test_open_params_schema_is_cached(self):
+        data_store = get_fs_data_store_class('memory')(root='schemas')
+        opener = get_fs_data_accessor_class('memory', 'dataset', 'zarr')()
+
+        schema_1 = data_store._get_cached_open_data_params_schema(
+            opener, 'cube.zarr'
+        )
+        schema_2 = data_store._get_cached_open_data_params_schema(
+            opener, 'cube.zarr'
+        )
+        self.assertIs(schema_1, schema_2)
+        self.assertNotIn('storage_options', schema_1.properties)
+
+        # Clients may modify the returned schemas
+        self.assertIsNot(schema_1,
+                         data_store._get_open_data_params_schema(
+                             opener, 'cube.zarr'
+                         ))
+
+        data_store._forget_cached_data('cube.zarr')
+        self.assertIsNot(schema_1,
+                         data_store._get_cached_open_data_params_schema(
+                             opener, 'cube.zarr'
+                         ))
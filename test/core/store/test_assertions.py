@@ -0,0 +1,33 @@
+import unittest
+
+from xcube.core.store import DataStoreError
+from xcube.core.store import assert_valid_params
+from xcube.core.store.assertions import _is_unconstrained
+from xcube.util.jsonschema import JsonIntegerSchema
+from xcube.util.jsonschema import JsonObjectSchema
+
+
+class AssertValidParamsTest(unittest.TestCase):
+
+    def test_unconstrained_schema(self):
+        schema = JsonObjectSchema()
+        self.assertTrue(_is_unconstrained(schema))
+        self.assertTrue(_is_unconstrained(
+            JsonObjectSchema(additional_properties=True)
+        ))
+        assert_valid_params({'a': 1, 'b': [2, 3]}, schema=schema)
+
+    def test_constrained_schema(self):
+        for schema in (
+                JsonObjectSchema(properties=dict(a=JsonIntegerSchema())),
+                JsonObjectSchema(additional_properties=False),
+                JsonObjectSchema(required=['a']),
+                JsonObjectSchema(max_properties=1),
+        ):
+            self.assertFalse(_is_unconstrained(schema))
+
+        schema = JsonObjectSchema(properties=dict(a=JsonIntegerSchema()),
+                                  additional_properties=False)
+        assert_valid_params({'a': 1}, schema=schema)
+        with self.assertRaises(DataStoreError):
+            assert_valid_params({'a': 1, 'b': 2}, schema=schema)
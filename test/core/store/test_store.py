@@ -0,0 +1,189 @@
+import unittest
+from abc import ABC
+
+from xcube.constants import EXTENSION_POINT_DATA_STORES
+from xcube.core.new import new_cube
+from xcube.core.store import DataStore
+from xcube.core.store import DataStoreError
+from xcube.core.store import MutableDataStore
+from xcube.core.store import get_data_store_class
+from xcube.core.store import get_data_store_params_schema
+from xcube.core.store import new_data_store
+from xcube.core.store.fs.registry import get_fs_data_store_class
+from xcube.core.store.fs.registry import new_fs_data_store
+from xcube.util.extension import ExtensionRegistry
+from xcube.util.temp import new_temp_dir
+
+
+class NewDataStoreTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.extension_registry = ExtensionRegistry()
+        self.extension_registry.add_extension(
+            EXTENSION_POINT_DATA_STORES,
+            'memory',
+            component=get_fs_data_store_class('memory')
+        )
+
+    def test_new_data_store(self):
+        for _ in range(2):
+            data_store = new_data_store(
+                'memory',
+                extension_registry=self.extension_registry,
+                root='test',
+                max_depth=2
+            )
+            self.assertEqual('memory', data_store.protocol)
+            self.assertEqual(2, data_store.max_depth)
+
+        with self.assertRaises(DataStoreError):
+            new_data_store('memory',
+                           extension_registry=self.extension_registry,
+                           max_depth='2')
+
+        with self.assertRaises(DataStoreError):
+            new_data_store('pippo',
+                           extension_registry=self.extension_registry)
+
+    def test_get_data_store_class_loads_lazily(self):
+        loaded = []
+
+        def load_store_class(_extension):
+            loaded.append(True)
+            return get_fs_data_store_class('file')
+
+        self.extension_registry.add_extension(EXTENSION_POINT_DATA_STORES,
+                                              'file',
+                                              loader=load_store_class)
+        self.assertEqual([], loaded)
+        self.assertIs(get_fs_data_store_class('file'),
+                      get_data_store_class(
+                          'file', extension_registry=self.extension_registry
+                      ))
+        self.assertIs(get_fs_data_store_class('file'),
+                      get_data_store_class(
+                          'file', extension_registry=self.extension_registry
+                      ))
+        self.assertEqual([True], loaded)
+
+    def test_get_data_store_params_schema(self):
+        schema_1 = get_data_store_params_schema(
+            'memory', extension_registry=self.extension_registry
+        )
+        schema_2 = get_data_store_params_schema(
+            'memory', extension_registry=self.extension_registry
+        )
+        self.assertIn('root', schema_1.properties)
+        self.assertIn('storage_options', schema_1.properties)
+        # Clients may modify the returned schemas
+        self.assertIsNot(schema_1, schema_2)
+
+
+class DataStoreTest(unittest.TestCase):
+
+    def test_get_data_ids_page(self):
+        data_store = new_fs_data_store('memory', root='data_ids_page')
+        fs = data_store.fs
+        for i in range(5):
+            fs.pipe(f'/data_ids_page/cube-{i}.nc', b'')
+        try:
+            data_ids = sorted(data_store.get_data_ids())
+            self.assertEqual(5, len(data_ids))
+
+            page_1 = data_store.get_data_ids_page(0, 2)
+            page_2 = data_store.get_data_ids_page(2, 2)
+            page_3 = data_store.get_data_ids_page(4, 2)
+            self.assertEqual([2, 2, 1],
+                             [len(page_1), len(page_2), len(page_3)])
+            self.assertEqual(data_ids, sorted(page_1 + page_2 + page_3))
+            self.assertEqual([], data_store.get_data_ids_page(5, 2))
+
+            page = data_store.get_data_ids_page(0, 2,
+                                                include_attrs=['title'])
+            self.assertEqual(2, len(page))
+            self.assertIsInstance(page[0], tuple)
+
+            with self.assertRaises(ValueError):
+                data_store.get_data_ids_page(-1, 2)
+        finally:
+            fs.rm('/data_ids_page', recursive=True)
+
+    def test_get_data_attrs(self):
+        data_store = new_fs_data_store('memory', root='data_attrs')
+        fs = data_store.fs
+        for i in range(3):
+            fs.pipe(f'/data_attrs/cube-{i}.nc', b'')
+        try:
+            data_ids = ['cube-2.nc', 'cube-0.nc', 'cube-7.nc', 'cube-1.txt']
+            expected_attrs = {'cube-2.nc': {}, 'cube-0.nc': {}}
+            # Filesystem stores check existence in a batch
+            data_attrs = data_store.get_data_attrs(data_ids, ['title'])
+            self.assertEqual(expected_attrs, data_attrs)
+            self.assertEqual(['cube-2.nc', 'cube-0.nc'],
+                             list(data_attrs.keys()))
+            # Default implementation iterates the data identifiers
+            data_attrs = DataStore.get_data_attrs(data_store,
+                                                  data_ids, ['title'])
+            self.assertEqual(expected_attrs, data_attrs)
+            self.assertEqual(['cube-2.nc', 'cube-0.nc'],
+                             list(data_attrs.keys()))
+
+            self.assertEqual({},
+                             data_store.get_data_attrs(
+                                 data_ids, data_type='geodataframe'
+                             ))
+            self.assertEqual({}, data_store.get_data_attrs([]))
+        finally:
+            fs.rm('/data_attrs', recursive=True)
+
+    def test_get_data_ids_columnar(self):
+        data_store = new_fs_data_store('memory', root='data_ids_columnar')
+        fs = data_store.fs
+        for i in range(3):
+            fs.pipe(f'/data_ids_columnar/cube-{i}.nc', b'')
+        try:
+            data_ids, columns = data_store.get_data_ids_columnar()
+            self.assertEqual(['cube-0.nc', 'cube-1.nc', 'cube-2.nc'],
+                             sorted(data_ids))
+            self.assertEqual({}, columns)
+
+            data_ids, columns = data_store.get_data_ids_columnar(
+                include_attrs=['title']
+            )
+            self.assertEqual(3, len(data_ids))
+            # Filesystem data stores do not provide titles
+            self.assertEqual({'title': [None, None, None]}, columns)
+        finally:
+            fs.rm('/data_ids_columnar', recursive=True)
+
+    def test_open_data_many(self):
+        data_store = new_fs_data_store('file', root=new_temp_dir())
+        for i in range(3):
+            data_store.write_data(new_cube(variables=dict(a=i)),
+                                  data_id=f'cube-{i}.nc')
+        data_ids = ['cube-2.nc', 'cube-0.nc']
+
+        # Filesystem stores create a single data opener
+        datasets = data_store.open_data_many(data_ids)
+        self.assertNotIsInstance(datasets, (list, tuple))
+        datasets = list(datasets)
+        self.assertEqual(2, len(datasets))
+        self.assertEqual([2, 0], [int(ds.a[0, 0, 0]) for ds in datasets])
+
+        # Default implementation calls open_data()
+        datasets = list(DataStore.open_data_many(
+            data_store, data_ids, opener_id='dataset:netcdf:file'
+        ))
+        self.assertEqual([2, 0], [int(ds.a[0, 0, 0]) for ds in datasets])
+
+        with self.assertRaises(DataStoreError):
+            list(data_store.open_data_many(['cube-0.nc', 'cube-0.txt']))
+
+    def test_slots(self):
+        class SlottedDataStore(MutableDataStore, ABC):
+            __slots__ = ()
+
+        # Only subclasses with instance state require a __dict__
+        self.assertEqual(0, SlottedDataStore.__dictoffset__)
+        self.assertNotEqual(0, get_fs_data_store_class('memory')
+                            .__dictoffset__)
@@ -26,6 +26,7 @@ import xarray as xr
 
 from xcube.core.new import new_cube
 from xcube.core.subsampling import find_agg_method
+from xcube.core.subsampling import get_variable_subsampling_slices
 from xcube.core.subsampling import subsample_dataset
 
 
@@ -166,6 +167,20 @@ class SubsampleDatasetTest(unittest.TestCase):
             np.array([2., 4., 6.]),
         )
 
+    def test_subsample_dataset_numpy_vs_dask(self):
+        # Even sizes and NumPy arrays use a faster implementation
+        dataset = self.dataset.isel(y=slice(0, 4)).compute()
+        dataset.var_2[0, 0, 0] = np.nan
+        for agg_method in ('min', 'max', 'mean', 'median'):
+            xr.testing.assert_allclose(
+                subsample_dataset(dataset.chunk(),
+                                  step=2,
+                                  agg_methods=agg_method),
+                subsample_dataset(dataset,
+                                  step=2,
+                                  agg_methods=agg_method)
+            )
+
     def assert_subsampling_ok(self,
                               subsampled_dataset: xr.Dataset,
                               expected_var_1: np.ndarray,
@@ -236,3 +251,17 @@ class SubsampleDatasetTest(unittest.TestCase):
                   {'var_*': None}, {'var_*': 'auto'}):
             self.assertEqual('first', find_agg_method(m, 'var_1', np.uint8))
             self.assertEqual('mean', find_agg_method(m, 'var_2', np.float32))
+
+    def test_get_variable_subsampling_slices(self):
+        slices = get_variable_subsampling_slices(self.dataset.var_1, 2)
+        self.assertEqual((slice(None), slice(None, None, 2),
+                          slice(None, None, 2)),
+                         slices)
+        # Variables with the same dimensions share their slices
+        self.assertIs(slices,
+                      get_variable_subsampling_slices(self.dataset.var_2, 2))
+        self.assertEqual((slice(None, None, 4),),
+                         get_variable_subsampling_slices(self.dataset.x, 4))
+        self.assertIsNone(
+            get_variable_subsampling_slices(self.dataset.time, 2)
+        )
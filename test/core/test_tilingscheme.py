@@ -20,8 +20,12 @@
 # DEALINGS IN THE SOFTWARE.
 
 
+import subprocess
+import sys
 import unittest
 
+import numpy as np
+
 from xcube.core.tilingscheme import EARTH_CIRCUMFERENCE_WGS84
 from xcube.core.tilingscheme import TilingScheme
 from xcube.core.tilingscheme import get_num_levels
@@ -96,6 +100,24 @@ class TilingSchemeTest(unittest.TestCase):
         self.assertEqual((-half, -half, half, half), tiling_scheme.map_extent)
         self.assertEqual((-half, half), tiling_scheme.map_origin)
 
+    def test_properties_are_cached(self):
+        tiling_scheme = TilingScheme.for_crs('EPSG:3857', tile_size=512)
+        self.assertIs(tiling_scheme.crs, tiling_scheme.crs)
+        self.assertIs(tiling_scheme.map_extent, tiling_scheme.map_extent)
+        self.assertIs(tiling_scheme.map_origin, tiling_scheme.map_origin)
+        self.assertEqual('metre', tiling_scheme.map_unit_name)
+        self.assertIn('map_unit_name', vars(tiling_scheme))
+        # Derived tiling schemes share their CRS
+        self.assertIs(TilingScheme.WEB_MERCATOR.crs, tiling_scheme.crs)
+
+    def test_pyproj_imported_lazily(self):
+        output = subprocess.check_output(
+            [sys.executable, '-c',
+             'import sys; import xcube.core.tilingscheme;'
+             ' print("pyproj" in sys.modules)']
+        )
+        self.assertEqual(b'False', output.strip())
+
     def test_tile_extent_web_mercator(self):
         tiling_scheme = TilingScheme.WEB_MERCATOR
 
@@ -188,6 +210,27 @@ class TilingSchemeTest(unittest.TestCase):
         self.assertEqual((90, -90, 180, 0),
                          tiling_scheme.get_tile_extent(3, 1, 1))
 
+    def test_tile_extents(self):
+        for tiling_scheme in (TilingScheme.GEOGRAPHIC,
+                              TilingScheme.WEB_MERCATOR):
+            tiles = np.array([(tile_x, tile_y, tile_z)
+                              for tile_z in range(-1, 4)
+                              for tile_x in range(-1, 18)
+                              for tile_y in range(-1, 10)])
+            extents = tiling_scheme.get_tile_extents(tiles)
+            self.assertEqual((len(tiles), 4), extents.shape)
+            for (tile_x, tile_y, tile_z), extent in zip(tiles, extents):
+                expected_extent = tiling_scheme.get_tile_extent(
+                    int(tile_x), int(tile_y), int(tile_z)
+                )
+                if expected_extent is None:
+                    self.assertTrue(np.all(np.isnan(extent)))
+                else:
+                    self.assertEqual(expected_extent, tuple(extent))
+
+        with self.assertRaises(ValueError):
+            TilingScheme.GEOGRAPHIC.get_tile_extents(np.array([0, 0, 0]))
+
     def test_get_resolutions_level_web_mercator(self):
         tiling_scheme = TilingScheme.WEB_MERCATOR
 
@@ -5,7 +5,8 @@ import pandas as pd
 import xarray as xr
 
 from test.sampledata import create_highroc_dataset
-from xcube.core.update import update_dataset_var_attrs, update_dataset_attrs
+from xcube.core.update import update_dataset_var_attrs, update_dataset_attrs, update_dataset_chunk_encoding
+from xcube.core.update import update_dataset_spatial_attrs
 
 
 class UpdateVariablePropsTest(unittest.TestCase):
@@ -16,6 +17,8 @@ class UpdateVariablePropsTest(unittest.TestCase):
         self.assertIs(ds2, ds1)
         ds2 = update_dataset_var_attrs(ds1, [])
         self.assertIs(ds2, ds1)
+        ds2 = update_dataset_var_attrs(ds1, [(var_name, {}) for var_name in ds1.data_vars])
+        self.assertIs(ds2, ds1)
 
     def test_change_all_or_none(self):
         ds1 = create_highroc_dataset()
@@ -129,3 +132,65 @@ class UpdateGlobalAttributesTest(unittest.TestCase):
         self.assertEqual('2018-06-01T00:00:00.000000000', ds2.attrs.get('time_coverage_start'))
         self.assertEqual('2018-06-05T23:00:59.000000000', ds2.attrs.get('time_coverage_end'))
         self.assertIn('date_modified', ds2.attrs)
+
+    def test_update_global_attributes_copy(self):
+        ds1 = xr.Dataset(data_vars=dict(chl=(['lat', 'lon'], np.zeros((2, 3)))),
+                         coords=dict(lat=(['lat'], [12.125, 12.375]),
+                                     lon=(['lon'], [-19.875, -19.625, -19.375])),
+                         attrs=dict(title='Test'))
+
+        ds2 = update_dataset_attrs(ds1, global_attrs=dict(license='MIT'))
+        self.assertIsNot(ds2, ds1)
+        self.assertEqual(dict(title='Test'), ds1.attrs)
+        self.assertEqual('MIT', ds2.attrs.get('license'))
+        self.assertEqual(-20.0, ds2.attrs.get('geospatial_lon_min'))
+        # Variables are copied by default
+        self.assertIsNot(ds1.variables['chl'], ds2.variables['chl'])
+
+        ds2 = update_dataset_attrs(ds1, global_attrs=dict(license='MIT'), copy=False)
+        self.assertIsNot(ds2, ds1)
+        self.assertEqual(dict(title='Test'), ds1.attrs)
+        self.assertEqual('MIT', ds2.attrs.get('license'))
+        self.assertEqual(-20.0, ds2.attrs.get('geospatial_lon_min'))
+        # Only global attributes are copied
+        self.assertIs(ds1.variables['chl'], ds2.variables['chl'])
+
+        ds2 = update_dataset_spatial_attrs(ds1, copy=False)
+        self.assertEqual(dict(title='Test'), ds1.attrs)
+        self.assertEqual(-20.0, ds2.attrs.get('geospatial_lon_min'))
+        self.assertIs(ds1.variables['chl'], ds2.variables['chl'])
+
+        ds2 = update_dataset_attrs(ds1, global_attrs=dict(license='MIT'), in_place=True)
+        self.assertIs(ds2, ds1)
+        self.assertEqual('MIT', ds1.attrs.get('license'))
+
+
+class UpdateChunkEncodingTest(unittest.TestCase):
+
+    def test_update_chunk_encoding(self):
+        ds1 = xr.Dataset(data_vars=dict(chl=(['lat', 'lon'], np.zeros((4, 6)))),
+                         coords=dict(lat=(['lat'], np.arange(4.)),
+                                     lon=(['lon'], np.arange(6.))))
+        ds1 = ds1.chunk(dict(lat=2, lon=3))
+        ds1.chl.encoding['chunks'] = (4, 6)
+
+        ds2 = update_dataset_chunk_encoding(ds1, chunk_sizes=dict(lon=6), format_name='zarr')
+        self.assertIsNot(ds2, ds1)
+        self.assertEqual((2, 6), ds2.chl.encoding.get('chunks'))
+        self.assertEqual((4,), ds2.lat.encoding.get('chunks'))
+        self.assertEqual((6,), ds2.lon.encoding.get('chunks'))
+        self.assertEqual((4, 6), ds1.chl.encoding.get('chunks'))
+        self.assertNotIn('chunks', ds1.lat.encoding)
+        self.assertIs(ds1.chl.data, ds2.chl.data)
+        self.assertEqual(list(ds1.coords), list(ds2.coords))
+
+        ds3 = update_dataset_chunk_encoding(ds2, chunk_sizes=None, format_name='zarr')
+        self.assertNotIn('chunks', ds3.chl.encoding)
+        self.assertEqual((2, 6), ds2.chl.encoding.get('chunks'))
+
+        ds4 = update_dataset_chunk_encoding(ds1, chunk_sizes=dict(lat=1), format_name='netcdf4')
+        self.assertEqual((1, 3), ds4.chl.encoding.get('chunksizes'))
+
+        ds5 = update_dataset_chunk_encoding(ds1, chunk_sizes=dict(lat=1), format_name='zarr', in_place=True)
+        self.assertIs(ds5, ds1)
+        self.assertEqual((1, 3), ds1.chl.encoding.get('chunks'))
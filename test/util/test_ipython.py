@@ -1,3 +1,5 @@
+import subprocess
+import sys
 import unittest
 
 from xcube.util.ipython import register_json_formatter
@@ -22,3 +24,13 @@ class IPythonTest(unittest.TestCase):
             register_json_formatter(_FormatterTest2)
         self.assertTrue(f'{cm.exception}'.endswith("FormatterTest2'> must define a to_dict() method"),
                         msg=f'{cm.exception}')
+
+    def test_ipython_not_imported(self):
+        # Registering formatters must not import IPython,
+        # because importing it is expensive.
+        output = subprocess.check_output(
+            [sys.executable, '-c',
+             'import sys; import xcube.util.extension;'
+             ' print("IPython" in sys.modules)']
+        )
+        self.assertEqual(b'False', output.strip())
@@ -2,6 +2,8 @@ import unittest
 from collections import namedtuple
 from typing import Dict, Any
 
+import jsonschema
+
 from xcube.util.jsonschema import JsonArraySchema
 from xcube.util.jsonschema import JsonBooleanSchema
 from xcube.util.jsonschema import JsonComplexSchema
@@ -14,6 +16,8 @@ from xcube.util.jsonschema import JsonObject
 from xcube.util.jsonschema import JsonObjectSchema
 from xcube.util.jsonschema import JsonSimpleSchema
 from xcube.util.jsonschema import JsonStringSchema
+from xcube.util.jsonschema import _get_schema_key
+from xcube.util.jsonschema import _get_validator
 
 
 class JsonComplexSchemaTest(unittest.TestCase):
@@ -365,6 +369,30 @@ class JsonArraySchemaTest(unittest.TestCase):
 
 class JsonObjectSchemaTest(unittest.TestCase):
 
+    def test_validate_instance_uses_cached_validator(self):
+        schema = JsonObjectSchema(properties=dict(name=JsonStringSchema(),
+                                                  age=JsonIntegerSchema()),
+                                  required=['name'])
+        equal_schema = JsonObjectSchema(properties=dict(name=JsonStringSchema(),
+                                                        age=JsonIntegerSchema()),
+                                        required=['name'])
+        self.assertIs(_get_validator(schema.to_dict()),
+                      _get_validator(equal_schema.to_dict()))
+
+        schema.validate_instance({'name': 'Bibo', 'age': 12})
+        with self.assertRaises(jsonschema.ValidationError):
+            schema.validate_instance({'age': 12})
+        with self.assertRaises(jsonschema.ValidationError):
+            schema.validate_instance({'name': 'Bibo', 'age': 'twelve'})
+
+    def test_schema_key(self):
+        self.assertEqual(_get_schema_key({'type': 'object', 'title': 'A'}),
+                         _get_schema_key({'title': 'A', 'type': 'object'}))
+        self.assertNotEqual(_get_schema_key({'type': 'object'}),
+                            _get_schema_key({'type': 'array'}))
+        self.assertIsNone(_get_schema_key({'type': 'object',
+                                           'default': object()}))
+
     def test_from_json_object(self):
         value = {'name': 'Bibo', 'age': 12, 'deleted': True}
 
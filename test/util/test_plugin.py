@@ -2,6 +2,7 @@ import unittest
 
 from xcube.util.extension import ExtensionRegistry
 from xcube.util.plugin import get_plugins, load_plugins, discover_plugin_modules
+from xcube.util.plugin import _get_entry_points
 
 
 def init_plugin(ext_registry: ExtensionRegistry):
@@ -35,6 +36,13 @@ class PluginTest(unittest.TestCase):
     def setUp(self):
         self.ext_registry = ExtensionRegistry()
 
+    def test_get_entry_points(self):
+        # pytest itself registers console scripts
+        entry_points = _get_entry_points('console_scripts')
+        self.assertIsInstance(entry_points, list)
+        self.assertIn('pytest', [ep.name for ep in entry_points])
+        self.assertEqual([], _get_entry_points('xcube_no_such_group'))
+
     def test_get_xcube_default_plugins(self):
         plugins = get_plugins()
         self.assertIsNotNone(plugins)
@@ -26,9 +26,7 @@ from abc import ABCMeta, abstractmethod
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, \
     Union, Mapping
 
-import botocore.exceptions
 import pandas as pd
-import s3fs
 import urllib3.util
 import xarray as xr
 import zarr
@@ -596,6 +594,7 @@ def get_path_or_s3_store(path_or_url: str,
     if is_s3_url(path_or_url) \
             or s3_kwargs is not None \
             or s3_client_kwargs is not None:
+        import s3fs
         s3, root = parse_s3_fs_and_root(path_or_url,
                                         s3_kwargs=s3_kwargs,
                                         s3_client_kwargs=s3_client_kwargs,
@@ -612,7 +611,7 @@ def parse_s3_fs_and_root(s3_url: str,
                          s3_kwargs: Mapping[str, Any] = None,
                          s3_client_kwargs: Mapping[str, Any] = None,
                          mode: str = 'r') \
-        -> Tuple[s3fs.S3FileSystem, str]:
+        -> Tuple['s3fs.S3FileSystem', str]:
     """
     Parses *s3_url*, *s3_kwargs*, *s3_client_kwargs* and returns a
     new tuple (*obs_fs*, *root_path*). For example
@@ -646,7 +645,7 @@ def new_s3_file_system(s3_kwargs: Mapping[str, Any] = None,
                        s3_client_kwargs: Mapping[str, Any] = None,
                        s3_config_param_name: str = 's3_kwargs',
                        check_path: str = None) \
-        -> s3fs.S3FileSystem:
+        -> 's3fs.S3FileSystem':
     """
     Wrapper for s3fs.S3FileSystem() constructor that issues warnings
     in case the file system can not be created.
@@ -660,6 +659,11 @@ def new_s3_file_system(s3_kwargs: Mapping[str, Any] = None,
     :return: A s3fs.S3FileSystem instance.
     """
 
+    # Importing s3fs and botocore is expensive,
+    # so we do it only if we need them.
+    import botocore.exceptions
+    import s3fs
+
     s3_kwargs = s3_kwargs or {}
     if 'use_listings_cache' not in s3_kwargs:
         # The default is not to cache any directory listings
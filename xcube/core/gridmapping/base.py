@@ -20,11 +20,11 @@
 # SOFTWARE.
 
 import abc
-import copy
 import math
 import threading
-from typing import Any, Tuple, Optional, Union, Mapping
+from typing import Any, Dict, Tuple, Optional, Union, Mapping
 
+import dask.array as da
 import numpy as np
 import pyproj
 import xarray as xr
@@ -34,6 +34,8 @@ from xcube.util.assertions import assert_instance
 from xcube.util.assertions import assert_true
 from xcube.util.dask import get_block_iterators
 from xcube.util.dask import get_chunk_sizes
+from .bboxes import compute_ij_bboxes
+from .bboxes import compute_ij_bboxes_blockwise
 from .helpers import AffineTransformMatrix
 from .helpers import Number
 from .helpers import _assert_valid_xy_coords
@@ -42,6 +44,7 @@ from .helpers import _from_affine
 from .helpers import _normalize_int_pair
 from .helpers import _normalize_number_pair
 from .helpers import _to_affine
+from .helpers import _to_int_or_float
 from .helpers import scale_xy_res_and_size
 
 # WGS84, axis order: lat, lon
@@ -54,6 +57,21 @@ CRS_CRS84 = pyproj.crs.CRS.from_string("CRS84")
 # accept a key-word argument "tolerance":
 DEFAULT_TOLERANCE = 1.0e-5
 
+# Tolerance in pixel units used to include pixels whose centers
+# lie exactly on the edges of a bounding box, despite rounding errors
+_IJ_BBOX_EPS = 1.0e-9
+
+# Lazily imported, because module .regular imports this module
+_RegularGridMapping = None
+
+
+def _get_regular_grid_mapping_class():
+    global _RegularGridMapping
+    if _RegularGridMapping is None:
+        from .regular import RegularGridMapping
+        _RegularGridMapping = RegularGridMapping
+    return _RegularGridMapping
+
 
 class GridMapping(abc.ABC):
     """
@@ -77,8 +95,35 @@ class GridMapping(abc.ABC):
 
     This class is thread-safe.
 
+    Subclasses should define their own ``__slots__``
+    (at least an empty tuple), otherwise their instances
+    will have a ``__dict__`` again.
     """
 
+    __slots__ = (
+        '_lock',
+        '_size',
+        '_tile_size',
+        '_xy_coords_chunks',
+        '_xy_coords',
+        '_xy_bbox',
+        '_x_min',
+        '_y_min',
+        '_x_max',
+        '_y_max',
+        '_xy_res',
+        '_x_res',
+        '_y_res',
+        '_crs',
+        '_spatial_unit_name',
+        '_xy_var_names',
+        '_xy_dim_names',
+        '_is_regular',
+        '_is_lon_360',
+        '_is_j_axis_up',
+        '_signature',
+    )
+
     def __init__(self,
                  /,
                  size: Union[int, Tuple[int, int]],
@@ -116,15 +161,21 @@ class GridMapping(abc.ABC):
 
         self._size = width, height
         self._tile_size = tile_width, tile_height
+        self._xy_coords_chunks = 2, tile_height, tile_width
         self._xy_coords = None
         self._xy_bbox = x_min, y_min, x_max, y_max
+        self._x_min, self._y_min = x_min, y_min
+        self._x_max, self._y_max = x_max, y_max
         self._xy_res = x_res, y_res
+        self._x_res, self._y_res = x_res, y_res
         self._crs = crs
+        self._spatial_unit_name = None
         self._xy_var_names = xy_var_names
         self._xy_dim_names = xy_dim_names
         self._is_regular = is_regular
         self._is_lon_360 = is_lon_360
         self._is_j_axis_up = is_j_axis_up
+        self._signature = None
 
     def derive(self,
                /,
@@ -141,7 +192,7 @@ class GridMapping(abc.ABC):
         :param is_j_axis_up: Whether j-axis points up.
         :return: A new, derived grid mapping.
         """
-        other = copy.copy(self)
+        other = self._copy()
         if xy_var_names is not None:
             _assert_valid_xy_names(xy_var_names, name='xy_var_names')
             other._xy_var_names = xy_var_names
@@ -155,15 +206,100 @@ class GridMapping(abc.ABC):
             tile_size = tile_width, tile_height
             if other.tile_size != tile_size:
                 other._tile_size = tile_width, tile_height
+                other._xy_coords_chunks = 2, tile_height, tile_width
                 with self._lock:
-                    if other._xy_coords is not None:
+                    if other._xy_coords is not None \
+                            and not other._is_regular:
                         other._xy_coords = other._xy_coords.chunk(
                             other.xy_coords_chunks
                         )
         if is_j_axis_up is not None:
             other._is_j_axis_up = is_j_axis_up
+        if other._is_regular:
+            # Regular x,y coordinates depend on the properties
+            # changed here and are cheaply recomputed block-wise,
+            # which is better than re-chunking the old ones.
+            other._xy_coords = None
+        return other
+
+    def _copy(self) -> 'GridMapping':
+        """
+        Create a shallow copy of this grid mapping.
+        Unlike ``copy.copy()``, the copy gets its own lock,
+        so it doesn't share contention with this instance.
+        """
+        other = self.__class__.__new__(self.__class__)
+        with self._lock:
+            state = self._get_fields()
+        del state['_lock']
+        other.__setstate__(state)
+        # Copies are usually modified, so force recomputation
+        other._signature = None
         return other
 
+    def __getstate__(self) -> Mapping[str, Any]:
+        state = self._get_fields()
+        # Locks cannot be pickled
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Mapping[str, Any]):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._lock = threading.RLock()
+
+    def _get_fields(self) -> Dict[str, Any]:
+        """
+        Get the instance fields stored in the slots of this class
+        and its base classes, and in the instance's dictionary,
+        if any.
+        """
+        fields = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if hasattr(self, name):
+                    fields[name] = getattr(self, name)
+        fields.update(getattr(self, '__dict__', {}))
+        return fields
+
+    def _get_signature(self) -> Tuple:
+        """
+        Get a tuple of the immutable fields that identify this
+        grid mapping. Unlike the identity, the signature
+        is preserved when grid mappings are pickled.
+        It is used for testing equality and for hashing.
+
+        Subclasses whose x,y coordinates are not fully
+        determined by the fields of this class must override
+        :meth:_get_signature_extra.
+        """
+        if self._signature is None:
+            with self._lock:
+                if self._signature is None:
+                    self._signature = (
+                        self._size,
+                        self._tile_size,
+                        self._xy_bbox,
+                        self._xy_res,
+                        # Computing the WKT is expensive, hence cached
+                        self._crs.to_wkt(),
+                        self._xy_var_names,
+                        self._xy_dim_names,
+                        self._is_regular,
+                        self._is_lon_360,
+                        self._is_j_axis_up,
+                        self._get_signature_extra(),
+                    )
+        return self._signature
+
+    def _get_signature_extra(self) -> Any:
+        """
+        Get a hashable value that identifies the x,y coordinates
+        of this grid mapping, if they are not fully determined
+        by its other fields. Defaults to None.
+        """
+        return None
+
     def scale(self,
               xy_scale: Union[Number, Tuple[Number, Number]],
               tile_size: Union[int, Tuple[int, int]] = None) -> 'GridMapping':
@@ -179,30 +315,41 @@ class GridMapping(abc.ABC):
         :param xy_scale: The x-, and y-scaling factors.
             May be a single number or tuple.
         :param tile_size: The new tile size
-        :return: A new, scaled grid mapping.
+        :return: A new, scaled grid mapping,
+            or this grid mapping if nothing changes.
         """
         self._assert_regular()
         x_scale, y_scale = _normalize_number_pair(xy_scale)
-        new_xy_res, new_size = scale_xy_res_and_size(self.xy_res,
-                                                     self.size,
-                                                     (x_scale, y_scale))
         if tile_size is not None:
             tile_width, tile_height = _normalize_int_pair(tile_size,
                                                           name='tile_size')
         else:
-            tile_width, tile_height = self.tile_size
-        tile_width = min(new_size[0], tile_width)
-        tile_height = min(new_size[1], tile_height)
-        return self.regular(
-            new_size,
-            (self.x_min, self.y_min),
-            new_xy_res,
-            self.crs,
+            tile_width, tile_height = self._tile_size
+        if x_scale == 1 and y_scale == 1 \
+                and (tile_width, tile_height) == self._tile_size:
+            return self
+        (x_res, y_res), (width, height) = \
+            scale_xy_res_and_size(self._xy_res,
+                                  self._size,
+                                  (x_scale, y_scale))
+        tile_width = min(width, tile_width)
+        tile_height = min(height, tile_height)
+        # Construct directly rather than via regular() + derive(),
+        # so we avoid re-validation and keep our CRS instance.
+        x_min, y_min, _, _ = self._xy_bbox
+        x_max = _to_int_or_float(x_min + x_res * width)
+        y_max = _to_int_or_float(y_min + y_res * height)
+        return _get_regular_grid_mapping_class()(
+            crs=self._crs,
+            size=(width, height),
             tile_size=(tile_width, tile_height),
-            is_j_axis_up=self.is_j_axis_up
-        ).derive(
-            xy_dim_names=self.xy_dim_names,
-            xy_var_names=self.xy_var_names
+            xy_bbox=(x_min, y_min, x_max, y_max),
+            xy_res=(x_res, y_res),
+            xy_var_names=self._xy_var_names,
+            xy_dim_names=self._xy_dim_names,
+            is_regular=True,
+            is_lon_360=x_max > 180,
+            is_j_axis_up=self._is_j_axis_up
         )
 
     @property
@@ -258,7 +405,7 @@ class GridMapping(abc.ABC):
     @property
     def xy_coords_chunks(self) -> Tuple[int, int, int]:
         """Get the chunks for the *xy_coords* array."""
-        return 2, self.tile_height, self.tile_width
+        return self._xy_coords_chunks
 
     @abc.abstractmethod
     def _new_xy_coords(self) -> xr.DataArray:
@@ -288,22 +435,22 @@ class GridMapping(abc.ABC):
     @property
     def x_min(self) -> Number:
         """Minimum x-coordinate in CRS units."""
-        return self._xy_bbox[0]
+        return self._x_min
 
     @property
     def y_min(self) -> Number:
         """Minimum y-coordinate in CRS units."""
-        return self._xy_bbox[1]
+        return self._y_min
 
     @property
     def x_max(self) -> Number:
         """Maximum x-coordinate in CRS units."""
-        return self._xy_bbox[2]
+        return self._x_max
 
     @property
     def y_max(self) -> Number:
         """Maximum y-coordinate in CRS units."""
-        return self._xy_bbox[3]
+        return self._y_max
 
     @property
     def xy_res(self) -> Tuple[Number, Number]:
@@ -313,12 +460,12 @@ class GridMapping(abc.ABC):
     @property
     def x_res(self) -> Number:
         """Pixel size in CRS units per pixel in x-direction."""
-        return self._xy_res[0]
+        return self._x_res
 
     @property
     def y_res(self) -> Number:
         """Pixel size in CRS units per pixel in y-direction."""
-        return self._xy_res[1]
+        return self._y_res
 
     @property
     def crs(self) -> pyproj.crs.CRS:
@@ -327,7 +474,11 @@ class GridMapping(abc.ABC):
 
     @property
     def spatial_unit_name(self) -> str:
-        return self._crs.axis_info[0].unit_name
+        """The name of the spatial unit of the CRS' first axis."""
+        if self._spatial_unit_name is None:
+            # Cached, because pyproj computes axis_info on each access
+            self._spatial_unit_name = self._crs.axis_info[0].unit_name
+        return self._spatial_unit_name
 
     @property
     def is_lon_360(self) -> Optional[bool]:
@@ -367,15 +518,15 @@ class GridMapping(abc.ABC):
         Defined only for grid mappings with rectified x,y coordinates.
         """
         self._assert_regular()
-        if self.is_j_axis_up:
+        if self._is_j_axis_up:
             return (
-                (self.x_res, 0.0, self.x_min),
-                (0.0, self.y_res, self.y_min),
+                (self._x_res, 0.0, self._x_min),
+                (0.0, self._y_res, self._y_min),
             )
         else:
             return (
-                (self.x_res, 0.0, self.x_min),
-                (0.0, -self.y_res, self.y_max),
+                (self._x_res, 0.0, self._x_min),
+                (0.0, -self._y_res, self._y_max),
             )
 
     @property
@@ -445,17 +596,15 @@ class GridMapping(abc.ABC):
     @property
     def xy_bboxes(self) -> np.ndarray:
         """The image tiles' bounding boxes in CRS coordinates."""
-        if self.is_j_axis_up:
-            xy_offset = np.array([self.x_min, self.y_min,
-                                  self.x_min, self.y_min])
-            xy_scale = np.array([self.x_res, self.y_res,
-                                 self.x_res, self.y_res])
+        x_min, y_min, _, y_max = self._xy_bbox
+        x_res, y_res = self._xy_res
+        if self._is_j_axis_up:
+            xy_offset = np.array([x_min, y_min, x_min, y_min])
+            xy_scale = np.array([x_res, y_res, x_res, y_res])
             xy_bboxes = xy_offset + xy_scale * self.ij_bboxes
         else:
-            xy_offset = np.array([self.x_min, self.y_max,
-                                  self.x_min, self.y_max])
-            xy_scale = np.array([self.x_res, -self.y_res,
-                                 self.x_res, -self.y_res])
+            xy_offset = np.array([x_min, y_max, x_min, y_max])
+            xy_scale = np.array([x_res, -y_res, x_res, -y_res])
             xy_bboxes = xy_offset + xy_scale * self.ij_bboxes
             xy_bboxes[:, [1, 3]] = xy_bboxes[:, [3, 1]]
         return xy_bboxes
@@ -479,15 +628,64 @@ class GridMapping(abc.ABC):
             in pixel coordinates. Returns ``(-1, -1, -1, -1)``
             if *xy_bbox* isn't intersecting any of the x,y coordinates.
         """
+        if self._is_regular:
+            return self._regular_ij_bbox_from_xy_bbox(xy_bbox,
+                                                      xy_border=xy_border,
+                                                      ij_border=ij_border)
         xy_bboxes = np.array([xy_bbox], dtype=np.float64)
-        ij_bboxes = np.full_like(xy_bboxes, -1, dtype=np.int64)
-        self.ij_bboxes_from_xy_bboxes(xy_bboxes,
-                                      xy_border=xy_border,
-                                      ij_border=ij_border,
-                                      ij_bboxes=ij_bboxes)
+        ij_bboxes = self.ij_bboxes_from_xy_bboxes(xy_bboxes,
+                                                  xy_border=xy_border,
+                                                  ij_border=ij_border)
         # noinspection PyTypeChecker
         return tuple(map(int, ij_bboxes[0]))
 
+    def _regular_ij_bbox_from_xy_bbox(self,
+                                      xy_bbox: Tuple[float, float,
+                                                     float, float],
+                                      xy_border: float,
+                                      ij_border: int) \
+            -> Tuple[int, int, int, int]:
+        """
+        Same as :meth:ij_bbox_from_xy_bbox, but computes the
+        bounding box for regular grids directly from the
+        pixel center coordinates of the affine grid.
+        """
+        x_min, y_min, x_max, y_max = xy_bbox
+        x_min, y_min = x_min - xy_border, y_min - xy_border
+        x_max, y_max = x_max + xy_border, y_max + xy_border
+        width, height = self._size
+        x_res, y_res = self._xy_res
+        gm_x_min, gm_y_min, _, gm_y_max = self._xy_bbox
+        # Pixel i is included, if its center
+        # gm_x_min + (i + 0.5) * x_res is within [x_min, x_max].
+        # Same for pixel j, taking the j-axis direction into account.
+        # Centers on the box edges must be included, so we
+        # widen the computed pixel ranges by a tiny tolerance.
+        eps = _IJ_BBOX_EPS
+        i_min = max(0, math.ceil((x_min - gm_x_min) / x_res - 0.5 - eps))
+        i_max = min(width,
+                    math.floor((x_max - gm_x_min) / x_res - 0.5 + eps) + 1)
+        if self._is_j_axis_up:
+            j_min = max(0,
+                        math.ceil((y_min - gm_y_min) / y_res - 0.5 - eps))
+            j_max = min(height,
+                        math.floor((y_max - gm_y_min) / y_res - 0.5 + eps)
+                        + 1)
+        else:
+            j_min = max(0,
+                        math.ceil((gm_y_max - y_max) / y_res - 0.5 - eps))
+            j_max = min(height,
+                        math.floor((gm_y_max - y_min) / y_res - 0.5 + eps)
+                        + 1)
+        if i_min >= i_max or j_min >= j_max:
+            return -1, -1, -1, -1
+        if ij_border != 0:
+            i_min = max(0, i_min - ij_border)
+            j_min = max(0, j_min - ij_border)
+            i_max = min(width, i_max + ij_border)
+            j_max = min(height, j_max + ij_border)
+        return i_min, j_min, i_max, j_max
+
     def ij_bboxes_from_xy_bboxes(self,
                                  xy_bboxes: np.ndarray,
                                  xy_border: float = 0.0,
@@ -520,18 +718,35 @@ class GridMapping(abc.ABC):
         :return: Bounding boxes in [[i_min, j_min, i_max, j_max], ..]]
             in pixel coordinates.
         """
-        from .bboxes import compute_ij_bboxes
         if ij_bboxes is None:
-            ij_bboxes = np.full_like(xy_bboxes, -1, dtype=np.int64)
+            # No need to initialise, compute functions will do
+            ij_bboxes = np.empty_like(xy_bboxes, dtype=np.int64)
+        if self._is_regular:
+            # No need to create the 2D x,y coordinates at all,
+            # the affine grid is fully described by bbox and res.
+            for k in range(xy_bboxes.shape[0]):
+                ij_bboxes[k] = self._regular_ij_bbox_from_xy_bbox(
+                    tuple(map(float, xy_bboxes[k])),
+                    xy_border=xy_border,
+                    ij_border=ij_border
+                )
+            return ij_bboxes
+        xy_coords = self.xy_coords.data
+        if isinstance(xy_coords, da.Array):
+            # Avoid loading the entire coordinates array into memory
+            compute_ij_bboxes_blockwise(xy_coords,
+                                        xy_bboxes,
+                                        xy_border,
+                                        ij_border,
+                                        ij_bboxes)
         else:
-            ij_bboxes[:, :] = -1
-        xy_coords = self.xy_coords.values
-        compute_ij_bboxes(xy_coords[0],
-                          xy_coords[1],
-                          xy_bboxes,
-                          xy_border,
-                          ij_border,
-                          ij_bboxes)
+            xy_coords = np.asarray(xy_coords)
+            compute_ij_bboxes(xy_coords[0],
+                              xy_coords[1],
+                              xy_bboxes,
+                              xy_border,
+                              ij_border,
+                              ij_bboxes)
         return ij_bboxes
 
     def to_coords(self,
@@ -720,6 +935,11 @@ class GridMapping(abc.ABC):
         """
         if self is other:
             return True
+        # Computing signatures may be expensive, so we
+        # only use them if they are known already
+        if self._signature is not None \
+                and self._signature == other._signature:
+            return True
         if self.is_j_axis_up == other.is_j_axis_up \
                 and self.is_lon_360 == other.is_lon_360 \
                 and self.is_regular == other.is_regular \
@@ -728,16 +948,26 @@ class GridMapping(abc.ABC):
                 and self.crs == other.crs:
             sxr, syr = self.xy_res
             oxr, oyr = other.xy_res
-            if math.isclose(sxr, oxr, abs_tol=tolerance) \
-                    and math.isclose(syr, oyr, abs_tol=tolerance):
-                sx1, sy1, sx2, sy2 = self.xy_bbox
-                ox1, oy1, ox2, oy2 = other.xy_bbox
-                return math.isclose(sx1, ox1, abs_tol=tolerance) \
-                       and math.isclose(sy1, oy1, abs_tol=tolerance) \
-                       and math.isclose(sx2, ox2, abs_tol=tolerance) \
-                       and math.isclose(sy2, oy2, abs_tol=tolerance)
+            sx1, sy1, sx2, sy2 = self.xy_bbox
+            ox1, oy1, ox2, oy2 = other.xy_bbox
+            return abs(sxr - oxr) <= tolerance \
+                and abs(syr - oyr) <= tolerance \
+                and abs(sx1 - ox1) <= tolerance \
+                and abs(sy1 - oy1) <= tolerance \
+                and abs(sx2 - ox2) <= tolerance \
+                and abs(sy2 - oy2) <= tolerance
         return False
 
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, GridMapping):
+            return NotImplemented
+        return self._get_signature() == other._get_signature()
+
+    def __hash__(self) -> int:
+        return hash(self._get_signature())
+
     @classmethod
     def assert_regular(cls, value: Any, name: str = None):
         assert_instance(value, GridMapping, name=name)
@@ -746,7 +976,7 @@ class GridMapping(abc.ABC):
                              f' be a regular grid mapping')
 
     def _assert_regular(self):
-        if not self.is_regular:
+        if not self._is_regular:
             raise NotImplementedError('Operation not implemented'
                                       ' for non-regular grid mappings')
 
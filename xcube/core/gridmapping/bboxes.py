@@ -20,6 +20,7 @@
 # SOFTWARE.
 from typing import Tuple, Union
 
+import dask
 import dask.array as da
 import numba as nb
 import numpy as np
@@ -39,7 +40,8 @@ def compute_ij_bboxes(x_image: np.ndarray,
     in x,y coordinates *xy_boxes*.
 
     *ij_boxes* must be pre-allocated to match shape of
-    *xy_boxes* and initialised with negative integers.
+    *xy_boxes*. It doesn't need to be initialised, as every
+    box is reset to ``(-1, -1, -1, -1)`` before it is computed.
 
     :param x_image: The x coordinates image.
         A 2D array of shape (height, width).
@@ -53,59 +55,168 @@ def compute_ij_bboxes(x_image: np.ndarray,
     :param ij_boxes: The resulting
         i,j bounding boxes.
     """
-    h = x_image.shape[0]
-    w = x_image.shape[1]
     n = xy_boxes.shape[0]
     for k in nb.prange(n):
-        ij_bbox = ij_boxes[k]
-        xy_bbox = xy_boxes[k]
-        x_min = xy_bbox[0] - xy_border
-        y_min = xy_bbox[1] - xy_border
-        x_max = xy_bbox[2] + xy_border
-        y_max = xy_bbox[3] + xy_border
-        for j0 in range(h):
-            for i0 in range(w):
-                x = x_image[j0, i0]
-                if x_min <= x <= x_max:
-                    y = y_image[j0, i0]
-                    if y_min <= y <= y_max:
-                        i1 = i0 + 1
-                        j1 = j0 + 1
-                        i_min = ij_bbox[0]
-                        j_min = ij_bbox[1]
-                        i_max = ij_bbox[2]
-                        j_max = ij_bbox[3]
-                        if i_min < 0:
+        _compute_ij_bbox(x_image, y_image,
+                         xy_boxes[k], xy_border, ij_border,
+                         ij_boxes[k])
+
+
+@nb.njit(nogil=True, cache=True)
+def _compute_ij_bboxes_sequential(x_image: np.ndarray,
+                                  y_image: np.ndarray,
+                                  xy_boxes: np.ndarray,
+                                  xy_border: float,
+                                  ij_border: int,
+                                  ij_boxes: np.ndarray):
+    """
+    Same as :func:compute_ij_bboxes, but without parallel=True,
+    so it can safely be called from multiple dask threads.
+    """
+    n = xy_boxes.shape[0]
+    for k in range(n):
+        _compute_ij_bbox(x_image, y_image,
+                         xy_boxes[k], xy_border, ij_border,
+                         ij_boxes[k])
+
+
+@nb.njit(nogil=True, cache=True, inline='always')
+def _compute_ij_bbox(x_image: np.ndarray,
+                     y_image: np.ndarray,
+                     xy_bbox: np.ndarray,
+                     xy_border: float,
+                     ij_border: int,
+                     ij_bbox: np.ndarray):
+    h = x_image.shape[0]
+    w = x_image.shape[1]
+    ij_bbox[:] = -1
+    x_min = xy_bbox[0] - xy_border
+    y_min = xy_bbox[1] - xy_border
+    x_max = xy_bbox[2] + xy_border
+    y_max = xy_bbox[3] + xy_border
+    for j0 in range(h):
+        for i0 in range(w):
+            x = x_image[j0, i0]
+            if x_min <= x <= x_max:
+                y = y_image[j0, i0]
+                if y_min <= y <= y_max:
+                    i1 = i0 + 1
+                    j1 = j0 + 1
+                    i_min = ij_bbox[0]
+                    j_min = ij_bbox[1]
+                    i_max = ij_bbox[2]
+                    j_max = ij_bbox[3]
+                    if i_min < 0:
+                        ij_bbox[0] = i0
+                        ij_bbox[1] = j0
+                        ij_bbox[2] = i1
+                        ij_bbox[3] = j1
+                    else:
+                        if i0 < i_min:
                             ij_bbox[0] = i0
+                        if j0 < j_min:
                             ij_bbox[1] = j0
+                        if i1 > i_max:
                             ij_bbox[2] = i1
+                        if j1 > j_max:
                             ij_bbox[3] = j1
-                        else:
-                            if i0 < i_min:
-                                ij_bbox[0] = i0
-                            if j0 < j_min:
-                                ij_bbox[1] = j0
-                            if i1 > i_max:
-                                ij_bbox[2] = i1
-                            if j1 > j_max:
-                                ij_bbox[3] = j1
-        if ij_border != 0 and ij_bbox[0] != -1:
-            i_min = ij_bbox[0] - ij_border
-            j_min = ij_bbox[1] - ij_border
-            i_max = ij_bbox[2] + ij_border
-            j_max = ij_bbox[3] + ij_border
-            if i_min < 0:
-                i_min = 0
-            if j_min < 0:
-                j_min = 0
-            if i_max > w:
-                i_max = w
-            if j_max > h:
-                j_max = h
-            ij_bbox[0] = i_min
-            ij_bbox[1] = j_min
-            ij_bbox[2] = i_max
-            ij_bbox[3] = j_max
+    if ij_border != 0 and ij_bbox[0] != -1:
+        i_min = ij_bbox[0] - ij_border
+        j_min = ij_bbox[1] - ij_border
+        i_max = ij_bbox[2] + ij_border
+        j_max = ij_bbox[3] + ij_border
+        if i_min < 0:
+            i_min = 0
+        if j_min < 0:
+            j_min = 0
+        if i_max > w:
+            i_max = w
+        if j_max > h:
+            j_max = h
+        ij_bbox[0] = i_min
+        ij_bbox[1] = j_min
+        ij_bbox[2] = i_max
+        ij_bbox[3] = j_max
+
+
+def compute_ij_bboxes_blockwise(xy_coords: da.Array,
+                                xy_boxes: np.ndarray,
+                                xy_border: float,
+                                ij_border: int,
+                                ij_boxes: np.ndarray):
+    """
+    Same as :func:compute_ij_bboxes, but operates on the dask blocks
+    of the x,y coordinates array *xy_coords* of shape (2, height, width).
+    The coordinate blocks are never loaded into memory all at once.
+
+    *ij_boxes* must be pre-allocated to match shape of
+    *xy_boxes*, but doesn't need to be initialised.
+
+    :param xy_coords: The x,y coordinates image.
+        A 3D dask array of shape (2, height, width).
+    :param xy_boxes: The x,y bounding boxes.
+    :param xy_border: A border added to the
+        x,y bounding boxes.
+    :param ij_border: A border added to the resulting
+        i,j bounding boxes.
+    :param ij_boxes: The resulting
+        i,j bounding boxes.
+    """
+    _, h, w = xy_coords.shape
+    if xy_coords.numblocks[0] != 1:
+        xy_coords = xy_coords.rechunk({0: 2})
+    y_chunks, x_chunks = xy_coords.chunks[1:]
+    j_offsets = np.cumsum((0,) + y_chunks[:-1])
+    i_offsets = np.cumsum((0,) + x_chunks[:-1])
+    ij_boxes[:, :] = -1
+    xy_blocks = xy_coords.to_delayed()
+    tasks = [
+        dask.delayed(_compute_ij_bboxes_block)(xy_blocks[0, j, i],
+                                               xy_boxes,
+                                               xy_border,
+                                               int(i_offsets[i]),
+                                               int(j_offsets[j]))
+        for j in range(len(y_chunks))
+        for i in range(len(x_chunks))
+    ]
+    for block_ij_boxes in dask.compute(*tasks):
+        _merge_ij_bboxes(ij_boxes, block_ij_boxes)
+    if ij_border != 0:
+        found = ij_boxes[:, 0] >= 0
+        ij_boxes[found, 0:2] = np.maximum(ij_boxes[found, 0:2] - ij_border,
+                                          0)
+        ij_boxes[found, 2] = np.minimum(ij_boxes[found, 2] + ij_border, w)
+        ij_boxes[found, 3] = np.minimum(ij_boxes[found, 3] + ij_border, h)
+
+
+def _compute_ij_bboxes_block(xy_block: np.ndarray,
+                             xy_boxes: np.ndarray,
+                             xy_border: float,
+                             i_offset: int,
+                             j_offset: int) -> np.ndarray:
+    ij_boxes = np.empty_like(xy_boxes, dtype=np.int64)
+    _compute_ij_bboxes_sequential(xy_block[0],
+                                  xy_block[1],
+                                  xy_boxes,
+                                  xy_border,
+                                  0,
+                                  ij_boxes)
+    found = ij_boxes[:, 0] >= 0
+    ij_boxes[found, 0::2] += i_offset
+    ij_boxes[found, 1::2] += j_offset
+    return ij_boxes
+
+
+def _merge_ij_bboxes(ij_boxes: np.ndarray, block_ij_boxes: np.ndarray):
+    # -1 means "no intersection", so only merge boxes found in block
+    found = block_ij_boxes[:, 0] >= 0
+    first = found & (ij_boxes[:, 0] < 0)
+    other = found & ~first
+    ij_boxes[first] = block_ij_boxes[first]
+    ij_boxes[other, 0:2] = np.minimum(ij_boxes[other, 0:2],
+                                      block_ij_boxes[other, 0:2])
+    ij_boxes[other, 2:4] = np.maximum(ij_boxes[other, 2:4],
+                                      block_ij_boxes[other, 2:4])
 
 
 def compute_xy_bbox(xy_coords: Union[xr.DataArray, np.ndarray, da.Array]) \
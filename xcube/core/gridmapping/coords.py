@@ -21,8 +21,9 @@
 
 import abc
 import math
-from typing import Tuple, Union, Dict
+from typing import Any, Tuple, Union, Dict
 
+import dask.base
 import dask.array as da
 import numpy as np
 import pyproj
@@ -50,6 +51,8 @@ class CoordsGridMapping(GridMapping, abc.ABC):
     variables and a CRS.
     """
 
+    __slots__ = ('_x_coords', '_y_coords', '_coords_token')
+
     def __init__(self,
                  /,
                  x_coords: xr.DataArray,
@@ -57,8 +60,18 @@ class CoordsGridMapping(GridMapping, abc.ABC):
                  **kwargs):
         self._x_coords = x_coords
         self._y_coords = y_coords
+        self._coords_token = None
         super().__init__(**kwargs)
 
+    def _get_signature_extra(self) -> Any:
+        # Our coordinates may be irregular, so we need to
+        # identify them by their contents. Copies made by derive()
+        # share the coordinates, hence also their cached token.
+        if self._coords_token is None:
+            self._coords_token = (_get_coords_token(self._x_coords),
+                                  _get_coords_token(self._y_coords))
+        return self._coords_token
+
     @property
     def x_coords(self):
         return self._x_coords
@@ -68,16 +81,44 @@ class CoordsGridMapping(GridMapping, abc.ABC):
         return self._y_coords
 
 
+def _get_coords_token(coords: xr.DataArray) -> str:
+    data = coords.data
+    if isinstance(data, da.Array):
+        # Names of dask arrays are tokens of their contents,
+        # so we neither compute nor hash the coordinates.
+        return data.name
+    return dask.base.tokenize(data)
+
+
 class Coords1DGridMapping(CoordsGridMapping):
     """
     Grid mapping constructed from
     1D coordinate variables and a CRS.
     """
 
+    __slots__ = ()
+
     def _new_xy_coords(self) -> xr.DataArray:
-        y, x = xr.broadcast(self._y_coords, self._x_coords)
-        return xr.concat([x, y], dim='coord') \
-            .chunk(self.xy_coords_chunks)
+        # Broadcast the 1D coordinates directly into the target
+        # chunking, so we neither materialize full 2D arrays
+        # nor need to rechunk them afterwards.
+        _, tile_height, tile_width = self.xy_coords_chunks
+        width, height = self.size
+        y_dim, = self._y_coords.dims
+        x_dim, = self._x_coords.dims
+        x = da.asarray(self._x_coords.data).rechunk(tile_width)
+        y = da.asarray(self._y_coords.data).rechunk(tile_height)
+        x = da.broadcast_to(x.reshape((1, width)),
+                            (height, width),
+                            chunks=(tile_height, tile_width))
+        y = da.broadcast_to(y.reshape((height, 1)),
+                            (height, width),
+                            chunks=(tile_height, tile_width))
+        return xr.DataArray(_stack_xy_coords(x, y),
+                            dims=('coord', y_dim, x_dim),
+                            coords={y_dim: self._y_coords,
+                                    x_dim: self._x_coords},
+                            name='xy_coords')
 
 
 class Coords2DGridMapping(CoordsGridMapping):
@@ -86,9 +127,39 @@ class Coords2DGridMapping(CoordsGridMapping):
     2D coordinate variables and a CRS.
     """
 
+    __slots__ = ()
+
     def _new_xy_coords(self) -> xr.DataArray:
-        return xr.concat([self._x_coords, self._y_coords], dim='coord') \
-            .chunk(self.xy_coords_chunks)
+        _, tile_height, tile_width = self.xy_coords_chunks
+        x = da.asarray(self._x_coords.data) \
+            .rechunk((tile_height, tile_width))
+        y = da.asarray(self._y_coords.data) \
+            .rechunk((tile_height, tile_width))
+        return xr.DataArray(_stack_xy_coords(x, y),
+                            dims=('coord',) + self._x_coords.dims,
+                            coords=self._x_coords.coords,
+                            name='xy_coords')
+
+
+def _stack_xy_coords(x: da.Array, y: da.Array) -> da.Array:
+    """
+    Stack the equally chunked 2D arrays *x* and *y* into
+    a 3D array with a single chunk of size 2 along the
+    new first axis, as block-wise consumers of xy_coords
+    expect x and y in the same block.
+    Unlike ``da.stack(...).rechunk(...)``, this does
+    not add a rechunk layer to the graph.
+    """
+    dtype = np.result_type(x.dtype, y.dtype)
+    return da.map_blocks(_stack_xy_block, x, y,
+                         new_axis=0,
+                         chunks=((2,),) + x.chunks,
+                         dtype=dtype,
+                         meta=np.array((), dtype=dtype))
+
+
+def _stack_xy_block(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    return np.stack([x, y])
 
 
 def new_grid_mapping_from_coords(
@@ -252,7 +323,7 @@ def new_grid_mapping_from_coords(
             y_coords = y_coords.chunk((tile_height, tile_width))
 
         # Guess j axis direction
-        is_j_axis_up = np.all(y_coords[0, :] < y_coords[-1, :]) or None
+        is_j_axis_up = bool(np.all(y_coords[0, :] < y_coords[-1, :])) or None
 
     assert_true(x_res > 0 and y_res > 0,
                 'internal error: x_res and y_res could not be determined',
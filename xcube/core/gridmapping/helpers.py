@@ -33,6 +33,7 @@ import xarray as xr
 from xcube.util.assertions import assert_given
 from xcube.util.assertions import assert_instance
 from xcube.util.assertions import assert_true
+from xcube.util.projcache import ProjCache
 from xcube.util.undefined import UNDEFINED
 
 Number = Union[int, float]
@@ -65,7 +66,8 @@ def _normalize_crs(crs: Union[str, pyproj.CRS]) -> pyproj.CRS:
     if isinstance(crs, pyproj.CRS):
         return crs
     assert_instance(crs, str, 'crs')
-    return pyproj.CRS.from_string(crs)
+    # pyproj.CRS.from_string() is expensive, so use cached CRSes
+    return ProjCache.INSTANCE.get_crs(crs)
 
 
 def _normalize_int_pair(
@@ -73,6 +75,10 @@ def _normalize_int_pair(
         name: str = None,
         default: Optional[Tuple[int, int]] = UNDEFINED
 ) -> Optional[Tuple[int, int]]:
+    if type(value) is tuple and len(value) == 2 \
+            and type(value[0]) is int and type(value[1]) is int:
+        # Fast path for the most common case
+        return value
     if isinstance(value, int):
         return value, value
     elif value is not None:
@@ -91,6 +97,10 @@ def _normalize_number_pair(
         name: str = None,
         default: Optional[Tuple[Number, Number]] = UNDEFINED
 ) -> Optional[Tuple[Number, Number]]:
+    if type(value) is tuple and len(value) == 2 \
+            and type(value[0]) is int and type(value[1]) is int:
+        # Fast path, ints need no rounding
+        return value
     if isinstance(value, (float, int)):
         x, y = value, value
         return _to_int_or_float(x), _to_int_or_float(y)
@@ -19,13 +19,18 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Tuple, Union
+import functools
+from typing import Optional, Tuple, Union
 
 import dask.array as da
+import numba as nb
+import numpy as np
 import pyproj
 import xarray as xr
 
 from xcube.util.assertions import assert_true
+from xcube.util.dask import get_chunk_sizes
+from xcube.util.projcache import ProjCache
 from .base import GridMapping
 from .helpers import _default_xy_dim_names
 from .helpers import _default_xy_var_names
@@ -36,6 +41,7 @@ from .helpers import _to_int_or_float
 
 
 class RegularGridMapping(GridMapping):
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -48,20 +54,62 @@ class RegularGridMapping(GridMapping):
         y1, y2 = self.y_min + y_res_05, self.y_max - y_res_05
         if not self.is_j_axis_up:
             y1, y2 = y2, y1
+        # Same steps as used by linspace(x1, x2, width), etc.
+        x_step = (x2 - x1) / (self.width - 1)
+        y_step = (y2 - y1) / (self.height - 1)
+        y_chunks, x_chunks = get_chunk_sizes((self.height, self.width),
+                                             (self.tile_height,
+                                              self.tile_width))
+        # Each block is computed independently from scratch,
+        # so the graph has a single layer of tasks.
+        xy_coords_data = da.map_blocks(_new_xy_coords_block,
+                                       x1, y1, x_step, y_step,
+                                       chunks=((2,), y_chunks, x_chunks),
+                                       dtype=np.float64,
+                                       meta=np.array((), dtype=np.float64))
         x_name, y_name = self.xy_dim_names
-        x_coords_1d = xr.DataArray(da.linspace(x1, x2, self.width,
-                                               chunks=self.tile_width),
-                                   dims=x_name)
-        y_coords_1d = xr.DataArray(da.linspace(y1, y2, self.height,
-                                               chunks=self.tile_height),
-                                   dims=y_name)
-        y_coords_2d, x_coords_2d = xr.broadcast(y_coords_1d, x_coords_1d)
-        xy_coords = xr.concat([x_coords_2d, y_coords_2d],
-                              dim='coord').chunk((2,
-                                                  self.tile_height,
-                                                  self.tile_width))
-        xy_coords.name = 'xy_coords'
-        return xy_coords
+        return xr.DataArray(xy_coords_data,
+                            dims=('coord', y_name, x_name),
+                            name='xy_coords')
+
+
+def _new_xy_coords_block(x1: float,
+                         y1: float,
+                         x_step: float,
+                         y_step: float,
+                         block_info=None) -> np.ndarray:
+    _, (j_start, j_stop), (i_start, i_stop) = \
+        block_info[None]['array-location']
+    xy_block = np.empty((2, j_stop - j_start, i_stop - i_start),
+                        dtype=np.float64)
+    _fill_regular_xy_coords_block(xy_block,
+                                  i_start, j_start,
+                                  x1, y1,
+                                  x_step, y_step)
+    return xy_block
+
+
+@nb.jit(nopython=True, nogil=True, cache=True)
+def _fill_regular_xy_coords_block(xy_block: np.ndarray,
+                                  i_start: int,
+                                  j_start: int,
+                                  x1: float,
+                                  y1: float,
+                                  x_step: float,
+                                  y_step: float):
+    """
+    Fill the block *xy_block* of shape (2, height, width) with the
+    x,y coordinates of a regular grid whose first pixel center is
+    at *x1*, *y1*. The block's first pixel is
+    at *i_start*, *j_start* in the grid.
+    """
+    h = xy_block.shape[1]
+    w = xy_block.shape[2]
+    for j in range(h):
+        y = y1 + (j_start + j) * y_step
+        for i in range(w):
+            xy_block[0, j, i] = x1 + (i_start + i) * x_step
+            xy_block[1, j, i] = y
 
 
 def new_regular_grid_mapping(
@@ -135,11 +183,36 @@ def to_regular_grid_mapping(grid_mapping: GridMapping,
     width = width if width >= 2 else 2
     height = height if height >= 2 else 2
 
+    return _new_regular_grid_mapping_cached(
+        (width, height),
+        (x_min, y_min),
+        xy_res,
+        # Hashing and comparing pyproj.CRS instances serializes
+        # them to WKT each time, so we use their SRS as key.
+        ProjCache.get_crs_srs(grid_mapping.crs),
+        _normalize_int_pair(tile_size, default=None),
+        is_j_axis_up
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _new_regular_grid_mapping_cached(
+        size: Tuple[int, int],
+        xy_min: Tuple[float, float],
+        xy_res: float,
+        crs_srs: str,
+        tile_size: Optional[Tuple[int, int]],
+        is_j_axis_up: bool
+) -> GridMapping:
+    # Grid mappings are immutable, so we can share them.
+    # Repeated calls of to_regular_grid_mapping() for the
+    # same source, e.g., for tiles or pyramid levels, will
+    # then also share the target's lazily computed state.
     return new_regular_grid_mapping(
-        size=(width, height),
-        xy_min=(x_min, y_min),
+        size=size,
+        xy_min=xy_min,
         xy_res=xy_res,
-        crs=grid_mapping.crs,
+        crs=ProjCache.INSTANCE.get_crs(crs_srs),
         tile_size=tile_size,
         is_j_axis_up=is_j_axis_up
     )
@@ -23,9 +23,9 @@ from typing import Union, Tuple
 
 import numpy as np
 import pyproj
-import pyproj.transformer as pt
 import xarray as xr
 
+from xcube.util.projcache import ProjCache
 from .base import DEFAULT_TOLERANCE
 from .base import GridMapping
 from .coords import new_grid_mapping_from_coords
@@ -72,9 +72,8 @@ def transform_grid_mapping(
                                        xy_var_names=xy_var_names)
         return grid_mapping
 
-    transformer = pt.Transformer.from_crs(source_crs,
-                                          target_crs,
-                                          always_xy=True)
+    transformer = ProjCache.INSTANCE.get_transformer(source_crs,
+                                                     target_crs)
 
     def _transform(block: np.ndarray) -> np.ndarray:
         x1, y1 = block
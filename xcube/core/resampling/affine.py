@@ -19,14 +19,17 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import functools
 import math
 from typing import Union, Callable, Optional, \
     Sequence, Tuple, Mapping, Hashable, Any
 
+import dask
+import numba as nb
 import numpy as np
 import xarray as xr
 from dask import array as da
-from dask_image import ndinterp
+from scipy import ndimage
 
 from xcube.core.gridmapping import GridMapping
 from xcube.core.gridmapping.helpers import AffineTransformMatrix
@@ -72,8 +75,12 @@ def affine_transform_dataset(
         xy_dim_names=source_gm.xy_dim_names,
         var_configs=var_configs
     )
+    # The x,y coordinates of source_gm may not be part of
+    # the dataset, e.g., because they have been transformed
+    # into another CRS.
     has_bounds = any(dataset[var_name].attrs.get('bounds')
-                     for var_name in source_gm.xy_var_names)
+                     for var_name in source_gm.xy_var_names
+                     if var_name in dataset)
     new_coords = target_gm.to_coords(
         xy_var_names=source_gm.xy_var_names,
         xy_dim_names=source_gm.xy_dim_names,
@@ -106,14 +113,31 @@ def resample_dataset(
     ((i_scale, _, i_off), (_, j_scale, j_off)) = matrix
     width, height = size
     tile_width, tile_height = tile_size
+    scale = (j_scale, i_scale)
+    offset = (j_off, i_off)
+    shape = (height, width)
+    chunks = (tile_height, tile_width)
     x_dim, y_dim = xy_dim_names
     yx_dims = (y_dim, x_dim)
     coords = dict()
     var_configs = var_configs or {}
     data_vars = dict()
+    # Normalized scale, offset, shape, chunks for a given
+    # shape of the non-spatial dimensions. Usually,
+    # all variables share the same.
+    normalized_args = dict()
+    # If the transformation is the identity, we can
+    # avoid building any resampling graphs.
+    is_no_op = _is_identity(scale, offset) \
+        and all(dataset.dims.get(dim) == dim_size
+                for dim, dim_size in zip(yx_dims, shape))
     for k, var in dataset.variables.items():
         new_var = None
-        if var.ndim >= 2 and var.dims[-2:] == yx_dims:
+        if is_no_op and var.ndim >= 2 and var.dims[-2:] == yx_dims:
+            new_var = xr.DataArray(var.data,
+                                   dims=var.dims,
+                                   attrs=var.attrs)
+        elif var.ndim >= 2 and var.dims[-2:] == yx_dims:
             var_config = var_configs.get(k, dict())
             if np.issubdtype(var.dtype, np.integer) \
                     or np.issubdtype(var.dtype, bool):
@@ -124,15 +148,19 @@ def resample_dataset(
                 spline_order = 1
                 aggregator = np.nanmean
                 recover_nan = True
-            var_data = resample_ndimage(
-                var.data,
-                scale=(j_scale, i_scale),
-                offset=(j_off, i_off),
-                shape=(height, width),
-                chunks=(tile_height, tile_width),
+            image = da.asarray(var.data)
+            extra_shape = image.shape[:-2]
+            if extra_shape not in normalized_args:
+                normalized_args[extra_shape] = _normalize_args(
+                    image, scale, offset, shape, chunks
+                )
+            var_data = _resample_ndimage(
+                image,
+                *normalized_args[extra_shape],
                 spline_order=var_config.get('spline_order', spline_order),
                 aggregator=var_config.get('aggregator', aggregator),
                 recover_nan=var_config.get('recover_nan', recover_nan),
+                precision=var_config.get('precision'),
             )
             new_var = xr.DataArray(var_data,
                                    dims=var.dims,
@@ -158,9 +186,30 @@ def resample_ndimage(
         chunks: Sequence[int] = None,
         spline_order: int = 1,
         aggregator: Optional[Aggregator] = np.nanmean,
-        recover_nan: bool = False
+        recover_nan: bool = False,
+        precision: Optional[np.dtype] = None
 ) -> da.Array:
     image = da.asarray(image)
+    return _resample_ndimage(image,
+                             *_normalize_args(image,
+                                              scale, offset,
+                                              shape, chunks),
+                             spline_order=spline_order,
+                             aggregator=aggregator,
+                             recover_nan=recover_nan,
+                             precision=precision)
+
+
+def _normalize_args(
+        image: da.Array,
+        scale: Union[float, Tuple[float, float]],
+        offset: Union[float, Tuple[float, float]],
+        shape: Union[int, Tuple[int, int]],
+        chunks: Sequence[int]
+) -> Tuple[Tuple[float, ...],
+           Tuple[float, ...],
+           Tuple[int, ...],
+           Optional[Tuple[int, ...]]]:
     offset = _normalize_offset(offset, image.ndim)
     scale = _normalize_scale(scale, image.ndim)
     if shape is None:
@@ -168,13 +217,43 @@ def resample_ndimage(
     else:
         shape = _normalize_shape(shape, image)
     chunks = _normalize_chunks(chunks, shape)
+    return scale, offset, shape, chunks
+
+
+def _resample_ndimage(
+        image: da.Array,
+        scale: Tuple[float, ...],
+        offset: Tuple[float, ...],
+        shape: Tuple[int, ...],
+        chunks: Optional[Tuple[int, ...]],
+        spline_order: int,
+        aggregator: Optional[Aggregator],
+        recover_nan: bool,
+        precision: Optional[np.dtype] = None
+) -> da.Array:
+    """
+    Same as :func:resample_ndimage, but expects
+    normalized *scale*, *offset*, *shape*, and *chunks*.
+
+    If *precision* is a floating point type smaller than
+    the floating point type of *image*, the interpolation
+    is computed using *precision*. The result is converted
+    back to the type of *image*.
+    """
+    dtype = image.dtype
+    if precision is not None:
+        assert_true(np.issubdtype(precision, np.floating),
+                    'precision must be a floating point type')
+        if np.issubdtype(dtype, np.floating) \
+                and np.dtype(precision).itemsize < dtype.itemsize \
+                and not _is_no_op(image, scale, offset, shape):
+            image = image.astype(precision)
     scale_y, scale_x = scale[-2], scale[-1]
     divisor_x = math.ceil(abs(scale_x))
     divisor_y = math.ceil(abs(scale_y))
     if (divisor_x >= 2 or divisor_y >= 2) and aggregator is not None:
         # Downsampling
         # ------------
-        axes = {image.ndim - 2: divisor_y, image.ndim - 1: divisor_x}
         elongation = _normalize_scale((scale_y / divisor_y,
                                        scale_x / divisor_x), image.ndim)
         larger_shape = resize_shape(shape, (divisor_y, divisor_x),
@@ -187,15 +266,20 @@ def resample_ndimage(
         # print('  larger_shape:', larger_shape)
         divisible_chunks = _make_divisible_tiles(larger_shape,
                                                  divisor_x, divisor_y)
-        image = _transform_array(image,
-                                 elongation, offset,
-                                 larger_shape, divisible_chunks,
-                                 spline_order, recover_nan)
-        image = da.coarsen(aggregator, image, axes)
-        if shape != image.shape:
-            image = image[..., 0:shape[-2], 0:shape[-1]]
-        if chunks is not None:
-            image = image.rechunk(chunks)
+        # Transform and aggregate in a single pass per chunk,
+        # so the larger image never exists as a dask array.
+        if chunks is None:
+            chunks = divisible_chunks[:-2] \
+                     + (divisible_chunks[-2] // divisor_y,
+                        divisible_chunks[-1] // divisor_x)
+        image = _transform_array_blockwise(
+            image,
+            elongation, offset,
+            shape, chunks,
+            spline_order, recover_nan,
+            aggregator=aggregator,
+            divisors=(divisor_y, divisor_x)
+        )
     else:
         # Upsampling
         # ----------
@@ -204,6 +288,8 @@ def resample_ndimage(
                                  scale, offset,
                                  shape, chunks,
                                  spline_order, recover_nan)
+    if image.dtype != dtype:
+        image = image.astype(dtype)
     return image
 
 
@@ -233,43 +319,465 @@ def _transform_array(image: da.Array,
                 'invalid chunks')
     if _is_no_op(image, scale, offset, shape):
         return image
-    # As of scipy 0.18, matrix = scale is no longer supported.
-    # Therefore we use the diagonal matrix form here,
-    # where scale is the diagonal.
-    matrix = np.diag(scale)
-    at_kwargs = dict(
-        offset=offset,
-        order=spline_order,
-        output_shape=shape,
-        output_chunks=chunks,
-        mode='constant',
+    return _transform_array_blockwise(image,
+                                      scale, offset,
+                                      shape, chunks,
+                                      spline_order, recover_nan)
+
+
+def _transform_array_blockwise(image: da.Array,
+                               scale: Tuple[float, ...],
+                               offset: Tuple[float, ...],
+                               shape: Tuple[int, ...],
+                               chunks: Optional[Tuple[int, ...]],
+                               spline_order: int,
+                               recover_nan: bool,
+                               aggregator: Optional[Aggregator] = None,
+                               divisors: Optional[Tuple[int, int]] = None) \
+        -> da.Array:
+    """
+    Implementation of :func:_transform_array.
+    For each output chunk, the input region required
+    is selected and then transformed by :func:_transform_block.
+
+    If *divisors* are given, each output chunk is first
+    transformed into a chunk larger by *divisors* in y and x,
+    which is then reduced to the output chunk using *aggregator*.
+    In this case, *scale* refers to the larger chunks.
+    """
+    output_chunks = da.core.normalize_chunks(
+        chunks if chunks is not None else image.chunksize,
+        shape=shape
     )
+    dtype = image.dtype
+    transform_chunks = output_chunks
+    if divisors is not None:
+        divisor_y, divisor_x = divisors
+        transform_chunks = output_chunks[:-2] + (
+            tuple(c * divisor_y for c in output_chunks[-2]),
+            tuple(c * divisor_x for c in output_chunks[-1]),
+        )
+        dtype = _get_aggregator_dtype(aggregator, dtype, image.ndim)
+    is_2d_transform = image.shape[:-2] == shape[:-2] \
+        and all(s == 1 for s in scale[:-2]) \
+        and all(o == 0 for o in offset[:-2])
+    # Number of extra input pixels required around the input
+    # region of an output chunk. Both nearest neighbour and linear
+    # interpolation need pixels floor(c) and floor(c) + 1 at most.
+    # We add another pixel on both sides, so rounding errors in
+    # the block offset cannot make scipy consider coordinates as
+    # outside the input. Higher spline orders need more pixels,
+    # plus the depth of the spline prefilter, which is applied
+    # to the input region of every output chunk.
+    margin = 1
+    if spline_order > 1:
+        margin += spline_order // 2 + _get_spline_filter_depth(spline_order)
+    output_blocks = np.empty(tuple(map(len, output_chunks)), dtype=object)
+    for block_index, input_slices, block_offset, block_shape \
+            in _get_block_geometries(image.shape, scale, offset,
+                                     transform_chunks, margin):
+        axes_params = None
+        if is_2d_transform and spline_order <= 1:
+            # Pure, so that variables of the same shape
+            # share the same tasks in a dask graph.
+            axes_params = dask.delayed(_get_axes_indexes_and_weights,
+                                       pure=True)(
+                tuple(s.stop - s.start for s in input_slices[-2:]),
+                scale[-2:],
+                block_offset[-2:],
+                block_shape[-2:],
+                spline_order
+            )
+        if divisors is None:
+            output_block = dask.delayed(_transform_block)(
+                image[input_slices],
+                scale,
+                block_offset,
+                block_shape,
+                spline_order,
+                recover_nan,
+                axes_params
+            )
+            output_block_shape = block_shape
+        else:
+            output_block = dask.delayed(_transform_and_aggregate_block)(
+                image[input_slices],
+                scale,
+                block_offset,
+                block_shape,
+                spline_order,
+                recover_nan,
+                axes_params,
+                aggregator,
+                divisors
+            )
+            output_block_shape = block_shape[:-2] + (
+                block_shape[-2] // divisor_y,
+                block_shape[-1] // divisor_x,
+            )
+        output_blocks[block_index] = da.from_delayed(output_block,
+                                                     output_block_shape,
+                                                     dtype=dtype)
+    return da.block(output_blocks.tolist())
+
+
+# Poles of the spline prefilter for spline orders 2 to 5,
+# see scipy/ndimage/src/ni_splines.c
+_SPLINE_FILTER_POLES = {
+    2: (math.sqrt(8.0) - 3.0,),
+    3: (math.sqrt(3.0) - 2.0,),
+    4: (-0.361341225900220177092, -0.013725429297339121360),
+    5: (-0.430575347099973791851, -0.043096288203264653822),
+}
+
+
+def _get_spline_filter_depth(spline_order: int,
+                             tolerance: float = 1e-8) -> int:
+    """
+    Get the number of pixels after which the influence of the
+    spline prefilter of order *spline_order* is below *tolerance*.
+    """
+    max_pole = max(abs(pole)
+                   for pole in _SPLINE_FILTER_POLES[spline_order])
+    return math.ceil(math.log(tolerance) / math.log(max_pole))
+
+
+def _get_aggregator_dtype(aggregator: Aggregator,
+                          dtype: np.dtype,
+                          ndim: int) -> np.dtype:
+    sample = np.ones((ndim + 2) * (1,), dtype=dtype)
+    return np.asarray(aggregator(sample, axis=(-3, -1))).dtype
+
+
+def _transform_and_aggregate_block(block: np.ndarray,
+                                   scale: Tuple[float, ...],
+                                   offset: Tuple[float, ...],
+                                   shape: Tuple[int, ...],
+                                   spline_order: int,
+                                   recover_nan: bool,
+                                   axes_params: Optional[
+                                       Tuple[np.ndarray, ...]
+                                   ],
+                                   aggregator: Aggregator,
+                                   divisors: Tuple[int, int]) \
+        -> np.ndarray:
+    """
+    Transform *block* into an image of *shape* using
+    :func:_transform_block, then reduce it by *divisors*
+    in y and x using *aggregator*.
+    """
+    image = _transform_block(block, scale, offset, shape,
+                             spline_order, recover_nan, axes_params)
+    divisor_y, divisor_x = divisors
+    height, width = shape[-2:]
+    image = image.reshape(shape[:-2] + (height // divisor_y, divisor_y,
+                                        width // divisor_x, divisor_x))
+    return aggregator(image, axis=(-3, -1))
+
+
+@functools.lru_cache(maxsize=32)
+def _get_block_geometries(src_shape: Tuple[int, ...],
+                          scale: Tuple[float, ...],
+                          offset: Tuple[float, ...],
+                          output_chunks: Tuple[Tuple[int, ...], ...],
+                          margin: int) \
+        -> Tuple[Tuple[Tuple[int, ...],
+                       Tuple[slice, ...],
+                       Tuple[float, ...],
+                       Tuple[int, ...]], ...]:
+    """
+    For each output block, compute its index, the slices
+    of the input region it depends on including *margin*,
+    its offset relative to that region, and its shape.
+    Cached, because it is the same for all variables
+    of a dataset.
+    """
+    geometries = []
+    for block_index in np.ndindex(*map(len, output_chunks)):
+        block_shape = []
+        block_offset = []
+        input_slices = []
+        for dim, index in enumerate(block_index):
+            dim_chunks = output_chunks[dim]
+            start = sum(dim_chunks[:index])
+            size = dim_chunks[index]
+            s, o = scale[dim], offset[dim]
+            # Input coordinates of first and last output pixel
+            c1 = s * start + o
+            c2 = s * (start + size - 1) + o
+            c1, c2 = min(c1, c2), max(c1, c2)
+            if s == 1 and o == 0:
+                # Axes that are not transformed need exactly
+                # the input region of the output block
+                i1 = start
+                i2 = start + size - 1
+            else:
+                i1 = math.floor(c1) - margin
+                i2 = math.floor(c2) + 1 + margin
+            max_index = src_shape[dim] - 1
+            i1 = min(max(i1, 0), max_index)
+            i2 = min(max(i2, 0), max_index)
+            input_slices.append(slice(i1, i2 + 1))
+            block_shape.append(size)
+            block_offset.append(o + s * start - i1)
+        geometries.append((block_index,
+                           tuple(input_slices),
+                           tuple(block_offset),
+                           tuple(block_shape)))
+    return tuple(geometries)
+
+
+def _transform_block(block: np.ndarray,
+                     scale: Tuple[float, ...],
+                     offset: Tuple[float, ...],
+                     shape: Tuple[int, ...],
+                     spline_order: int,
+                     recover_nan: bool,
+                     axes_params: Optional[Tuple[np.ndarray, ...]] = None) \
+        -> np.ndarray:
     if recover_nan and spline_order > 0:
-        # We can "recover" values that are neighbours to NaN values
-        # that would otherwise become NaN too.
-        mask = da.isnan(image)
-        # First check if there are NaN values ar all
-        if da.any(mask):
-            # Yes, then
-            # 1. replace NaN by zero
-            filled_im = da.where(mask, 0.0, image)
-            # 2. transform the zeo-filled image
-            scaled_im = ndinterp.affine_transform(filled_im,
-                                                  matrix,
-                                                  **at_kwargs,
-                                                  cval=0.0)
-            # 3. transform the inverted mask
-            scaled_norm = ndinterp.affine_transform(1.0 - mask,
-                                                    matrix,
-                                                    **at_kwargs,
-                                                    cval=0.0)
-            # 4. put back NaN where there was zero,
-            #    otherwise decode using scaled mask
-            return da.where(da.isclose(scaled_norm, 0.0),
-                            np.nan, scaled_im / scaled_norm)
-
-    # No dealing with NaN required
-    return ndinterp.affine_transform(image, matrix, **at_kwargs, cval=np.nan)
+        # NaN recovery, see _transform_array(). Decided per
+        # block, so blocks without NaN values are transformed
+        # only once.
+        if _has_nan(block):
+            mask = np.isnan(block)
+            scaled_im = _affine_transform_block(
+                np.where(mask, 0.0, block),
+                scale, offset, shape, spline_order,
+                cval=0.0,
+                axes_params=axes_params
+            )
+            scaled_norm = _affine_transform_block(
+                np.logical_not(mask).astype(np.float64),
+                scale, offset, shape, spline_order,
+                cval=0.0,
+                axes_params=axes_params
+            )
+            return _recover_nan(scaled_im, scaled_norm) \
+                .astype(block.dtype, copy=False)
+    return _affine_transform_block(block,
+                                   scale, offset, shape, spline_order,
+                                   cval=np.nan,
+                                   axes_params=axes_params)
+
+
+def _affine_transform_block(block: np.ndarray,
+                            scale: Tuple[float, ...],
+                            offset: Tuple[float, ...],
+                            shape: Tuple[int, ...],
+                            spline_order: int,
+                            cval: float,
+                            axes_params: Optional[
+                                Tuple[np.ndarray, ...]
+                            ] = None) -> np.ndarray:
+    """
+    Same as scipy.ndimage.affine_transform() for a diagonal
+    matrix *scale* and mode "constant".
+
+    If only the last two axes are transformed, a numba kernel is
+    used for nearest neighbour and bilinear interpolation.
+    *axes_params* may provide the result of
+    :func:_get_axes_indexes_and_weights for that case.
+    """
+    is_float = np.issubdtype(block.dtype, np.floating)
+    if block.ndim >= 2 \
+            and block.shape[:-2] == shape[:-2] \
+            and all(s == 1 for s in scale[:-2]) \
+            and all(o == 0 for o in offset[:-2]) \
+            and spline_order <= 1 \
+            and (is_float or spline_order == 0):
+        height, width = shape[-2:]
+        src_height, src_width = block.shape[-2:]
+        if axes_params is None:
+            axes_params = _get_axes_indexes_and_weights(
+                (src_height, src_width),
+                scale[-2:], offset[-2:], shape[-2:],
+                spline_order
+            )
+        j_indexes, j_weights, i_indexes, i_weights = axes_params
+        # For non-float types, we'd need to mimic scipy's
+        # casting of cval, so we leave that to scipy.
+        if is_float or (np.all(j_indexes >= 0)
+                        and np.all(i_indexes >= 0)):
+            src = np.ascontiguousarray(block)
+            src = src.reshape((-1, src_height, src_width))
+            output = np.empty(shape, dtype=block.dtype)
+            dst = output.reshape((-1, height, width))
+            fill_value = block.dtype.type(cval if is_float else 0)
+            if spline_order == 0:
+                _transform_block_nearest(src,
+                                         j_indexes, i_indexes,
+                                         fill_value, dst)
+            else:
+                _transform_block_linear(src,
+                                        j_indexes, j_weights,
+                                        i_indexes, i_weights,
+                                        fill_value, dst)
+            return output
+
+    # A 1-D matrix is interpreted as the diagonal of the
+    # transformation matrix. In this case, scipy uses its
+    # separable zoom/shift implementation, which is about twice
+    # as fast as the general geometric transformation.
+    return ndimage.affine_transform(block,
+                                    np.array(scale, dtype=np.float64),
+                                    offset=offset,
+                                    order=spline_order,
+                                    output_shape=shape,
+                                    mode='constant',
+                                    cval=cval)
+
+
+def _get_axes_indexes_and_weights(src_shape: Tuple[int, int],
+                                  scale: Tuple[float, float],
+                                  offset: Tuple[float, float],
+                                  shape: Tuple[int, int],
+                                  spline_order: int) \
+        -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the source pixel indexes and interpolation
+    weights for the y- and x-axes.
+    """
+    j_indexes, j_weights = _get_axis_indexes_and_weights(
+        shape[0], src_shape[0], scale[0], offset[0], spline_order
+    )
+    i_indexes, i_weights = _get_axis_indexes_and_weights(
+        shape[1], src_shape[1], scale[1], offset[1], spline_order
+    )
+    return j_indexes, j_weights, i_indexes, i_weights
+
+
+def _get_axis_indexes_and_weights(size: int,
+                                  src_size: int,
+                                  scale: float,
+                                  offset: float,
+                                  spline_order: int) \
+        -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the source pixel indexes and interpolation weights
+    for a single axis. Indexes of pixels outside the source are -1.
+    """
+    # Same arithmetic as scipy's zoom/shift implementation
+    coords = (np.arange(size, dtype=np.float64) + offset / scale) * scale
+    is_valid = np.logical_and(coords >= 0, coords <= src_size - 1)
+    if spline_order == 0:
+        indexes = np.floor(coords + 0.5)
+        weights = np.zeros(size, dtype=np.float64)
+    else:
+        indexes = np.floor(coords)
+        weights = coords - indexes
+    indexes = np.where(is_valid, indexes, -1).astype(np.int64)
+    return indexes, weights
+
+
+@nb.njit(nogil=True, cache=True)
+def _transform_block_nearest(src: np.ndarray,
+                             j_indexes: np.ndarray,
+                             i_indexes: np.ndarray,
+                             fill_value: Union[int, float],
+                             dst: np.ndarray):
+    """
+    Nearest neighbour interpolation of the 3D array
+    *src* into *dst* along the last two axes.
+    """
+    for k in range(dst.shape[0]):
+        for j in range(dst.shape[1]):
+            src_j = j_indexes[j]
+            for i in range(dst.shape[2]):
+                src_i = i_indexes[i]
+                if src_j < 0 or src_i < 0:
+                    dst[k, j, i] = fill_value
+                else:
+                    dst[k, j, i] = src[k, src_j, src_i]
+
+
+@nb.njit(nogil=True, cache=True)
+def _transform_block_linear(src: np.ndarray,
+                            j_indexes: np.ndarray,
+                            j_weights: np.ndarray,
+                            i_indexes: np.ndarray,
+                            i_weights: np.ndarray,
+                            fill_value: float,
+                            dst: np.ndarray):
+    """
+    Bilinear interpolation of the 3D array *src* into *dst*
+    along the last two axes.
+    """
+    src_j_max = src.shape[1] - 1
+    src_i_max = src.shape[2] - 1
+    for k in range(dst.shape[0]):
+        for j in range(dst.shape[1]):
+            src_j0 = j_indexes[j]
+            src_j1 = _next_src_index(src_j0, src_j_max)
+            v = j_weights[j]
+            for i in range(dst.shape[2]):
+                src_i0 = i_indexes[i]
+                if src_j0 < 0 or src_i0 < 0:
+                    dst[k, j, i] = fill_value
+                    continue
+                src_i1 = _next_src_index(src_i0, src_i_max)
+                u = i_weights[i]
+                dst[k, j, i] = \
+                    (1.0 - v) * ((1.0 - u) * src[k, src_j0, src_i0]
+                                 + u * src[k, src_j0, src_i1]) \
+                    + v * ((1.0 - u) * src[k, src_j1, src_i0]
+                           + u * src[k, src_j1, src_i1])
+
+
+@nb.njit('int64(int64, int64)', nogil=True, inline='always')
+def _next_src_index(src_index: int, src_index_max: int) -> int:
+    # At the upper edge, the second pixel has zero weight.
+    # Like scipy, we mirror it, so NaN values propagate the same.
+    if src_index < src_index_max:
+        return src_index + 1
+    return max(src_index_max - 1, 0)
+
+
+def _has_nan(block: np.ndarray) -> bool:
+    """
+    Test whether *block* contains NaN values.
+    Unlike np.any(np.isnan(block)), no mask is allocated
+    for float32 and float64 blocks and the test stops
+    at the first NaN found.
+    """
+    if block.dtype in (np.float32, np.float64):
+        return _has_nan_3d(block.reshape((-1,) + block.shape[-2:]))
+    return bool(np.any(np.isnan(block)))
+
+
+@nb.njit(nogil=True, cache=True)
+def _has_nan_3d(block: np.ndarray) -> bool:
+    for k in range(block.shape[0]):
+        for j in range(block.shape[1]):
+            for i in range(block.shape[2]):
+                if np.isnan(block[k, j, i]):
+                    return True
+    return False
+
+
+def _recover_nan(scaled_im: np.ndarray,
+                 scaled_norm: np.ndarray) -> np.ndarray:
+    # Same as np.where(np.isclose(scaled_norm, 0.0), np.nan,
+    #                  scaled_im / scaled_norm)
+    # but in a single pass, without temporary arrays,
+    # and without division by zero.
+    # Note, *scaled_im* is modified in-place.
+    if scaled_im.dtype not in (np.float32, np.float64):
+        scaled_im = scaled_im.astype(np.float64)
+    scaled_im = np.ascontiguousarray(scaled_im)
+    scaled_norm = np.ascontiguousarray(scaled_norm)
+    _recover_nan_1d(scaled_im.reshape(-1), scaled_norm.reshape(-1))
+    return scaled_im
+
+
+@nb.njit(nogil=True, cache=True)
+def _recover_nan_1d(scaled_im: np.ndarray, scaled_norm: np.ndarray):
+    for k in range(scaled_im.size):
+        norm = scaled_norm[k]
+        if -1e-8 <= norm <= 1e-8:
+            scaled_im[k] = np.nan
+        else:
+            scaled_im[k] /= norm
 
 
 def resize_shape(shape: Sequence[int],
@@ -315,12 +823,21 @@ def _normalize_pair(pair: Optional[Sequence[float]],
                     ndim: int,
                     name: str) -> Tuple[int, ...]:
     if pair is None:
-        pair = [default, default]
+        pair = default, default
     elif isinstance(pair, (int, float)):
-        pair = [pair, pair]
+        pair = pair, pair
     elif len(pair) != 2:
         raise ValueError(f'illegal image {name}')
-    return (ndim - 2) * (default,) + tuple(pair)
+    elif not isinstance(pair, tuple):
+        pair = tuple(pair)
+    return _expand_pair(pair, default, ndim)
+
+
+@functools.lru_cache(maxsize=32)
+def _expand_pair(pair: Tuple[float, float],
+                 default: float,
+                 ndim: int) -> Tuple[float, ...]:
+    return (ndim - 2) * (default,) + pair
 
 
 def _normalize_shape(shape: Optional[Sequence[int]],
@@ -345,6 +862,10 @@ def _is_no_op(im: NDImage,
               scale: Sequence[float],
               offset: Sequence[float],
               shape: Tuple[int, ...]):
-    return shape == im.shape \
-           and all(math.isclose(s, 1) for s in scale) \
+    return shape == im.shape and _is_identity(scale, offset)
+
+
+def _is_identity(scale: Sequence[float],
+                 offset: Sequence[float]) -> bool:
+    return all(math.isclose(s, 1) for s in scale) \
            and all(math.isclose(o, 0) for o in offset)
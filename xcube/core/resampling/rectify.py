@@ -102,20 +102,32 @@ def rectify_dataset(source_ds: xr.Dataset,
     if target_gm is None:
         target_gm = source_gm.to_regular(tile_size=tile_size)
     elif compute_subset:
-        source_ds_subset = select_spatial_subset(
-            source_ds,
-            xy_bbox=target_gm.xy_bbox,
-            ij_border=1,
-            xy_border=0.5 * (target_gm.x_res + target_gm.y_res),
-            grid_mapping=source_gm
-        )
-        if source_ds_subset is None:
-            return None
-        if source_ds_subset is not source_ds:
-            # TODO: GridMapping.from_dataset() may be expensive.
-            #   Find a more effective way.
-            source_gm = GridMapping.from_dataset(source_ds_subset)
-            source_ds = source_ds_subset
+        x_var_name, y_var_name = source_gm.xy_var_names
+        if x_var_name not in source_ds or y_var_name not in source_ds:
+            # The x,y coordinates are provided by source_gm only,
+            # e.g., because they have been transformed into
+            # another CRS.
+            subset = _select_spatial_subset_from_gm(source_ds,
+                                                    source_gm,
+                                                    target_gm)
+            if subset is None:
+                return None
+            source_ds, source_gm = subset
+        else:
+            source_ds_subset = select_spatial_subset(
+                source_ds,
+                xy_bbox=target_gm.xy_bbox,
+                ij_border=1,
+                xy_border=0.5 * (target_gm.x_res + target_gm.y_res),
+                grid_mapping=source_gm
+            )
+            if source_ds_subset is None:
+                return None
+            if source_ds_subset is not source_ds:
+                # TODO: GridMapping.from_dataset() may be expensive.
+                #   Find a more effective way.
+                source_gm = GridMapping.from_dataset(source_ds_subset)
+                source_ds = source_ds_subset
 
     # if src_geo_coding.xy_var_names != output_geom.xy_var_names:
     #     output_geom = output_geom.derive(
@@ -176,6 +188,47 @@ def rectify_dataset(source_ds: xr.Dataset,
     return xr.Dataset(dst_vars, coords=dst_ds_coords, attrs=src_attrs)
 
 
+def _select_spatial_subset_from_gm(
+        source_ds: xr.Dataset,
+        source_gm: GridMapping,
+        target_gm: GridMapping
+) -> Optional[Tuple[xr.Dataset, GridMapping]]:
+    """
+    Select the spatial subset of *source_ds* that covers
+    *target_gm* using the x,y coordinates of *source_gm* only.
+
+    :param source_ds: Source dataset.
+    :param source_gm: Source grid mapping.
+    :param target_gm: Target grid mapping.
+    :return: A tuple comprising the dataset subset and its
+        grid mapping, or None if *source_ds* does not intersect
+        with *target_gm*.
+    """
+    ij_bbox = source_gm.ij_bbox_from_xy_bbox(
+        target_gm.xy_bbox,
+        ij_border=1,
+        xy_border=0.5 * (target_gm.x_res + target_gm.y_res)
+    )
+    if ij_bbox[0] == -1:
+        return None
+    width, height = source_gm.size
+    i_min, j_min, i_max, j_max = ij_bbox
+    if i_min > 0 or j_min > 0 or i_max < width - 1 or j_max < height - 1:
+        x_dim, y_dim = source_gm.xy_dim_names
+        ij_slices = {x_dim: slice(i_min, i_max + 1),
+                     y_dim: slice(j_min, j_max + 1)}
+        x_var_name, y_var_name = source_gm.xy_var_names
+        x_coords, y_coords = source_gm.xy_coords.isel(ij_slices)
+        source_gm = GridMapping.from_coords(
+            x_coords.reset_coords(drop=True).rename(x_var_name),
+            y_coords.reset_coords(drop=True).rename(y_var_name),
+            source_gm.crs,
+            tile_size=source_gm.tile_size
+        )
+        source_ds = source_ds.isel(ij_slices)
+    return source_ds, source_gm
+
+
 def _select_variables(
         source_ds: xr.Dataset,
         source_gm: GridMapping,
@@ -83,6 +83,11 @@ def resample_in_space(
         otherwise yield NaN during resampling.
         Default is True for floating point variables,
         and False for integer and bool variables.
+    * ``precision`` (numpy dtype) - An optional floating point
+        type, e.g. numpy.float32, used to compute the
+        interpolation of floating point variables of a larger
+        type. Results are converted back to the variable's type.
+        Default is None (= the variable's type).
 
     Note that *var_configs* is only used if the resampling involves
     an affine transformation. This is true if the CRS of
@@ -178,22 +183,43 @@ def resample_in_space(
                 xy_dim_names=source_gm.xy_dim_names,
                 var_configs=var_configs,
             )
-            downscaled_gm = GridMapping.from_dataset(
-                downscaled_dataset,
-                tile_size=source_gm.tile_size,
-                prefer_crs=source_gm.crs
-            )
+            x_var_name, y_var_name = source_gm.xy_var_names
+            if x_var_name in dataset and y_var_name in dataset:
+                downscaled_gm = GridMapping.from_dataset(
+                    downscaled_dataset,
+                    tile_size=source_gm.tile_size,
+                    prefer_crs=source_gm.crs
+                )
+            else:
+                # The source coordinates are not part of the dataset,
+                # e.g., because they have been transformed into
+                # another CRS, so downscale them separately.
+                x_coords, y_coords = source_gm.xy_coords
+                downscaled_xy_dataset = resample_dataset(
+                    xr.Dataset({x_var_name: x_coords.reset_coords(drop=True),
+                                y_var_name: y_coords.reset_coords(drop=True)}),
+                    ((x_scale, 1, 0), (1, y_scale, 0)),
+                    size=downscaled_size,
+                    tile_size=source_gm.tile_size,
+                    xy_dim_names=source_gm.xy_dim_names,
+                )
+                downscaled_gm = GridMapping.from_coords(
+                    downscaled_xy_dataset[x_var_name],
+                    downscaled_xy_dataset[y_var_name],
+                    source_gm.crs,
+                    tile_size=source_gm.tile_size
+                )
         return rectify_dataset(downscaled_dataset,
                                source_gm=downscaled_gm,
                                target_gm=target_gm)
 
     # If CRSes are not both geographic and their CRSes are different
     # transform the source_gm so its CRS matches the target CRS:
+    # The transformed coordinates are not added to the dataset,
+    # they are passed on by transformed_source_gm.
     transformed_source_gm = source_gm.transform(target_gm.crs)
-    transformed_x, transformed_y = transformed_source_gm.xy_coords
     reprojected_dataset = resample_in_space(
-        dataset.assign(transformed_x=transformed_x,
-                       transformed_y=transformed_y),
+        dataset,
         source_gm=transformed_source_gm,
         target_gm=target_gm
     )
@@ -195,6 +195,8 @@ class DataOpener(ABC):
     Dask arrays and will be loaded only on-demand.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_open_data_params_schema(self, data_id: str = None) \
             -> JsonObjectSchema:
@@ -235,6 +237,8 @@ class DataDeleter(ABC):
     are described by a JSON Schema.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_delete_data_params_schema(self, data_id: str = None) \
             -> JsonObjectSchema:
@@ -271,6 +275,8 @@ class DataWriter(DataDeleter, ABC):
     are described by a JSON Schema.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_write_data_params_schema(self) -> JsonObjectSchema:
         """
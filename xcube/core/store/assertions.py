@@ -25,6 +25,7 @@ import jsonschema
 
 from xcube.util.assertions import assert_instance
 from xcube.util.jsonschema import JsonObjectSchema
+from xcube.util.undefined import UNDEFINED
 from .error import DataStoreError
 
 
@@ -84,8 +85,24 @@ def _assert_valid(obj: Optional[Dict[str, Any]],
     if schema is not None:
         assert_instance(schema, JsonObjectSchema,
                         name=f'{name}_schema')
+        if _is_unconstrained(schema):
+            # Common case, e.g., for the default data store
+            # parameters schema; obj is valid anyway.
+            return
         try:
             validator(obj, schema)
         except jsonschema.ValidationError as e:
             raise DataStoreError(f'Invalid {kind}'
                                  f' detected: {e.message}') from e
+
+
+def _is_unconstrained(schema: JsonObjectSchema) -> bool:
+    """Test whether *schema* accepts any JSON object."""
+    return not schema.properties \
+        and not schema.required \
+        and schema.additional_properties in (None, True) \
+        and schema.min_properties is None \
+        and schema.max_properties is None \
+        and not schema.dependencies \
+        and schema.const is UNDEFINED \
+        and schema.enum is None
@@ -20,8 +20,9 @@
 # SOFTWARE.
 
 import copy
+import posixpath
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Tuple, Optional, List, Sequence
 
 import fsspec
 
@@ -49,6 +50,11 @@ COMMON_STORAGE_OPTIONS_SCHEMA_PROPERTIES = dict(
     asynchronous=JsonBooleanSchema(),
 )
 
+_COMMON_STORAGE_OPTIONS_SCHEMA = JsonObjectSchema(
+    properties=COMMON_STORAGE_OPTIONS_SCHEMA_PROPERTIES,
+    additional_properties=True,
+)
+
 PROTOCOL_PARAM_NAME = 'protocol'
 STORAGE_OPTIONS_PARAM_NAME = 'storage_options'
 FS_PARAM_NAME = 'fs'
@@ -58,20 +64,117 @@ ROOT_PARAM_NAME = 'root'
 class FsAccessor:
     """
     Base class for accessing some filesystem.
+
+    Subclasses should set the class attribute
+    ``PROTOCOL`` to their filesystem protocol.
     """
 
+    # Accessors carry no instance state.
+    __slots__ = ()
+
+    PROTOCOL: str = 'abstract'
+
     @classmethod
     def get_protocol(cls) -> str:
         """Get the filesystem protocol."""
-        return 'abstract'
+        return cls.PROTOCOL
 
     @classmethod
     def get_storage_options_schema(cls) -> JsonObjectSchema:
         """Get the JSON schema of the filesystem parameters."""
-        return JsonObjectSchema(
-            properties=COMMON_STORAGE_OPTIONS_SCHEMA_PROPERTIES,
-            additional_properties=True,
-        )
+        return _COMMON_STORAGE_OPTIONS_SCHEMA
+
+    @classmethod
+    def complete_storage_options(cls, storage_options: Dict[str, Any]) \
+            -> Dict[str, Any]:
+        """
+        Complete the given *storage_options* by defaults
+        specific to this filesystem.
+        The default implementation returns *storage_options* unchanged.
+
+        :param storage_options: The storage options.
+        :return: The completed storage options.
+        """
+        return storage_options
+
+    @classmethod
+    def scan(cls,
+             fs: fsspec.AbstractFileSystem,
+             path: str,
+             stat: bool = True) \
+            -> List[Tuple[str, bool, Optional[int], Optional[float]]]:
+        """
+        List the entries of directory *path* in filesystem *fs*
+        in a single pass.
+
+        The default implementation uses ``fs.ls(path, detail=True)``.
+        Subclasses may override it to use a cheaper, backend-specific
+        directory listing.
+
+        :param fs: The filesystem.
+        :param path: Path of the directory to be listed.
+        :param stat: Whether to also provide size and modification
+            time of the entries. If False, size and modification
+            time are None, which may avoid filesystem calls.
+        :return: A list of tuples (name, is_dir, size, mtime)
+            where name is the base name of an entry.
+        """
+        path = fs._strip_protocol(path).rstrip('/')
+        entries = []
+        for file_info in fs.ls(path, detail=True):
+            file_path = file_info['name'].rstrip('/')
+            if not file_path or file_path == path:
+                continue
+            size = file_info.get('size') if stat else None
+            mtime = file_info.get('mtime') if stat else None
+            entries.append((posixpath.basename(file_path),
+                            file_info.get('type') == 'directory',
+                            size,
+                            mtime))
+        return entries
+
+    @classmethod
+    def info_batch(cls,
+                   fs: fsspec.AbstractFileSystem,
+                   paths: Sequence[str]) \
+            -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get the information records of multiple *paths* in filesystem *fs*.
+
+        The default implementation calls ``fs.info()`` for each path.
+        Subclasses may override it to fetch the records in fewer
+        round trips.
+
+        :param fs: The filesystem.
+        :param paths: The paths.
+        :return: A dictionary that maps each path to its information
+            record, or to None if the path does not exist.
+            An information record comprises at least the
+            entries "name", "size", and "type", like the ones
+            returned by ``fs.info()``.
+        """
+        infos = {}
+        for path in paths:
+            try:
+                infos[path] = fs.info(path)
+            except FileNotFoundError:
+                infos[path] = None
+        return infos
+
+    @classmethod
+    def exists_batch(cls,
+                     fs: fsspec.AbstractFileSystem,
+                     paths: Sequence[str]) -> Dict[str, bool]:
+        """
+        Check whether multiple *paths* exist in filesystem *fs*.
+
+        :param fs: The filesystem.
+        :param paths: The paths.
+        :return: A dictionary that maps each path to
+            whether it exists.
+        """
+        return {path: info is not None
+                for path, info in cls.info_batch(fs, paths).items()}
 
     @classmethod
     def load_fs(cls, params: Dict[str, Any]) \
@@ -124,11 +227,16 @@ class FsAccessor:
             bool(storage_options.pop('use_listings_cache', False)
                  if storage_options else False)
 
+        storage_options = cls.complete_storage_options(storage_options or {})
+
         try:
+            # Note, fsspec caches filesystem instances, so equal
+            # storage options will share the same filesystem and
+            # hence its connections.
             return (
                 fsspec.filesystem(protocol,
                                   use_listings_cache=use_listings_cache,
-                                  **(storage_options or {})),
+                                  **storage_options),
                 root,
                 params
             )
@@ -25,7 +25,6 @@ from typing import Tuple, Optional
 import fsspec
 import rasterio
 import rioxarray
-import s3fs
 import xarray as xr
 import zarr
 
@@ -375,7 +374,7 @@ class DatasetGeoTiffFsDataAccessor(DatasetFsDataAccessor):
 
     @classmethod
     def create_env_session(cls, fs):
-        if isinstance(fs, s3fs.S3FileSystem):
+        if cls._is_s3_fs(fs):
             return rasterio.env.Env(aws_secret_access_key=fs.token,
                                     aws_access_key_id=fs.key,
                                     aws_session_token=fs.token,
@@ -388,6 +387,16 @@ class DatasetGeoTiffFsDataAccessor(DatasetFsDataAccessor):
         else:
             return rasterio.env.NullContextManager()
 
+    @classmethod
+    def _is_s3_fs(cls, fs) -> bool:
+        protocols = (fs.protocol,) if isinstance(fs.protocol, str) \
+            else fs.protocol
+        if 's3' not in protocols:
+            # Don't import s3fs, which is expensive, unless required
+            return False
+        import s3fs
+        return isinstance(fs, s3fs.S3FileSystem)
+
     @classmethod
     def open_dataset_with_rioxarray(cls, file_path, overview_level,
                                     tile_size) -> rioxarray.raster_array:
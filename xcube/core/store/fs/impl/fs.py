@@ -19,120 +19,249 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import asyncio
+import os
+import posixpath
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import fsspec
+import fsspec.asyn
+
 from xcube.util.jsonschema import JsonBooleanSchema
 from xcube.util.jsonschema import JsonObjectSchema
 from xcube.util.jsonschema import JsonStringSchema
 from ..accessor import COMMON_STORAGE_OPTIONS_SCHEMA_PROPERTIES
 from ..accessor import FsAccessor
+from ..helpers import is_local_fs
 
 
-class FileFsAccessor(FsAccessor):
+DEFAULT_S3_MAX_POOL_CONNECTIONS = 50
 
-    @classmethod
-    def get_protocol(cls) -> str:
-        return 'file'
+# The storage options schemas are static, so we create them only once.
 
-    @classmethod
-    def get_storage_options_schema(cls) -> JsonObjectSchema:
-        return JsonObjectSchema(
+_FILE_STORAGE_OPTIONS_SCHEMA = JsonObjectSchema(
+    properties=dict(
+        auto_mkdirs=JsonBooleanSchema(
+            description='Whether, when opening a file, the directory'
+                        ' containing it should be created (if it'
+                        ' doesn\'t already exist).'),
+        **COMMON_STORAGE_OPTIONS_SCHEMA_PROPERTIES
+    ),
+    additional_properties=True,
+)
+
+# We may use here AWS S3 defaults as described in
+#   https://boto3.amazonaws.com/v1/documentation/api/
+#   latest/guide/configuration.html
+_S3_STORAGE_OPTIONS_SCHEMA = JsonObjectSchema(
+    properties=dict(
+        anon=JsonBooleanSchema(
+            title='Whether to anonymously connect to AWS S3.'
+        ),
+        key=JsonStringSchema(
+            min_length=1,
+            title='AWS access key identifier.',
+            description='Can also be set in profile section'
+                        ' of ~/.aws/config, or by environment'
+                        ' variable AWS_ACCESS_KEY_ID.'
+        ),
+        secret=JsonStringSchema(
+            min_length=1,
+            title='AWS secret access key.',
+            description='Can also be set in profile section'
+                        ' of ~/.aws/config, or by environment'
+                        ' variable AWS_SECRET_ACCESS_KEY.'
+        ),
+        token=JsonStringSchema(
+            min_length=1,
+            title='Session token.',
+            description='Can also be set in profile section'
+                        ' of ~/.aws/config, or by environment'
+                        ' variable AWS_SESSION_TOKEN.'
+        ),
+        use_ssl=JsonBooleanSchema(
+            description='Whether to use SSL in connections to S3;'
+                        ' may be faster without, but insecure.',
+            default=True,
+        ),
+        requester_pays=JsonBooleanSchema(
+            description='If "RequesterPays" buckets are supported.',
+            default=False,
+        ),
+        s3_additional_kwargs=JsonObjectSchema(
+            description='parameters that are used when calling'
+                        ' S3 API methods. Typically used for'
+                        ' things like "ServerSideEncryption".',
+            additional_properties=True,
+        ),
+        config_kwargs=JsonObjectSchema(
+            description='Parameters for the botocore client'
+                        ' configuration, e.g.,'
+                        ' "max_pool_connections".',
+            additional_properties=True,
+        ),
+        client_kwargs=JsonObjectSchema(
+            description='Parameters for the botocore client.',
             properties=dict(
-                auto_mkdirs=JsonBooleanSchema(
-                    description='Whether, when opening a file, the directory'
-                                ' containing it should be created (if it'
-                                ' doesn\'t already exist).'),
-                **COMMON_STORAGE_OPTIONS_SCHEMA_PROPERTIES
+                endpoint_url=JsonStringSchema(
+                    min_length=1,
+                    format='uri',
+                    title='Alternative endpoint URL.'
+                ),
+                # bucket_name=JsonStringSchema(
+                #     min_length=1,
+                #     title='Name of the bucket'
+                # ),
+                profile_name=JsonStringSchema(
+                    min_length=1,
+                    title='Name of the AWS configuration profile',
+                    description='Section name with within'
+                                ' ~/.aws/config file,'
+                                ' which provides AWS configurations'
+                                ' and credentials.'
+                ),
+                region_name=JsonStringSchema(
+                    min_length=1,
+                    title='AWS storage region name'
+                ),
             ),
             additional_properties=True,
-        )
+        ),
+        **COMMON_STORAGE_OPTIONS_SCHEMA_PROPERTIES,
+    ),
+    additional_properties=True,
+)
 
 
-class MemoryFsAccessor(FsAccessor):
+class FileFsAccessor(FsAccessor):
+    __slots__ = ()
+
+    PROTOCOL = 'file'
 
     @classmethod
-    def get_protocol(cls) -> str:
-        return 'memory'
+    def get_storage_options_schema(cls) -> JsonObjectSchema:
+        return _FILE_STORAGE_OPTIONS_SCHEMA
+
+    @classmethod
+    def scan(cls,
+             fs: fsspec.AbstractFileSystem,
+             path: str,
+             stat: bool = True) \
+            -> List[Tuple[str, bool, Optional[int], Optional[float]]]:
+        if not is_local_fs(fs):
+            return super().scan(fs, path, stat=stat)
+        # os.scandir() yields the entry types from the directory
+        # listing itself, so unlike fs.ls(path, detail=True)
+        # we need no os.stat() call per entry unless stat is True.
+        entries = []
+        try:
+            with os.scandir(fs._strip_protocol(path)) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                        if stat:
+                            stat_result = entry.stat()
+                            size = stat_result.st_size
+                            mtime = stat_result.st_mtime
+                        else:
+                            size = mtime = None
+                    except FileNotFoundError:
+                        # Entry has been removed meanwhile
+                        continue
+                    entries.append((entry.name, is_dir, size, mtime))
+        except NotADirectoryError:
+            pass
+        return entries
+
+    @classmethod
+    def info_batch(cls,
+                   fs: fsspec.AbstractFileSystem,
+                   paths: Sequence[str]) \
+            -> Dict[str, Optional[Dict[str, Any]]]:
+        if not is_local_fs(fs):
+            return super().info_batch(fs, paths)
+        # Group paths by parent directory, so we
+        # need only a single listing per directory.
+        paths_by_dir: Dict[str, List[Tuple[str, str]]] = {}
+        infos: Dict[str, Optional[Dict[str, Any]]] = {}
+        for path in paths:
+            local_path = fs._strip_protocol(path)
+            dir_path, name = posixpath.split(local_path)
+            if not name:
+                # Filesystem root
+                infos.update(super().info_batch(fs, [path]))
+                continue
+            paths_by_dir.setdefault(dir_path, []).append((path, name))
+        for dir_path, dir_paths in paths_by_dir.items():
+            entries = {name: (is_dir, size, mtime)
+                       for name, is_dir, size, mtime
+                       in cls.scan(fs, dir_path)} \
+                if os.path.isdir(dir_path) else {}
+            for path, name in dir_paths:
+                entry = entries.get(name)
+                if entry is None:
+                    infos[path] = None
+                    continue
+                is_dir, size, mtime = entry
+                infos[path] = dict(
+                    name=posixpath.join(dir_path, name),
+                    size=size,
+                    type='directory' if is_dir else 'file',
+                    mtime=mtime,
+                )
+        return {path: infos[path] for path in paths}
+
+
+class MemoryFsAccessor(FsAccessor):
+    __slots__ = ()
+
+    PROTOCOL = 'memory'
 
 
 class S3FsAccessor(FsAccessor):
+    __slots__ = ()
 
-    @classmethod
-    def get_protocol(cls) -> str:
-        return 's3'
+    PROTOCOL = 's3'
 
     @classmethod
     def get_storage_options_schema(cls) -> JsonObjectSchema:
-        # We may use here AWS S3 defaults as described in
-        #   https://boto3.amazonaws.com/v1/documentation/api/
-        #   latest/guide/configuration.html
-        return JsonObjectSchema(
-            properties=dict(
-                anon=JsonBooleanSchema(
-                    title='Whether to anonymously connect to AWS S3.'
-                ),
-                key=JsonStringSchema(
-                    min_length=1,
-                    title='AWS access key identifier.',
-                    description='Can also be set in profile section'
-                                ' of ~/.aws/config, or by environment'
-                                ' variable AWS_ACCESS_KEY_ID.'
-                ),
-                secret=JsonStringSchema(
-                    min_length=1,
-                    title='AWS secret access key.',
-                    description='Can also be set in profile section'
-                                ' of ~/.aws/config, or by environment'
-                                ' variable AWS_SECRET_ACCESS_KEY.'
-                ),
-                token=JsonStringSchema(
-                    min_length=1,
-                    title='Session token.',
-                    description='Can also be set in profile section'
-                                ' of ~/.aws/config, or by environment'
-                                ' variable AWS_SESSION_TOKEN.'
-                ),
-                use_ssl=JsonBooleanSchema(
-                    description='Whether to use SSL in connections to S3;'
-                                ' may be faster without, but insecure.',
-                    default=True,
-                ),
-                requester_pays=JsonBooleanSchema(
-                    description='If "RequesterPays" buckets are supported.',
-                    default=False,
-                ),
-                s3_additional_kwargs=JsonObjectSchema(
-                    description='parameters that are used when calling'
-                                ' S3 API methods. Typically used for'
-                                ' things like "ServerSideEncryption".',
-                    additional_properties=True,
-                ),
-                client_kwargs=JsonObjectSchema(
-                    description='Parameters for the botocore client.',
-                    properties=dict(
-                        endpoint_url=JsonStringSchema(
-                            min_length=1,
-                            format='uri',
-                            title='Alternative endpoint URL.'
-                        ),
-                        # bucket_name=JsonStringSchema(
-                        #     min_length=1,
-                        #     title='Name of the bucket'
-                        # ),
-                        profile_name=JsonStringSchema(
-                            min_length=1,
-                            title='Name of the AWS configuration profile',
-                            description='Section name with within'
-                                        ' ~/.aws/config file,'
-                                        ' which provides AWS configurations'
-                                        ' and credentials.'
-                        ),
-                        region_name=JsonStringSchema(
-                            min_length=1,
-                            title='AWS storage region name'
-                        ),
-                    ),
-                    additional_properties=True,
-                ),
-                **COMMON_STORAGE_OPTIONS_SCHEMA_PROPERTIES,
-            ),
-            additional_properties=True,
-        )
+        return _S3_STORAGE_OPTIONS_SCHEMA
+
+    @classmethod
+    def complete_storage_options(cls, storage_options: Dict[str, Any]) \
+            -> Dict[str, Any]:
+        # botocore's default of 10 pooled connections is easily
+        # exceeded by dask workers reading chunks concurrently.
+        config_kwargs = dict(storage_options.get('config_kwargs') or {})
+        config_kwargs.setdefault('max_pool_connections',
+                                 DEFAULT_S3_MAX_POOL_CONNECTIONS)
+        return dict(storage_options, config_kwargs=config_kwargs)
+
+    @classmethod
+    def info_batch(cls,
+                   fs: fsspec.AbstractFileSystem,
+                   paths: Sequence[str]) \
+            -> Dict[str, Optional[Dict[str, Any]]]:
+        if not isinstance(fs, fsspec.asyn.AsyncFileSystem) \
+                or fs.asynchronous:
+            return super().info_batch(fs, paths)
+        # Issue all requests concurrently on the
+        # filesystem's event loop rather than one by one.
+        paths = list(paths)
+        results = fsspec.asyn.sync(fs.loop, _gather_infos, fs, paths)
+        infos = {}
+        for path, result in zip(paths, results):
+            if isinstance(result, FileNotFoundError):
+                infos[path] = None
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                infos[path] = result
+        return infos
+
+
+async def _gather_infos(fs: fsspec.asyn.AsyncFileSystem,
+                        paths: List[str]) -> List[Any]:
+    # noinspection PyProtectedMember
+    return await asyncio.gather(*[fs._info(path) for path in paths],
+                                return_exceptions=True)
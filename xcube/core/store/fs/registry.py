@@ -19,7 +19,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Type, Dict, Optional, Any
+from typing import Type, Dict, Optional, Any, Tuple
 
 import fsspec
 
@@ -45,6 +45,12 @@ from ..error import DataStoreError
 
 _FS_ACCESSOR_CLASSES: Dict[str, Type[FsAccessor]] = {}
 
+# Classes dynamically derived from the registered classes.
+# We create them only once, so lookups are mere dictionary probes.
+_FS_DATA_ACCESSOR_CLASS_CACHE: Dict[Tuple[str, str],
+                                    Type[FsDataAccessor]] = {}
+_FS_DATA_STORE_CLASS_CACHE: Dict[str, Type[FsDataStore]] = {}
+
 
 def register_fs_accessor_class(
         fs_accessor_class: Type[FsAccessor]
@@ -57,6 +63,9 @@ def register_fs_accessor_class(
     """
     protocol = fs_accessor_class.get_protocol()
     _FS_ACCESSOR_CLASSES[protocol] = fs_accessor_class
+    # Derived classes may refer to a former accessor class.
+    _FS_DATA_ACCESSOR_CLASS_CACHE.clear()
+    _FS_DATA_STORE_CLASS_CACHE.clear()
 
 
 for cls in (FileFsAccessor, S3FsAccessor, MemoryFsAccessor):
@@ -86,11 +95,12 @@ def get_fs_accessor_class(protocol: str) -> Type[FsAccessor]:
             ) from e
 
         class FsAccessorClass(FsAccessor):
-            @classmethod
-            def get_protocol(cls) -> str:
-                return protocol
+            __slots__ = ()
+
+            PROTOCOL = protocol
 
         fs_accessor_class = FsAccessorClass
+        _FS_ACCESSOR_CLASSES[protocol] = fs_accessor_class
     return fs_accessor_class
 
 
@@ -117,6 +127,7 @@ def register_fs_data_accessor_class(
     format_id = fs_data_accessor_class.get_format_id()
     key = f'{data_type.alias}:{format_id}'
     _FS_DATA_ACCESSOR_CLASSES[key] = fs_data_accessor_class
+    _FS_DATA_ACCESSOR_CLASS_CACHE.clear()
 
 
 for cls in (
@@ -147,6 +158,11 @@ def get_fs_data_accessor_class(protocol: str,
     :return: A class that derives from :class:FsAccessor
     """
     accessor_id = f'{data_type_alias}:{format_id}'
+    cache_key = protocol, accessor_id
+    fs_data_accessor_class = _FS_DATA_ACCESSOR_CLASS_CACHE.get(cache_key)
+    if fs_data_accessor_class is not None:
+        return fs_data_accessor_class
+
     data_accessor_class = _FS_DATA_ACCESSOR_CLASSES.get(accessor_id)
     if data_accessor_class is None:
         raise DataStoreError(f'Combination of data type {data_type_alias!r}'
@@ -159,6 +175,7 @@ def get_fs_data_accessor_class(protocol: str,
 
     # Should we set __name_ and __doc__ properties here?
 
+    _FS_DATA_ACCESSOR_CLASS_CACHE[cache_key] = FsDataAccessorClass
     return FsDataAccessorClass
 
 
@@ -173,6 +190,10 @@ def get_fs_data_store_class(protocol: str) -> Type[FsDataStore]:
         for example "file", "s3", "memory".
     :return: A class that derives from :class:FsDataStore
     """
+    fs_data_store_class = _FS_DATA_STORE_CLASS_CACHE.get(protocol)
+    if fs_data_store_class is not None:
+        return fs_data_store_class
+
     fs_accessor_class = get_fs_accessor_class(protocol)
 
     class FsDataStoreClass(fs_accessor_class, FsDataStore):
@@ -180,6 +201,7 @@ def get_fs_data_store_class(protocol: str) -> Type[FsDataStore]:
 
     # Should we set set __name_ and __doc__ properties here?
 
+    _FS_DATA_STORE_CLASS_CACHE[protocol] = FsDataStoreClass
     return FsDataStoreClass
 
 
@@ -19,13 +19,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import copy
 import os.path
 import pathlib
 import uuid
 import warnings
 from threading import RLock
 from typing import Optional, Iterator, Any, Tuple, List, Dict, \
-    Union, Container, Callable
+    Union, Container, Callable, Sequence
 
 import fsspec
 import geopandas as gpd
@@ -93,6 +94,21 @@ _FORMAT_TO_DATA_TYPE_ALIASES = {
     'shapefile': (GEO_DATA_FRAME_TYPE.alias,),
 }
 
+# All data type aliases in order of first occurrence, hence
+# the default data type DATASET_TYPE comes first.
+_DATA_TYPE_ALIASES: Tuple[str, ...] = tuple(dict.fromkeys(
+    data_type_alias
+    for data_type_aliases in _FORMAT_TO_DATA_TYPE_ALIASES.values()
+    for data_type_alias in data_type_aliases
+))
+
+
+# Maximum number of data descriptors cached per data store
+_DESCRIPTOR_CACHE_SIZE = 256
+
+# Maximum number of open parameters schemas cached per data store
+_OPEN_PARAMS_SCHEMA_CACHE_SIZE = 256
+
 
 class BaseFsDataStore(DefaultSearchMixin, MutableDataStore):
     """
@@ -122,6 +138,12 @@ class BaseFsDataStore(DefaultSearchMixin, MutableDataStore):
         self._max_depth = max_depth
         self._read_only = read_only
         self._lock = RLock()
+        # Maps data_id to tuples (version, descriptor)
+        self._descriptor_cache: Dict[str, Tuple[Any, DataDescriptor]] = {}
+        # Maps (opener class, data_id) to open parameters schemas
+        # used for validation
+        self._open_params_schema_cache: Dict[Tuple[type, Optional[str]],
+                                             JsonObjectSchema] = {}
 
     @property
     def protocol(self) -> str:
@@ -189,11 +211,7 @@ class BaseFsDataStore(DefaultSearchMixin, MutableDataStore):
 
     @classmethod
     def get_data_types(cls) -> Tuple[str, ...]:
-        return tuple(set(
-            data_type
-            for types_tuple in _FORMAT_TO_DATA_TYPE_ALIASES.values()
-            for data_type in types_tuple
-        ))
+        return _DATA_TYPE_ALIASES
 
     def get_data_types_for_data(self, data_id: str) -> Tuple[str, ...]:
         self._assert_valid_data_id(data_id)
@@ -225,17 +243,49 @@ class BaseFsDataStore(DefaultSearchMixin, MutableDataStore):
             return self.fs.exists(fs_path)
         return False
 
+    def get_data_attrs(self,
+                       data_ids: Sequence[str],
+                       include_attrs: Container[str] = None,
+                       data_type: DataTypeLike = None) \
+            -> Dict[str, Dict[str, Any]]:
+        data_type = DataType.normalize(data_type)
+        fs_paths = {data_id: self._convert_data_id_into_fs_path(data_id)
+                    for data_id in data_ids
+                    if data_id and self._is_data_specified(data_id,
+                                                           data_type)}
+        exists = self._exists_batch(list(fs_paths.values()))
+        # TODO: do not ignore names in include_attrs
+        return {data_id: {}
+                for data_id, fs_path in fs_paths.items()
+                if exists[fs_path]}
+
     def describe_data(self, data_id: str, data_type: DataTypeLike = None) \
             -> DataDescriptor:
         self._assert_valid_data_id(data_id)
         self._assert_data_specified(data_id, data_type)
+        # Opening the data is expensive, so we reuse descriptors
+        # as long as the data's modification time is unchanged.
+        version = self._get_data_version(data_id)
+        if version is not None:
+            cached = self._descriptor_cache.get(data_id)
+            if cached is not None and cached[0] == version:
+                return copy.deepcopy(cached[1])
         # TODO: optimize me, self.open_data() may be very slow!
         #   For Zarr, try using self.fs to load metadata only
         #   rather than instantiating xr.Dataset instances which
         #   can be very expensive for large Zarrs (xarray 0.18.2),
         #   especially in S3 filesystems.
         data = self.open_data(data_id)
-        return new_data_descriptor(data_id, data, require=True)
+        descriptor = new_data_descriptor(data_id, data, require=True)
+        if version is not None:
+            # We cache and return copies of the descriptor only,
+            # as clients may modify the descriptors they receive.
+            with self._lock:
+                if len(self._descriptor_cache) >= _DESCRIPTOR_CACHE_SIZE:
+                    self._descriptor_cache.clear()
+                self._descriptor_cache[data_id] = (version,
+                                                   copy.deepcopy(descriptor))
+        return descriptor
 
     def get_data_opener_ids(self,
                             data_id: str = None,
@@ -273,8 +323,32 @@ class BaseFsDataStore(DefaultSearchMixin, MutableDataStore):
                   opener_id: str = None,
                   **open_params) -> xr.Dataset:
         opener = self._find_opener(opener_id=opener_id, data_id=data_id)
-        open_params_schema = self._get_open_data_params_schema(opener,
-                                                               data_id)
+        return self._open_data(opener, data_id, **open_params)
+
+    def open_data_many(self,
+                       data_ids: Sequence[str],
+                       opener_id: str = None,
+                       **open_params) -> Iterator[Any]:
+        # Data openers are stateless, so we create one per
+        # opener identifier only and reuse it for all data resources.
+        openers: Dict[str, DataOpener] = {}
+        for data_id in data_ids:
+            data_opener_id = opener_id or self._find_opener_id(
+                data_id=data_id
+            )
+            opener = openers.get(data_opener_id)
+            if opener is None:
+                opener = new_data_opener(data_opener_id)
+                openers[data_opener_id] = opener
+            yield self._open_data(opener, data_id, **open_params)
+
+    def _open_data(self,
+                   opener: DataOpener,
+                   data_id: str,
+                   **open_params) -> Any:
+        open_params_schema = self._get_cached_open_data_params_schema(
+            opener, data_id
+        )
         assert_valid_params(open_params,
                             name='open_params',
                             schema=open_params_schema)
@@ -327,6 +401,7 @@ class BaseFsDataStore(DefaultSearchMixin, MutableDataStore):
         assert_true(fs_path == written_fs_path,
                     message='FsDataAccessor implementations must '
                             'return the data_id passed in.')
+        self._forget_cached_data(data_id)
         # Return original data_id (which is a relative path).
         # Note: it would be cleaner to return written_fs_path
         # here, but it is an absolute path.
@@ -355,6 +430,7 @@ class BaseFsDataStore(DefaultSearchMixin, MutableDataStore):
                            fs=self.fs,
                            root=self.root,
                            **delete_params)
+        self._forget_cached_data(data_id)
 
     def register_data(self, data_id: str, data: Any):
         # We don't need this as we use the filesystem
@@ -367,6 +443,52 @@ class BaseFsDataStore(DefaultSearchMixin, MutableDataStore):
     ###############################################################
     # Implementation helpers
 
+    def _get_data_version(self, data_id: str) -> Optional[Any]:
+        """
+        Get a value that changes whenever the data resource
+        *data_id* is modified, or None if there is no such value.
+        """
+        fs_path = self._convert_data_id_into_fs_path(data_id)
+        try:
+            info = self.fs.info(fs_path)
+            if info.get('type') == 'directory':
+                # Modifications of nested files, e.g., of a Zarr's
+                # arrays, do not change a directory's modification
+                # time, so we rely on consolidated Zarr metadata,
+                # which is read anyway, if it exists.
+                info = self.fs.info(fs_path + '/.zmetadata')
+        except FileNotFoundError:
+            return None
+        # "mtime" is provided by local filesystems,
+        # "LastModified" by S3.
+        return info.get('mtime', info.get('LastModified'))
+
+    def _forget_cached_data(self, data_id: str):
+        with self._lock:
+            self._descriptor_cache.pop(data_id, None)
+            # Openers may adapt their schemas to the actual data
+            for key in [key for key in self._open_params_schema_cache
+                        if key[1] == data_id]:
+                del self._open_params_schema_cache[key]
+
+    def _get_cached_open_data_params_schema(self,
+                                            opener: DataOpener,
+                                            data_id: Optional[str]) \
+            -> JsonObjectSchema:
+        # Building open parameters schemas may be expensive, so
+        # we reuse them for validation. We don't return them from
+        # get_open_data_params_schema(), as clients may modify them.
+        key = type(opener), data_id
+        schema = self._open_params_schema_cache.get(key)
+        if schema is None:
+            schema = self._get_open_data_params_schema(opener, data_id)
+            with self._lock:
+                if len(self._open_params_schema_cache) \
+                        >= _OPEN_PARAMS_SCHEMA_CACHE_SIZE:
+                    self._open_params_schema_cache.clear()
+                self._open_params_schema_cache[key] = schema
+        return schema
+
     @staticmethod
     def _get_open_data_params_schema(opener: DataOpener,
                                      data_id: str):
@@ -605,6 +727,20 @@ class BaseFsDataStore(DefaultSearchMixin, MutableDataStore):
                 return ''
         return data_path[dot_pos:]
 
+    def _scan_dir(self, dir_path: str) -> List[Tuple[str, bool, Any, Any]]:
+        """
+        List the entries of directory *dir_path* as tuples
+        (name, is_dir, size, mtime). Size and modification time
+        may be None.
+        """
+        return FsAccessor.scan(self.fs, dir_path, stat=False)
+
+    def _exists_batch(self, fs_paths: List[str]) -> Dict[str, bool]:
+        """
+        Check whether the given filesystem paths exist.
+        """
+        return FsAccessor.exists_batch(self.fs, fs_paths)
+
     def _generate_data_ids(self,
                            dir_path: str,
                            data_type: DataType,
@@ -613,18 +749,11 @@ class BaseFsDataStore(DefaultSearchMixin, MutableDataStore):
         root = self.root + ('/' + dir_path if dir_path else '')
         if not self.fs.exists(root):
             return
-        # noinspection PyArgumentEqualDefault
-        for file_info in self.fs.ls(root, detail=True):
-            file_path: str = file_info['name']
-            if file_path.startswith(self.root):
-                file_path = file_path[len(self.root) + 1:]
-            elif file_path.startswith('/' + self.root):
-                file_path = file_path[len(self.root) + 2:]
-            if not file_path:
-                continue
+        for name, is_dir, _, _ in self._scan_dir(root):
+            file_path = dir_path + '/' + name if dir_path else name
             if self._is_data_specified(file_path, data_type):
                 yield (file_path, {}) if return_tuples else file_path
-            elif file_info.get('type') == 'directory' \
+            elif is_dir \
                     and (self._max_depth is None
                          or current_depth < self._max_depth):
                 yield from self._generate_data_ids(file_path,
@@ -670,6 +799,14 @@ class FsDataStore(BaseFsDataStore, FsAccessor):
     def storage_options(self) -> Dict[str, Any]:
         return self._storage_options
 
+    def _scan_dir(self, dir_path: str) -> List[Tuple[str, bool, Any, Any]]:
+        # Use the possibly more efficient directory listing
+        # of our concrete filesystem accessor.
+        return self.scan(self.fs, dir_path, stat=False)
+
+    def _exists_batch(self, fs_paths: List[str]) -> Dict[str, bool]:
+        return self.exists_batch(self.fs, fs_paths)
+
     def _load_fs(self) -> fsspec.AbstractFileSystem:
         # Note, this is invoked only once per store instance.
         fs, _, _ = self.load_fs(
@@ -12,6 +12,8 @@ class DataSearcher(ABC):
     Allow searching data in a data store.
     """
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def get_search_params_schema(cls,
@@ -19,11 +19,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import itertools
 from abc import abstractmethod, ABC
 from typing import Iterator, Tuple, Any, Optional, \
-    List, Type, Dict, Union, Container
+    List, Type, Dict, Union, Container, Sequence
 
 from xcube.constants import EXTENSION_POINT_DATA_STORES
+from xcube.util.assertions import assert_true
 from xcube.util.extension import Extension
 from xcube.util.extension import ExtensionPredicate
 from xcube.util.extension import ExtensionRegistry
@@ -61,7 +63,7 @@ def new_data_store(data_store_id: str,
         data_store_id,
         extension_registry=extension_registry
     )
-    data_store_params_schema = data_store_class.get_data_store_params_schema()
+    data_store_params_schema = _get_data_store_params_schema(data_store_class)
     assert_valid_params(data_store_params,
                         name='data_store_params',
                         schema=data_store_params_schema)
@@ -76,18 +78,23 @@ def get_data_store_class(
     """
     Get the class for the data store identified by *data_store_id*.
 
+    Data store classes are usually registered using a component
+    loader, e.g., one created by :func:xcube.util.extension.import_component,
+    so that the module that defines a data store class is imported
+    only when the class is requested for the first time.
+
     :param data_store_id: A data store identifier.
     :param extension_registry: Optional extension registry.
         If not given, the global extension registry will be used.
     :return: The class for the data store.
     """
     extension_registry = extension_registry or get_extension_registry()
-    if not extension_registry.has_extension(EXTENSION_POINT_DATA_STORES,
-                                            data_store_id):
+    extension = extension_registry.get_extension(EXTENSION_POINT_DATA_STORES,
+                                                 data_store_id)
+    if extension is None:
         raise DataStoreError(f'Unknown data store "{data_store_id}"'
                              f' (may be due to missing xcube plugin)')
-    return extension_registry.get_component(EXTENSION_POINT_DATA_STORES,
-                                            data_store_id)
+    return extension.component
 
 
 def get_data_store_params_schema(
@@ -110,6 +117,23 @@ def get_data_store_params_schema(
     return data_store_class.get_data_store_params_schema()
 
 
+# Data store parameter schemas used for validation, keyed by data store
+# class. get_data_store_params_schema() may be expensive, e.g., it
+# deep-copies schemas for filesystem data stores. We use the cached
+# schemas only internally, as clients may modify the schema instances
+# returned by get_data_store_params_schema().
+_DATA_STORE_PARAMS_SCHEMAS: Dict[type, JsonObjectSchema] = {}
+
+
+def _get_data_store_params_schema(data_store_class: type) \
+        -> JsonObjectSchema:
+    schema = _DATA_STORE_PARAMS_SCHEMAS.get(data_store_class)
+    if schema is None:
+        schema = data_store_class.get_data_store_params_schema()
+        _DATA_STORE_PARAMS_SCHEMAS[data_store_class] = schema
+    return schema
+
+
 def find_data_store_extensions(
         predicate: ExtensionPredicate = None,
         extension_registry: Optional[ExtensionRegistry] = None
@@ -150,6 +174,10 @@ class DataStore(DataOpener, DataSearcher, ABC):
     mutable data stores must implement.
     """
 
+    # Interfaces carry no instance state. Subclasses that
+    # declare their own __slots__ won't get a __dict__.
+    __slots__ = ()
+
     @classmethod
     def get_data_store_params_schema(cls) -> JsonObjectSchema:
         """
@@ -237,6 +265,130 @@ class DataStore(DataOpener, DataSearcher, ABC):
         :raise DataStoreError: If an error occurs.
         """
 
+    def get_data_ids_page(self,
+                          offset: int = 0,
+                          limit: int = 100,
+                          data_type: DataTypeLike = None,
+                          include_attrs: Container[str] = None) -> \
+            Union[List[str], List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Get a page of at most *limit* data resource identifiers,
+        skipping the first *offset* ones. Clients such as viewers
+        can use it to show the first results of large stores early.
+
+        The items of the returned list are the ones that
+        :meth:get_data_ids would return for the same *data_type*
+        and *include_attrs*.
+
+        The default implementation takes the page from the iterator
+        returned by :meth:get_data_ids, so it requires no more than
+        *offset* + *limit* items from it. Store implementations that
+        can fetch pages from their backends more efficiently
+        should override this method.
+
+        :param offset: Number of identifiers to be skipped.
+        :param limit: Maximum number of identifiers to be returned.
+        :param data_type: If given, only data identifiers that are
+            available as this type are returned.
+        :param include_attrs: A sequence of names of attributes to
+            be returned for each dataset identifier.
+        :return: A list of identifiers or of tuples (*data_id*, *attrs*)
+            comprising at most *limit* items.
+        :raise DataStoreError: If an error occurs.
+        """
+        assert_true(offset >= 0, 'offset must not be negative')
+        assert_true(limit >= 0, 'limit must not be negative')
+        return list(itertools.islice(
+            self.get_data_ids(data_type=data_type,
+                              include_attrs=include_attrs),
+            offset,
+            offset + limit
+        ))
+
+    def get_data_ids_columnar(self,
+                              data_type: DataTypeLike = None,
+                              include_attrs: Container[str] = None) \
+            -> Tuple[List[str], Dict[str, List[Any]]]:
+        """
+        Get all data resource identifiers and their requested
+        metadata attributes in columnar form, i.e., as a list of
+        identifiers and one list of values per attribute name.
+
+        This avoids creating a tuple and a dictionary per data resource
+        and lets clients serialize the attributes column by column.
+        The values are the ones :meth:get_data_ids would return.
+        If a store cannot provide an attribute for a given data
+        resource, the respective value is None.
+
+        The default implementation drains the iterator returned
+        by :meth:get_data_ids. Stores backed by columnar catalogues
+        should override this method.
+
+        :param data_type: If given, only data identifiers that are
+            available as this type are returned.
+        :param include_attrs: A sequence of names of attributes to
+            be returned for each dataset identifier.
+        :return: A tuple comprising the list of data identifiers and
+            a dictionary that maps each name in *include_attrs* to
+            the list of attribute values.
+        :raise DataStoreError: If an error occurs.
+        """
+        if include_attrs is None:
+            return list(self.get_data_ids(data_type=data_type)), {}
+        attr_names = list(include_attrs)
+        data_ids = []
+        columns = {attr_name: [] for attr_name in attr_names}
+        for data_id, attrs in self.get_data_ids(data_type=data_type,
+                                                include_attrs=attr_names):
+            data_ids.append(data_id)
+            for attr_name, column in columns.items():
+                column.append(attrs.get(attr_name))
+        return data_ids, columns
+
+    def get_data_attrs(self,
+                       data_ids: Sequence[str],
+                       include_attrs: Container[str] = None,
+                       data_type: DataTypeLike = None) \
+            -> Dict[str, Dict[str, Any]]:
+        """
+        Get the metadata attributes of multiple data resources
+        given by *data_ids*.
+
+        The attributes returned for a data resource are the same
+        as the ones :meth:get_data_ids would return for it, given
+        *include_attrs* and *data_type*.
+
+        The default implementation iterates the items returned by
+        :meth:get_data_ids until all requested data resources have
+        been found. Store implementations whose backends can provide
+        metadata for many data resources in a single request should
+        override this method.
+
+        :param data_ids: The data identifiers.
+        :param include_attrs: A sequence of names of attributes to
+            be returned for each data identifier.
+        :param data_type: If given, only data identifiers that are
+            available as this type are included.
+        :return: A dictionary that maps data identifiers to their
+            attributes. Identifiers of data resources not available
+            in this store are not included.
+        :raise DataStoreError: If an error occurs.
+        """
+        requested_data_ids = set(data_ids)
+        data_attrs = {}
+        if requested_data_ids:
+            for data_id, attrs in self.get_data_ids(
+                    data_type=data_type,
+                    include_attrs=include_attrs or ()
+            ):
+                if data_id in requested_data_ids:
+                    data_attrs[data_id] = attrs
+                    if len(data_attrs) == len(requested_data_ids):
+                        break
+        return {data_id: data_attrs[data_id]
+                for data_id in data_ids
+                if data_id in data_attrs}
+
     @abstractmethod
     def has_data(self,
                  data_id: str,
@@ -407,6 +559,34 @@ class DataStore(DataOpener, DataSearcher, ABC):
         :raise DataStoreError: If an error occurs.
         """
 
+    def open_data_many(self,
+                       data_ids: Sequence[str],
+                       opener_id: str = None,
+                       **open_params) -> Iterator[Any]:
+        """
+        Open the data given by the data resource identifiers *data_ids*
+        using the same *opener_id* and *open_params* for all of them.
+
+        The data resources are opened lazily, in the order given
+        by *data_ids*.
+
+        The default implementation calls :meth:open_data for each
+        identifier. Stores should override this method if they can
+        share setup costs, such as looking up data openers, across
+        the given data resources.
+
+        :param data_ids: The data identifiers that are known to exist
+            in this data store.
+        :param opener_id: An optional data opener identifier.
+        :param open_params: Opener-specific parameters.
+        :return: An iterator over the in-memory representations of
+            the data resources identified by *data_ids* and
+            *open_params*.
+        :raise DataStoreError: If an error occurs.
+        """
+        for data_id in data_ids:
+            yield self.open_data(data_id, opener_id=opener_id, **open_params)
+
 
 class MutableDataStore(DataStore, DataWriter, ABC):
     """
@@ -417,6 +597,8 @@ class MutableDataStore(DataStore, DataWriter, ABC):
     store must implement.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_data_writer_ids(self,
                             data_type: DataTypeLike = None) \
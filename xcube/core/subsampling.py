@@ -21,8 +21,13 @@
 
 import collections.abc
 import fnmatch
+import functools
+import os.path
+import re
+import warnings
 from typing import Dict, Tuple, Hashable, Optional, Mapping, Union
 
+import numba as nb
 import numpy as np
 import xarray as xr
 from deprecated import deprecated
@@ -68,26 +73,27 @@ def subsample_dataset(
     x_name, y_name = xy_dim_names or ('y', 'x')
 
     new_data_vars = dict()
-    new_coords = None  # used to collect coordinates from coarsen
+    new_coords = dict()  # used to collect coordinates from coarsen
+    first_var_names = []  # variables subsampled by slice selection
     for var_name, var in dataset.data_vars.items():
         if x_name in var.dims or y_name in var.dims:
-            agg_method = find_agg_method(agg_methods, var_name, var.dtype)
+            agg_method = _find_agg_method(agg_methods, var_name, var.dtype)
             if agg_method == 'first':
-                slices = get_variable_subsampling_slices(
-                    var, step, xy_dim_names=xy_dim_names
-                )
-                assert slices is not None
-                new_var = var[slices]
+                # Subsampled all at once, see below
+                new_var = None
+                first_var_names.append(var_name)
             else:
                 dim = dict()
                 if x_name in var.dims:
                     dim[x_name] = step
                 if y_name in var.dims:
                     dim[y_name] = step
-                var_coarsen = var.coarsen(dim=dim,
-                                          boundary='pad',
-                                          coord_func='min')
-                new_var: xr.DataArray = getattr(var_coarsen, agg_method)()
+                new_var = _coarsen_numpy_variable(var, dim, agg_method)
+                if new_var is None:
+                    var_coarsen = var.coarsen(dim=dim,
+                                              boundary='pad',
+                                              coord_func='min')
+                    new_var = getattr(var_coarsen, agg_method)()
                 if new_var.dtype != var.dtype:
                     # We don't want, e.g. "mean", to turn data
                     # from dtype unit16 into float64
@@ -95,13 +101,12 @@ def subsample_dataset(
                 new_var.attrs.update(var.attrs)
                 new_var.encoding.update(var.encoding)
                 # coarsen() recomputes spatial coordinates.
-                # Collect them, so we can later apply them to the
-                # variables that are subsampled by "first"
-                # (= slice selection).
-                if new_coords is None:
-                    new_coords = dict(new_var.coords)
-                else:
-                    new_coords.update(new_var.coords)
+                # Collect them once per spatial dimension, so we can
+                # later apply them to the variables that are subsampled
+                # by "first" (= slice selection).
+                for d in dim.keys():
+                    if d not in new_coords and d in new_var.coords:
+                        new_coords[d] = new_var.coords[d]
         else:
             new_var = var
 
@@ -110,21 +115,190 @@ def subsample_dataset(
     if not new_data_vars:
         return dataset
 
-    if new_coords:
-        # Make sure all variables use the same modified
-        # spatial coordinates from coarsen
-        new_data_vars = {
-            k: v.assign_coords({
-                d: new_coords[d]
-                for d in v.dims if d in new_coords
-            })
-            for k, v in new_data_vars.items()
-        }
+    if first_var_names:
+        # Select slices of all variables subsampled by "first" at once.
+        # Then make them use the same modified spatial coordinates
+        # from coarsen, if any. This way xarray creates the new
+        # indexes only once, and not for every variable.
+        first_dataset = dataset[first_var_names]
+        first_dataset = first_dataset.isel({
+            d: slice(None, None, step)
+            for d in (x_name, y_name) if d in first_dataset.dims
+        })
+        first_dataset = first_dataset.assign_coords({
+            d: c for d, c in new_coords.items() if d in first_dataset.dims
+        })
+        for var_name in first_var_names:
+            new_data_vars[var_name] = first_dataset[var_name]
 
     return xr.Dataset(data_vars=new_data_vars,
                       attrs=dataset.attrs)
 
 
+def _coarsen_numpy_variable(var: xr.DataArray,
+                            dim: Dict[Hashable, int],
+                            agg_method: str) -> Optional[xr.DataArray]:
+    """
+    Coarsen *var* along the dimensions in *dim* using
+    :func:_block_reduce(). This is equivalent to
+    ``getattr(var.coarsen(dim=dim, boundary='pad', coord_func='min'),
+    agg_method)()`` but avoids the overhead of xarray's generic
+    coarsen implementation.
+
+    Return None, if *var* is backed by a Dask array,
+    if the sizes of *dim* are not multiples of the window sizes,
+    or if *var* has non-numeric coordinates to coarsen.
+    In this case callers should use xarray's coarsen().
+    """
+    if var.chunks is not None \
+            or any(var.sizes[d] % w != 0 for d, w in dim.items()):
+        return None
+    new_coords = dict()
+    for coord_name, coord_var in var.coords.items():
+        coord_axes = {coord_var.get_axis_num(d): w
+                      for d, w in dim.items() if d in coord_var.dims}
+        if not coord_axes:
+            new_coords[coord_name] = coord_var
+        elif np.issubdtype(coord_var.dtype, np.number):
+            # Like coarsen(coord_func='min'), which applies to
+            # dimension coordinates only, others are averaged.
+            coord_agg_method = 'min' if coord_name in var.dims else 'mean'
+            new_coords[coord_name] = xr.DataArray(
+                _block_reduce(coord_var.values, coord_axes, coord_agg_method),
+                dims=coord_var.dims,
+                attrs=coord_var.attrs
+            )
+        else:
+            return None
+    var_axes = {var.get_axis_num(d): w for d, w in dim.items()}
+    return xr.DataArray(_block_reduce(var.values, var_axes, agg_method),
+                        dims=var.dims,
+                        coords=new_coords,
+                        name=var.name,
+                        attrs=var.attrs)
+
+
+_NAN_AGG_FUNCS = dict(min=np.nanmin,
+                      max=np.nanmax,
+                      mean=np.nanmean,
+                      median=np.nanmedian)
+
+
+def _block_reduce(array: np.ndarray,
+                  windows: Dict[int, int],
+                  agg_method: str) -> np.ndarray:
+    """
+    Aggregate non-overlapping blocks of *array* using *agg_method*.
+    *windows* maps axis indexes to window sizes, which must
+    divide the respective axis size. NaN values are skipped.
+    """
+    if agg_method in _KERNEL_AGG_METHODS \
+            and (agg_method == 'mean'
+                 or np.issubdtype(array.dtype, np.floating)):
+        result = _block_reduce_trailing_axes(array, windows, agg_method)
+        if result is not None:
+            return result
+    shape = []
+    block_axes = []
+    for axis, size in enumerate(array.shape):
+        window = windows.get(axis)
+        if window is None:
+            shape.append(size)
+        else:
+            shape.extend((size // window, window))
+            block_axes.append(len(shape) - 1)
+    blocks = array.reshape(shape)
+    # NaN-skipping mean and median are considerably slower,
+    # so we use them only if there are NaNs at all.
+    # Note, the sum is NaN for any NaN in array.
+    if np.issubdtype(array.dtype, np.floating) \
+            and (agg_method in ('min', 'max')
+                 or np.isnan(np.sum(array))):
+        with warnings.catch_warnings():
+            # All-NaN blocks yield NaN, which is what we want
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            return _NAN_AGG_FUNCS[agg_method](blocks, axis=tuple(block_axes))
+    return getattr(np, agg_method)(blocks, axis=tuple(block_axes))
+
+
+_KERNEL_AGG_METHODS = dict(mean=0, min=1, max=2)
+
+
+def _block_reduce_trailing_axes(array: np.ndarray,
+                                windows: Dict[int, int],
+                                agg_method: str) -> Optional[np.ndarray]:
+    """
+    Same as :func:_block_reduce(), but uses a Numba kernel.
+    Return None, if *windows* are not given for the last,
+    or the last two axes of *array*.
+    """
+    ndim = array.ndim
+    if sorted(windows.keys()) == [ndim - 1]:
+        window_y, window_x = 1, windows[ndim - 1]
+        lead_shape = array.shape[:-1]
+        height, width = 1, array.shape[-1]
+    elif sorted(windows.keys()) == [ndim - 2, ndim - 1]:
+        window_y, window_x = windows[ndim - 2], windows[ndim - 1]
+        lead_shape = array.shape[:-2]
+        height, width = array.shape[-2:]
+    else:
+        return None
+    if np.issubdtype(array.dtype, np.floating):
+        dtype = array.dtype
+    else:
+        dtype = np.float64
+    out = np.empty((int(np.prod(lead_shape)),
+                    height // window_y,
+                    width // window_x),
+                   dtype=dtype)
+    _block_reduce_kernel(array.reshape((-1, height, width)),
+                         window_y, window_x,
+                         _KERNEL_AGG_METHODS[agg_method],
+                         out)
+    if window_y == 1:
+        return out.reshape(lead_shape + (width // window_x,))
+    return out.reshape(lead_shape + out.shape[1:])
+
+
+@nb.njit(nogil=True, parallel=True, cache=True)
+def _block_reduce_kernel(array: np.ndarray,
+                         window_y: int,
+                         window_x: int,
+                         agg_method: int,
+                         out: np.ndarray):
+    """
+    Aggregate the blocks of the images in the 3D *array* into
+    the 3D *out* array, while skipping NaN values.
+    The *agg_method* is 0 for "mean", 1 for "min", and 2 for "max".
+    """
+    num_images, height, width = out.shape
+    for k in nb.prange(num_images * height):
+        i = k // height
+        j = k % height
+        for l in range(width):
+            acc = 0.0
+            count = 0
+            for dj in range(window_y):
+                for dl in range(window_x):
+                    v = array[i, j * window_y + dj, l * window_x + dl]
+                    if v == v:  # v is not NaN
+                        if agg_method == 0:
+                            acc += v
+                        elif count == 0:
+                            acc = v
+                        elif agg_method == 1:
+                            acc = min(acc, v)
+                        else:
+                            acc = max(acc, v)
+                        count += 1
+            if count == 0:
+                out[i, j, l] = np.nan
+            elif agg_method == 0:
+                out[i, j, l] = acc / count
+            else:
+                out[i, j, l] = acc
+
+
 def assert_valid_agg_methods(agg_methods: AggMethods):
     """Assert that the given *agg_methods* are valid."""
     assert_instance(agg_methods,
@@ -156,12 +330,22 @@ def find_agg_method(agg_methods: AggMethods,
     for given *var_name* and *var_dtype*.
     """
     assert_valid_agg_methods(agg_methods)
+    return _find_agg_method(agg_methods, var_name, var_dtype)
+
+
+def _find_agg_method(agg_methods: AggMethods,
+                     var_name: Hashable,
+                     var_dtype: np.dtype) -> str:
+    # Same as find_agg_method(), but expects valid agg_methods.
     if isinstance(agg_methods, str) and agg_methods != 'auto':
         return agg_methods
     if isinstance(agg_methods, collections.abc.Mapping):
+        norm_var_name = os.path.normcase(str(var_name))
         for var_name_pat, agg_method in agg_methods.items():
-            if var_name == var_name_pat or fnmatch.fnmatch(str(var_name),
-                                                           var_name_pat):
+            if var_name == var_name_pat \
+                    or _compile_var_name_pattern(var_name_pat).match(
+                        norm_var_name
+                    ):
                 if agg_method in (None, 'auto'):
                     break
                 return agg_method
@@ -172,6 +356,13 @@ def find_agg_method(agg_methods: AggMethods,
         return 'mean'
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_var_name_pattern(var_name_pat: str) -> re.Pattern:
+    # Equivalent to fnmatch.fnmatch(), but without
+    # normalizing the pattern on every call.
+    return re.compile(fnmatch.translate(os.path.normcase(var_name_pat)))
+
+
 _FULL_SLICE = slice(None, None, None)
 
 
@@ -192,13 +383,22 @@ def get_variable_subsampling_slices(
     assert_instance(variable, xr.DataArray, name='variable')
     assert_instance(step, int, name='step')
     x_dim_name, y_dim_name = xy_dim_names or ('x', 'y')
+    return _get_dims_subsampling_slices(variable.dims, step,
+                                        x_dim_name, y_dim_name)
+
 
-    var_index = None
-    for index, dim_name in enumerate(variable.dims):
-        if dim_name == x_dim_name or dim_name == y_dim_name:
-            if var_index is None:
-                var_index = index * [_FULL_SLICE]
-            var_index.append(slice(None, None, step))
-        elif var_index is not None:
-            var_index.append(_FULL_SLICE)
-    return tuple(var_index) if var_index is not None else None
+@functools.lru_cache(maxsize=256)
+def _get_dims_subsampling_slices(
+        dims: Tuple[Hashable, ...],
+        step: int,
+        x_dim_name: Hashable,
+        y_dim_name: Hashable
+) -> Optional[Tuple[slice, ...]]:
+    # Variables of a dataset usually share a few dimension layouts,
+    # so we compute the slices only once per layout.
+    xy_dim_names = x_dim_name, y_dim_name
+    if not any(dim_name in xy_dim_names for dim_name in dims):
+        return None
+    step_slice = slice(None, None, step)
+    return tuple(step_slice if dim_name in xy_dim_names else _FULL_SLICE
+                 for dim_name in dims)
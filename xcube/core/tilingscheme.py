@@ -19,14 +19,17 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import bisect
 import math
+from functools import cached_property
+from functools import lru_cache
 from typing import Optional, Tuple, Sequence, List, Union
 
 import numpy as np
-import pyproj
 
 from xcube.util.assertions import assert_given
 from xcube.util.assertions import assert_instance
+from xcube.util.assertions import assert_true
 
 WEB_MERCATOR_CRS_NAME = 'EPSG:3857'
 WEB_MERCATOR_CRS_ALIASES = (
@@ -46,6 +49,10 @@ DEFAULT_TILE_SIZE = 256
 EARTH_EQUATORIAL_RADIUS_WGS84 = 6378137.
 EARTH_CIRCUMFERENCE_WGS84 = 2 * math.pi * EARTH_EQUATORIAL_RADIUS_WGS84
 
+# Maximum number of resolutions for which
+# TilingScheme.get_levels_for_resolutions() won't use NumPy
+_MAX_NUM_SCALAR_RESOLUTIONS = 16
+
 
 class TilingScheme:
     """
@@ -82,7 +89,6 @@ class TilingScheme:
                  max_level: Optional[int] = None):
         self._num_level_zero_tiles = num_level_zero_tiles
         self._crs_name = crs_name
-        self._crs = None
         self._map_height = map_height
         self._tile_size = tile_size
         self._min_level = min_level
@@ -93,7 +99,7 @@ class TilingScheme:
         """The number of level zero tiles in x and y directions."""
         return self._num_level_zero_tiles
 
-    @property
+    @cached_property
     def level_zero_resolution(self) -> float:
         """The resolution at level zero in map units."""
         return self._map_height / self._tile_size
@@ -103,19 +109,17 @@ class TilingScheme:
         """The name of the spatial coordinate reference system."""
         return self._crs_name
 
-    @property
-    def crs(self) -> pyproj.CRS:
+    @cached_property
+    def crs(self) -> 'pyproj.CRS':
         """The spatial coordinate reference system."""
-        if self._crs is None:
-            self._crs = pyproj.CRS.from_string(self.crs_name)
-        return self._crs
+        return _get_crs(self.crs_name)
 
-    @property
+    @cached_property
     def map_unit_name(self) -> str:
         """The name of the map's spatial units."""
         return self.crs.axis_info[0].unit_name
 
-    @property
+    @cached_property
     def map_width(self) -> float:
         """
         The height of the map in units
@@ -132,7 +136,7 @@ class TilingScheme:
         """
         return self._map_height
 
-    @property
+    @cached_property
     def map_extent(self) -> Tuple[float, float, float, float]:
         """
         The extent of the map in units
@@ -142,7 +146,7 @@ class TilingScheme:
         map_height_05 = self.map_height / 2
         return -map_width_05, -map_height_05, map_width_05, map_height_05
 
-    @property
+    @cached_property
     def map_origin(self) -> Tuple[float, float]:
         """
         The origin of the map (upper, left pixel of the upper left tile)
@@ -172,7 +176,9 @@ class TilingScheme:
         return self.max_level + 1 if self.max_level is not None else None
 
     @classmethod
-    def for_crs(cls, crs: Union[pyproj.CRS, str], **kwargs) -> 'TilingScheme':
+    def for_crs(cls,
+                crs: Union['pyproj.CRS', str],
+                **kwargs) -> 'TilingScheme':
         """
         Get a new tiling scheme for the named coordinate reference system.
 
@@ -180,6 +186,7 @@ class TilingScheme:
         :param kwargs: subset of constructor arguments
         :return: a tiling scheme
         """
+        import pyproj
         assert_instance(crs, (pyproj.CRS, str), name='crs')
         crs_name = crs.srs if isinstance(crs, pyproj.CRS) else crs
         if crs_name in WEB_MERCATOR_CRS_ALIASES:
@@ -238,7 +245,8 @@ class TilingScheme:
         if max_level is None:
             raise ValueError('max_value must be given')
 
-        return [res_l0 / (1 << level)
+        # ldexp(x, -n) == x / 2 ** n, but computed faster and exactly
+        return [math.ldexp(res_l0, -level)
                 for level in range(min_level, max_level + 1)]
 
     def get_levels_for_resolutions(
@@ -261,10 +269,23 @@ class TilingScheme:
         """
         assert_given(resolutions, name='resolutions')
         assert_instance(unit_name, str, name='unit_name')
-        if not isinstance(resolutions, np.ndarray):
-            resolutions = np.array(resolutions)
 
         f_to_map = get_unit_factor(unit_name, self.map_unit_name)
+
+        if not isinstance(resolutions, np.ndarray) \
+                and len(resolutions) <= _MAX_NUM_SCALAR_RESOLUTIONS:
+            # Usual case: a few resolutions of a multi-level dataset,
+            # where NumPy's overhead would dominate.
+            map_levels = [
+                math.ceil(math.log2(
+                    self.level_zero_resolution / (f_to_map * resolution)
+                ))
+                for resolution in resolutions
+            ]
+            return min(map_levels), max(map_levels)
+
+        if not isinstance(resolutions, np.ndarray):
+            resolutions = np.array(resolutions)
         map_resolutions = f_to_map * resolutions
         map_levels = np.ceil(np.log2(
             self.level_zero_resolution / map_resolutions
@@ -315,18 +336,18 @@ class TilingScheme:
         if ds_pix_size >= ds_pix_size_max:
             return num_ds_levels - 1
 
-        for ds_level in range(num_ds_levels - 1):
-            ds_pix_size_1 = resolutions[ds_level]
-            ds_pix_size_2 = resolutions[ds_level + 1]
-            if ds_pix_size_1 <= ds_pix_size <= ds_pix_size_2:
-                r = (ds_pix_size - ds_pix_size_1) \
-                    / (ds_pix_size_2 - ds_pix_size_1)
-                if r < 0.5:
-                    return ds_level
-                else:
-                    return ds_level + 1
-
-        raise RuntimeError('should not come here')
+        # Here: ds_pix_size_min < ds_pix_size < ds_pix_size_max,
+        # so we find ds_level such that
+        # resolutions[ds_level] < ds_pix_size <= resolutions[ds_level + 1]
+        ds_level = bisect.bisect_left(resolutions, ds_pix_size) - 1
+        ds_pix_size_1 = resolutions[ds_level]
+        ds_pix_size_2 = resolutions[ds_level + 1]
+        r = (ds_pix_size - ds_pix_size_1) \
+            / (ds_pix_size_2 - ds_pix_size_1)
+        if r < 0.5:
+            return ds_level
+        else:
+            return ds_level + 1
 
     def get_tile_extent(self,
                         tile_x: int,
@@ -358,9 +379,7 @@ class TilingScheme:
 
         map_width = self.map_width
         map_height = self.map_height
-
-        map_x0 = -map_width / 2
-        map_y0 = map_height / 2
+        map_x0, map_y0 = self.map_origin
 
         map_tile_width = map_width / zoom_factor / num_tiles_x0
         map_tile_height = map_height / zoom_factor / num_tiles_y0
@@ -373,6 +392,47 @@ class TilingScheme:
 
         return x1, y1, x2, y2
 
+    def get_tile_extents(self, tiles: np.ndarray) -> np.ndarray:
+        """
+        Get the extents in units of the CRS for many tiles at once.
+        This is the vectorized version of :meth:get_tile_extent.
+
+        :param tiles: An integer array of shape (N, 3) whose
+            rows are the tile coordinates (tile_x, tile_y, tile_z).
+        :return: A float array of shape (N, 4) whose rows are
+            the tile extents (x1, y1, x2, y2). Rows for tiles
+            that are out of range are NaN.
+        """
+        tiles = np.asarray(tiles)
+        assert_true(tiles.ndim == 2 and tiles.shape[1] == 3,
+                    message='tiles must have shape (N, 3)')
+        tile_x, tile_y, tile_z = tiles[:, 0], tiles[:, 1], tiles[:, 2]
+
+        valid = tile_z >= 0
+        # For invalid tiles, any zoom level will do
+        zoom_factor = np.ldexp(1.0, np.where(valid, tile_z, 0))
+
+        num_tiles_x0, num_tiles_y0 = self.num_level_zero_tiles
+        valid &= (tile_x >= 0) & (tile_x < num_tiles_x0 * zoom_factor)
+        valid &= (tile_y >= 0) & (tile_y < num_tiles_y0 * zoom_factor)
+
+        map_width = self.map_width
+        map_height = self.map_height
+        map_x0, map_y0 = self.map_origin
+
+        map_tile_width = map_width / zoom_factor / num_tiles_x0
+        map_tile_height = map_height / zoom_factor / num_tiles_y0
+
+        x1 = map_x0 + tile_x * map_tile_width
+        y1 = map_y0 - (tile_y + 1) * map_tile_height
+
+        x2 = map_x0 + (tile_x + 1) * map_tile_width
+        y2 = map_y0 - tile_y * map_tile_height
+
+        extents = np.stack([x1, y1, x2, y2], axis=1)
+        extents[~valid] = np.nan
+        return extents
+
 
 TilingScheme.WEB_MERCATOR = TilingScheme(
     num_level_zero_tiles=(1, 1),
@@ -387,6 +447,16 @@ TilingScheme.GEOGRAPHIC = TilingScheme(
 )
 
 
+@lru_cache(maxsize=16)
+def _get_crs(crs_name: str) -> 'pyproj.CRS':
+    # Tiling schemes derived from each other share their CRS,
+    # and creating a CRS from the PROJ database is expensive.
+    # pyproj is imported only here, as importing it is expensive too.
+    import pyproj
+    return pyproj.CRS.from_string(crs_name)
+
+
+@lru_cache(maxsize=32)
 def get_unit_factor(unit_name_from: str, unit_name_to: str) -> float:
     """
     Get the factor to convert from one unit into another
@@ -414,29 +484,41 @@ def get_unit_factor(unit_name_from: str, unit_name_to: str) -> float:
 def subdivide_size(size: Tuple[int, int],
                    tile_size: Tuple[int, int]) -> List[Tuple[int, int]]:
     x_size, y_size = size
-    tile_size_x, tile_size_y = tile_size
-    sizes = [(x_size, y_size)]
-    while True:
-        if x_size <= tile_size_x or y_size <= tile_size_y:
-            break
-        x_size = (x_size + 1) // 2
-        y_size = (y_size + 1) // 2
-        sizes.append((x_size, y_size))
-    return sizes
+    # Halving a size n times with rounding up
+    # equals ceil(size / 2 ** n).
+    return [((x_size + (1 << level) - 1) >> level,
+             (y_size + (1 << level) - 1) >> level)
+            for level in range(get_num_levels(size, tile_size))]
 
 
 def get_num_levels(size: Tuple[int, int],
                    tile_size: Tuple[int, int]) -> int:
-    return len(subdivide_size(size, tile_size))
+    x_size, y_size = size
+    tile_size_x, tile_size_y = tile_size
+    # Subdivision stops as soon as either size fits into a tile
+    return 1 + min(_get_num_halvings(x_size, tile_size_x),
+                   _get_num_halvings(y_size, tile_size_y))
+
+
+def _get_num_halvings(size: int, tile_size: int) -> int:
+    # Smallest n for which ceil(size / 2 ** n) <= tile_size,
+    # that is, 2 ** n >= ceil(size / tile_size).
+    num_tiles = -(-size // tile_size)
+    return max(num_tiles - 1, 0).bit_length()
+
+
+_METER_UNIT_NAMES = frozenset(('m',
+                                'metre', 'metres',
+                                'meter', 'meters'))
+
+_DEGREE_UNIT_NAMES = frozenset(('°', 'deg',
+                                'degree', 'degrees',
+                                'decimal_degree', 'decimal_degrees'))
 
 
 def _is_meter_unit(unit_name: str) -> bool:
-    return unit_name.lower() in ('m',
-                                 'metre', 'metres',
-                                 'meter', 'meters')
+    return unit_name.lower() in _METER_UNIT_NAMES
 
 
 def _is_degree_unit(unit_name: str) -> bool:
-    return unit_name.lower() in ('°', 'deg',
-                                 'degree', 'degrees',
-                                 'decimal_degree', 'decimal_degrees')
+    return unit_name.lower() in _DEGREE_UNIT_NAMES
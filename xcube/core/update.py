@@ -20,8 +20,11 @@
 # SOFTWARE.
 
 import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
+import dask
+import dask.array as da
+import numpy as np
 import xarray as xr
 
 from xcube.constants import FORMAT_NAME_NETCDF4
@@ -42,7 +45,8 @@ _TIME_ATTRS_DATA = ('time', 'time_bnds', None,
 def update_dataset_attrs(dataset: xr.Dataset,
                          global_attrs: Dict[str, Any] = None,
                          update_existing: bool = False,
-                         in_place: bool = False) -> xr.Dataset:
+                         in_place: bool = False,
+                         copy: bool = True) -> xr.Dataset:
     """
     Update spatio-temporal CF/THREDDS attributes given *dataset* according
     to spatio-temporal coordinate variables time, lat, and lon.
@@ -51,10 +55,14 @@ def update_dataset_attrs(dataset: xr.Dataset,
     :param global_attrs: Optional global attributes.
     :param update_existing: If ``True``, any existing attributes will be updated.
     :param in_place: If ``True``, *dataset* will be modified in place and returned.
+    :param copy: Only used if *in_place* is ``False``. If ``True``, the default, the new
+        dataset will also have (shallow) copies of the variables of *dataset*. Otherwise,
+        it shares them with *dataset* and only global attributes are copied, which is
+        considerably faster for datasets with many variables.
     :return: A new dataset, if *in_place* if ``False`` (default), else the passed and modified *dataset*.
     """
     if not in_place:
-        dataset = dataset.copy()
+        dataset = _copy_dataset(dataset, copy)
 
     if global_attrs:
         dataset.attrs.update(global_attrs)
@@ -65,40 +73,67 @@ def update_dataset_attrs(dataset: xr.Dataset,
 
 def update_dataset_spatial_attrs(dataset: xr.Dataset,
                                  update_existing: bool = False,
-                                 in_place: bool = False) -> xr.Dataset:
+                                 in_place: bool = False,
+                                 copy: bool = True) -> xr.Dataset:
     """
     Update spatial CF/THREDDS attributes of given *dataset*.
 
     :param dataset: The dataset.
     :param update_existing: If ``True``, any existing attributes will be updated.
     :param in_place: If ``True``, *dataset* will be modified in place and returned.
+    :param copy: Only used if *in_place* is ``False``.
+        See :func:update_dataset_attrs.
     :return: A new dataset, if *in_place* if ``False`` (default), else the passed and modified *dataset*.
     """
     return _update_dataset_attrs(dataset, [_LON_ATTRS_DATA, _LAT_ATTRS_DATA],
-                                 update_existing=update_existing, in_place=in_place)
+                                 update_existing=update_existing, in_place=in_place, copy=copy)
 
 
 def update_dataset_temporal_attrs(dataset: xr.Dataset,
                                   update_existing: bool = False,
-                                  in_place: bool = False) -> xr.Dataset:
+                                  in_place: bool = False,
+                                  copy: bool = True) -> xr.Dataset:
     """
     Update temporal CF/THREDDS attributes of given *dataset*.
 
     :param dataset: The dataset.
     :param update_existing: If ``True``, any existing attributes will be updated.
     :param in_place: If ``True``, *dataset* will be modified in place and returned.
+    :param copy: Only used if *in_place* is ``False``.
+        See :func:update_dataset_attrs.
     :return: A new dataset, if *in_place* is ``False`` (default), else the passed and modified *dataset*.
     """
     return _update_dataset_attrs(dataset, [_TIME_ATTRS_DATA],
-                                 update_existing=update_existing, in_place=in_place)
+                                 update_existing=update_existing, in_place=in_place, copy=copy)
+
+
+def _copy_dataset(dataset: xr.Dataset, copy: bool) -> xr.Dataset:
+    if copy:
+        return dataset.copy()
+    return _copy_dataset_attrs(dataset)
+
+
+def _copy_dataset_attrs(dataset: xr.Dataset) -> xr.Dataset:
+    # We only modify global attributes. Dataset.copy() would also create
+    # new variable objects, which is expensive for many variables.
+    # No public xarray API avoids this, so we use the private
+    # Dataset._replace(), which is unchanged from xarray 2022.6,
+    # our minimum requirement, up to at least xarray 2026.9.
+    if not hasattr(dataset, '_replace'):
+        dataset = dataset.copy(deep=False)
+        dataset.attrs = dict(dataset.attrs)
+        return dataset
+    # noinspection PyProtectedMember
+    return dataset._replace(attrs=dict(dataset.attrs))
 
 
 def _update_dataset_attrs(dataset: xr.Dataset,
                           coord_data,
                           update_existing: bool = False,
-                          in_place: bool = False) -> xr.Dataset:
+                          in_place: bool = False,
+                          copy: bool = True) -> xr.Dataset:
     if not in_place:
-        dataset = dataset.copy()
+        dataset = _copy_dataset(dataset, copy)
 
     for coord_name, coord_bnds_name, coord_units, coord_attr_names, cast in coord_data:
         coord_min_attr_name, coord_max_attr_name, coord_units_attr_name, coord_res_attr_name = coord_attr_names
@@ -117,28 +152,28 @@ def _update_dataset_attrs(dataset: xr.Dataset,
                     and coord_bnds.ndim == 2 \
                     and coord_bnds.shape[0] > 0 \
                     and coord_bnds.shape[1] == 2:
-                coord_v1 = coord_bnds[0][0]
-                coord_v2 = coord_bnds[-1][1]
+                coord_v1, coord_v2 = _get_scalars(coord_bnds.data[0, 0],
+                                                  coord_bnds.data[-1, 1])
                 coord_res = (coord_v2 - coord_v1) / coord_bnds.shape[0]
-                coord_res = float(coord_res.values)
+                coord_res = float(coord_res)
                 coord_min, coord_max = (coord_v1, coord_v2) if coord_res > 0 else (coord_v2, coord_v1)
-                dataset.attrs[coord_min_attr_name] = cast(coord_min.values)
-                dataset.attrs[coord_max_attr_name] = cast(coord_max.values)
+                dataset.attrs[coord_min_attr_name] = cast(coord_min)
+                dataset.attrs[coord_max_attr_name] = cast(coord_max)
             elif coord is not None \
                     and coord.ndim == 1 \
                     and coord.shape[0] > 0:
-                coord_v1 = coord[0]
-                coord_v2 = coord[-1]
+                coord_v1, coord_v2 = _get_scalars(coord.data[0],
+                                                  coord.data[-1])
                 if coord.shape[0] > 1:
                     coord_res = (coord_v2 - coord_v1) / (coord.shape[0] - 1)
-                    coord_v1 -= coord_res / 2
-                    coord_v2 += coord_res / 2
-                    coord_res = float(coord_res.values)
+                    coord_v1 = coord_v1 - coord_res / 2
+                    coord_v2 = coord_v2 + coord_res / 2
+                    coord_res = float(coord_res)
                     coord_min, coord_max = (coord_v1, coord_v2) if coord_res > 0 else (coord_v2, coord_v1)
                 else:
                     coord_min, coord_max = coord_v1, coord_v2
-                dataset.attrs[coord_min_attr_name] = cast(coord_min.values)
-                dataset.attrs[coord_max_attr_name] = cast(coord_max.values)
+                dataset.attrs[coord_min_attr_name] = cast(coord_min)
+                dataset.attrs[coord_max_attr_name] = cast(coord_max)
             if coord_units_attr_name is not None and coord_units is not None:
                 dataset.attrs[coord_units_attr_name] = coord_units
             if coord_res_attr_name is not None and coord_res is not None:
@@ -149,6 +184,17 @@ def _update_dataset_attrs(dataset: xr.Dataset,
     return dataset
 
 
+def _get_scalars(*values: Any) -> Tuple[np.generic, ...]:
+    """
+    Get NumPy scalars for the given 0-d *values*, which may be
+    NumPy or Dask arrays. Dask arrays are computed together, so
+    that we don't trigger a computation for each value.
+    """
+    if any(isinstance(v, da.Array) for v in values):
+        values = dask.compute(*values)
+    return tuple(np.asarray(v)[()] for v in values)
+
+
 def update_dataset_var_attrs(dataset: xr.Dataset,
                              var_attrs_list: NameDictPairList) -> xr.Dataset:
     """
@@ -164,7 +210,8 @@ def update_dataset_var_attrs(dataset: xr.Dataset,
     :param var_attrs_list: List of tuples of the form (variable name, properties dictionary).
     :return: A shallow copy of *dataset* with updated / renamed variables.
     """
-    if not var_attrs_list:
+    if not var_attrs_list \
+            or not any(var_attrs for _, var_attrs in var_attrs_list):
         return dataset
 
     var_name_attrs = dict()
@@ -194,9 +241,9 @@ def update_dataset_var_attrs(dataset: xr.Dataset,
         dataset = dataset.copy()
 
     if var_name_attrs:
+        variables = dataset.variables
         for var_name, var_attrs in var_name_attrs.items():
-            var = dataset[var_name]
-            var.attrs.update(var_attrs)
+            variables[var_name].attrs.update(var_attrs)
 
     return dataset
 
@@ -222,25 +269,24 @@ def update_dataset_chunk_encoding(dataset: xr.Dataset,
     else:
         return dataset
     if not in_place:
-        dataset = dataset.copy()
-    for var_name in dataset.variables:
-        var = dataset[var_name]
-        if chunk_sizes is not None:
-            def get_size(i):
-                dim_name = var.dims[i]
-                size = chunk_sizes.get(dim_name)
-                if isinstance(size, int):
-                    return size
-                if var.chunks:
-                    size = var.chunks[i]
-                    if isinstance(size, int):
-                        return size
-                    if len(size):
-                        return size[0]
-                return var.shape[i]
-
-            var.encoding.update({chunk_sizes_attr_name: tuple(map(get_size, range(var.ndim)))})
-        elif chunk_sizes_attr_name in var.encoding:
-            # Remove any explicit and possibly unintended specification
-            del var.encoding[chunk_sizes_attr_name]
+        dataset = dataset.copy(deep=False)
+        # Only variable encodings are modified below, so make sure
+        # each variable has its own encoding dictionary.
+        for var in dataset.variables.values():
+            var.encoding = dict(var.encoding)
+    if chunk_sizes is None:
+        for var in dataset.variables.values():
+            if chunk_sizes_attr_name in var.encoding:
+                # Remove any explicit and possibly unintended specification
+                del var.encoding[chunk_sizes_attr_name]
+        return dataset
+    for var in dataset.variables.values():
+        var_shape = var.shape
+        var_chunks = var.chunks or ((),) * var.ndim
+        var.encoding[chunk_sizes_attr_name] = tuple(
+            chunk_sizes[dim_name]
+            if isinstance(chunk_sizes.get(dim_name), int)
+            else (var_chunks[i][0] if var_chunks[i] else var_shape[i])
+            for i, dim_name in enumerate(var.dims)
+        )
     return dataset
@@ -89,14 +89,5 @@ def get_url_prefix(config: Mapping[str, Any]) -> str:
     :param config: Server configuration.
     :return: Sanitized URL prefix, may be an empty string.
     """
-    url_prefix = (config.get('url_prefix') or '').strip()
-    while url_prefix.startswith('//'):
-        url_prefix = url_prefix[1:]
-    while url_prefix.endswith('/'):
-        url_prefix = url_prefix[:-1]
-    if url_prefix == '':
-        return ''
-    elif url_prefix.startswith('/'):
-        return url_prefix
-    else:
-        return '/' + url_prefix
+    url_prefix = (config.get('url_prefix') or '').strip().strip('/')
+    return '/' + url_prefix if url_prefix else ''
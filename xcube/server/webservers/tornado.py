@@ -53,6 +53,7 @@ from xcube.util.jsonschema import JsonStringSchema
 from xcube.version import version
 
 SERVER_CTX_ATTR_NAME = "__xcube_server_ctx"
+URL_PREFIX_ATTR_NAME = "__xcube_url_prefix"
 
 
 class TornadoFramework(Framework):
@@ -146,6 +147,8 @@ class TornadoFramework(Framework):
 
     def update(self, ctx: Context):
         setattr(self.application, SERVER_CTX_ATTR_NAME, ctx)
+        setattr(self.application, URL_PREFIX_ATTR_NAME,
+                get_url_prefix(ctx.config))
 
     def start(self, ctx: Context):
         config = ctx.config
@@ -292,10 +295,13 @@ class TornadoRequestHandler(tornado.web.RequestHandler):
         server_ctx = getattr(application, SERVER_CTX_ATTR_NAME, None)
         assert isinstance(server_ctx, Context)
         api_route: ApiRoute = kwargs.pop("api_route")
+        url_prefix = getattr(application, URL_PREFIX_ATTR_NAME, None)
+        if url_prefix is None:
+            url_prefix = get_url_prefix(server_ctx.config)
         ctx: Context = server_ctx.get_api_ctx(api_route.api_name)
         self._api_handler: ApiHandler = api_route.handler_cls(
             ctx,
-            TornadoApiRequest(request, get_url_prefix(server_ctx.config)),
+            TornadoApiRequest(request, url_prefix),
             TornadoApiResponse(self),
             **api_route.handler_kwargs
         )
@@ -1,3 +1,4 @@
+import sys
 import warnings
 from typing import Type
 
@@ -12,6 +13,9 @@ def register_json_formatter(cls: Type, to_dict_method_name: str = 'to_dict'):
     if not hasattr(cls, to_dict_method_name) or not callable(getattr(cls, to_dict_method_name)):
         raise ValueError(f'{cls} must define a {to_dict_method_name}() method')
 
+    if not _is_ipython_imported():
+        return
+
     try:
         import IPython
         import IPython.display
@@ -31,6 +35,9 @@ def enable_asyncio():
     """
     Enable asyncio package to be executable in Jupyter Notebooks.
     """
+    if not _is_ipython_imported():
+        return
+
     try:
         import IPython
         if IPython.get_ipython() is not None:
@@ -41,3 +48,9 @@ def enable_asyncio():
                 warnings.warn('nest-asyncio required to use asyncio in Jupyter Notebooks')
     except ImportError:
         pass
+
+
+def _is_ipython_imported() -> bool:
+    # If we run in IPython, it has already been imported.
+    # Otherwise, we avoid importing it, as this is expensive.
+    return 'IPython' in sys.modules
@@ -20,6 +20,7 @@
 # SOFTWARE.
 
 import collections.abc
+import json
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Callable, Mapping, Sequence, Union, Tuple, \
     Optional
@@ -34,6 +35,12 @@ __import__('rfc3339_validator')
 
 import jsonschema
 
+try:
+    # noinspection PyPackageRequirements
+    import orjson
+except ImportError:
+    orjson = None
+
 from xcube.util.ipython import register_json_formatter
 from xcube.util.undefined import UNDEFINED
 
@@ -44,6 +51,36 @@ _TYPES_ENUM = {'null', 'boolean', 'integer', 'number', 'string', 'array',
                'object'}
 _NUMERIC_TYPES_ENUM = {'integer', 'number'}
 
+# As a base for our custom validator, we hard-code a validator
+# version; JSON metaschema versions are not guaranteed to be backward
+# compatible, so if we use jsonschema.validators.validator_for(
+# schema), our schema may become invalid when the default validator
+# changes. The metaschema version can also be pinned in the schema
+# itself with an entry like this:
+# '$schema': 'http://json-schema.org/draft-07/schema'
+# However, this makes it more work to keep unit tests up to date, and
+# it's fiddly to adapt the recursive to_dict code to make sure that
+# the metaschema key *only* appears in the outermost dictionary.
+_BASE_VALIDATOR_CLASS = jsonschema.validators.Draft7Validator
+
+# By default, jsonschema only recognizes lists as arrays. Here we derive
+# and use a custom validator which recognizes both lists and tuples as
+# arrays.
+_VALIDATOR_CLASS = jsonschema.validators.extend(
+    _BASE_VALIDATOR_CLASS,
+    type_checker=_BASE_VALIDATOR_CLASS.TYPE_CHECKER.redefine(
+        'array',
+        lambda checker, inst: isinstance(inst, (list, tuple))
+    )
+)
+
+# Validators, keyed by their schema's (sorted) JSON text. Checking a schema
+# against the metaschema and creating its validator is far more
+# expensive than validating a typical instance, and the same
+# schemas are validated against over and over again.
+_VALIDATOR_CACHE: Dict[Union[str, bytes], Any] = {}
+_VALIDATOR_CACHE_MAX_SIZE = 256
+
 
 class JsonSchema(ABC):
 
@@ -102,35 +139,12 @@ class JsonSchema(ABC):
 
     def validate_instance(self, instance: Any):
         """Validate JSON value *instance*."""
-        # As a base for our custom validator, we hard-code a validator
-        # version; JSON metaschema versions are not guaranteed to be backward
-        # compatible, so if we use jsonschema.validators.validator_for(
-        # schema), our schema may become invalid when the default validator
-        # changes. The metaschema version can also be pinned in the schema
-        # itself with an entry like this:
-        # '$schema': 'http://json-schema.org/draft-07/schema'
-        # However, this makes it more work to keep unit tests up to date, and
-        # it's fiddly to adapt the recursive to_dict code to make sure that
-        # the metaschema key *only* appears in the outermost dictionary.
-        base_validator = jsonschema.validators.Draft7Validator
-
-        # By default, jsonschema only recognizes lists as arrays. Here we derive
-        # and use a custom validator which recognizes both lists and tuples as
-        # arrays.
-        new_type_checker = \
-            base_validator.TYPE_CHECKER.redefine(
-                'array',
-                lambda checker, inst: isinstance(inst, (list, tuple)))
-        custom_validator = \
-            jsonschema.validators.extend(base_validator,
-                                         type_checker=new_type_checker)
-
-        # jsconschema needs extra packages installed to validate some formats;
-        # if they are missing, the format check will be skipped silently. For
-        # date-time format, strict_rfc3339 or rfc3339-validator is required.
-        jsonschema.validate(instance=instance, schema=self.to_dict(),
-                            cls=custom_validator,
-                            format_checker=jsonschema.draft7_format_checker)
+        validator = _get_validator(self.to_dict())
+        error = jsonschema.exceptions.best_match(
+            validator.iter_errors(instance)
+        )
+        if error is not None:
+            raise error
 
     def to_instance(self, value: Any) -> Any:
         """Convert Python object *value* into JSON value and return the validated result."""
@@ -154,6 +168,43 @@ class JsonSchema(ABC):
         """Turn validated JSON value *instance* into a Python object."""
 
 
+def _get_validator(schema: Dict[str, Any]) -> Any:
+    key = _get_schema_key(schema)
+    validator = _VALIDATOR_CACHE.get(key) if key is not None else None
+    if validator is None:
+        _VALIDATOR_CLASS.check_schema(schema)
+        # jsconschema needs extra packages installed to validate some
+        # formats; if they are missing, the format check will be skipped
+        # silently. For date-time format, strict_rfc3339 or
+        # rfc3339-validator is required.
+        validator = _VALIDATOR_CLASS(
+            schema,
+            format_checker=jsonschema.draft7_format_checker
+        )
+        if key is not None:
+            if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_MAX_SIZE:
+                _VALIDATOR_CACHE.clear()
+            _VALIDATOR_CACHE[key] = validator
+    return validator
+
+
+def _get_schema_key(schema: Dict[str, Any]) -> Optional[Union[str, bytes]]:
+    """
+    Get a deterministic key for *schema*, or None, if *schema*
+    is not JSON-serializable, e.g., because of some default value.
+    """
+    if orjson is not None:
+        try:
+            # orjson is several times faster than json here
+            return orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    try:
+        return json.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+
 class JsonComplexSchema(JsonSchema):
     # TODO: implement JsonComplexTypeSchema more completely
     # For full support one_of, any_of, all_of should also be handled in from_instance and to_instance.
@@ -21,14 +21,13 @@
 
 import abc
 import importlib
+import importlib.metadata
 import pkgutil
 import sys
 import time
 import traceback
 import warnings
-from typing import Callable, Dict, Optional, Any
-
-from pkg_resources import iter_entry_points
+from typing import Callable, Dict, Optional, Any, List
 
 from xcube.constants import PLUGIN_ENTRY_POINT_GROUP_NAME
 from xcube.constants import PLUGIN_INIT_TIME__WARN_LIMIT
@@ -78,7 +77,7 @@ def discover_plugin_modules(module_prefixes=None):
 
 def load_plugins(entry_points=None, ext_registry=None):
     if entry_points is None:
-        entry_points = list(iter_entry_points(group=PLUGIN_ENTRY_POINT_GROUP_NAME, name=None)) \
+        entry_points = _get_entry_points(PLUGIN_ENTRY_POINT_GROUP_NAME) \
                        + discover_plugin_modules()
 
     if ext_registry is None:
@@ -135,6 +134,17 @@ def load_plugins(entry_points=None, ext_registry=None):
     return plugins
 
 
+def _get_entry_points(group: str) -> List[importlib.metadata.EntryPoint]:
+    # We use importlib.metadata rather than pkg_resources,
+    # because importing the latter scans all installed
+    # distributions, which is slow.
+    entry_points = importlib.metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        # Python >= 3.10
+        return list(entry_points.select(group=group))
+    return list(entry_points.get(group, []))
+
+
 def _handle_error(entry_point, e):
     # We use warning and not raise to allow loading xcube despite a broken plugin. Raise would stop xcube.
     warnings.warn(f'Unexpected exception while loading xcube plugin {entry_point.name!r}: {e}')